@@ -0,0 +1,10 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from pants.backend.tools.workunit_profiler import rules as workunit_profiler_rules
+
+
+def rules():
+    return workunit_profiler_rules.rules()
@@ -7,7 +7,7 @@ import logging
 import os
 
 from pants.core.util_rules.asdf import AsdfPathString
-from pants.option.option_types import BoolOption, StrListOption, StrOption
+from pants.option.option_types import BoolOption, IntOption, StrListOption, StrOption
 from pants.option.subsystem import Subsystem
 from pants.util.memo import memoized_property
 from pants.util.ordered_set import OrderedSet
@@ -259,6 +259,21 @@ class GolangSubsystem(Subsystem):
         ),
     )
 
+    first_party_analysis_batch_size = IntOption(
+        default=32,
+        help=softwrap(
+            """
+            The target number of first-party Go packages to analyze in a single process.
+
+            Analyzing packages in batches avoids starting a process (and preparing its sandbox) for
+            each package. The packages of each `go_mod` are partitioned into batches stably, so
+            that editing a package only re-analyzes the packages in its batch. Set to 1 to analyze
+            each package in its own process.
+            """
+        ),
+        advanced=True,
+    )
+
     asdf_tool_name = StrOption(
         default="go-sdk",
         help=softwrap(
@@ -5,7 +5,6 @@ from __future__ import annotations
 import dataclasses
 import hashlib
 import os.path
-from collections import deque
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import PurePath
@@ -535,37 +534,51 @@ async def compute_compile_action_id(
     return GoCompileActionIdResult(h.hexdigest())
 
 
-# Gather transitive prebuilt object files for Cgo. Traverse the provided dependencies and lifts `.syso`
-# object files into a single `Digest`.
-async def _gather_transitive_prebuilt_object_files(
-    build_request: BuildGoPackageRequest,
-) -> tuple[Digest, frozenset[str]]:
-    prebuilt_objects: list[tuple[Digest, list[str]]] = []
-
-    queue: deque[BuildGoPackageRequest] = deque([build_request])
-    seen: set[BuildGoPackageRequest] = {build_request}
-    while queue:
-        pkg = queue.popleft()
-        unseen = [dd for dd in build_request.direct_dependencies if dd not in seen]
-        queue.extend(unseen)
-        seen.update(unseen)
-        if pkg.prebuilt_object_files:
-            prebuilt_objects.append(
-                (
-                    pkg.digest,
-                    [
-                        os.path.join(pkg.dir_path, obj_file)
-                        for obj_file in pkg.prebuilt_object_files
-                    ],
-                )
-            )
+@dataclass(frozen=True)
+class TransitivePrebuiltObjectFilesRequest(EngineAwareParameter):
+    build_request: BuildGoPackageRequest
+
+    def debug_hint(self) -> str | None:
+        return self.build_request.import_path
 
-    object_digest = await merge_digests(MergeDigests([digest for digest, _ in prebuilt_objects]))
-    object_files = set()
-    for _, files in prebuilt_objects:
-        object_files.update(files)
 
-    return object_digest, frozenset(object_files)
+@dataclass(frozen=True)
+class TransitivePrebuiltObjectFiles:
+    """The prebuilt object files (".syso" files) of a package and all of its transitive dependencies,
+    which Cgo needs for linking."""
+
+    digest: Digest
+    files: frozenset[str]
+
+
+# Gather transitive prebuilt object files for Cgo. The result for a package is composed from the
+# (memoized) results for its direct dependencies, so that each package of a dependency graph is only
+# visited once, no matter how many packages depend on it.
+@rule
+async def gather_transitive_prebuilt_object_files(
+    request: TransitivePrebuiltObjectFilesRequest,
+) -> TransitivePrebuiltObjectFiles:
+    build_request = request.build_request
+    deps = await concurrently(
+        gather_transitive_prebuilt_object_files(TransitivePrebuiltObjectFilesRequest(dep))
+        for dep in build_request.direct_dependencies
+    )
+
+    digests = [dep.digest for dep in deps if dep.files]
+    files = set().union(*(dep.files for dep in deps))
+    if build_request.prebuilt_object_files:
+        digests.append(build_request.digest)
+        files.update(
+            os.path.join(build_request.dir_path, obj_file)
+            for obj_file in build_request.prebuilt_object_files
+        )
+
+    if not files:
+        return TransitivePrebuiltObjectFiles(EMPTY_DIGEST, frozenset())
+    if len(digests) == 1:
+        return TransitivePrebuiltObjectFiles(digests[0], frozenset(files))
+    digest = await merge_digests(MergeDigests(digests))
+    return TransitivePrebuiltObjectFiles(digest, frozenset(files))
 
 
 # NB: We must have a description for the streaming of this rule to work properly
@@ -586,10 +599,15 @@ async def build_go_package(
                 maybe_dep, import_path=request.import_path, dependency_failed=True
             )
         dep = maybe_dep.output
-        for dep_import_path, pkg_archive_path in dep.import_paths_to_pkg_a_files.items():
-            if dep_import_path not in import_paths_to_pkg_a_files:
-                import_paths_to_pkg_a_files[dep_import_path] = pkg_archive_path
-                dep_digests.append(dep.digest)
+        # Each dependency's digest already contains the archives of its own transitive
+        # dependencies, so it only needs to be merged once, and only if it adds any archives.
+        if not dep.import_paths_to_pkg_a_files.keys() <= import_paths_to_pkg_a_files.keys():
+            import_paths_to_pkg_a_files.update(
+                (dep_import_path, pkg_archive_path)
+                for dep_import_path, pkg_archive_path in dep.import_paths_to_pkg_a_files.items()
+                if dep_import_path not in import_paths_to_pkg_a_files
+            )
+            dep_digests.append(dep.digest)
 
     merged_deps_digest, import_config, embedcfg, action_id_result = await concurrently(
         merge_digests(MergeDigests(dep_digests)),
@@ -684,7 +702,9 @@ async def build_go_package(
         # Gather all prebuilt object files transitively and pass them to the Cgo rule for linking into the
         # Cgo object output. This is necessary to avoid linking errors.
         # See https://github.com/golang/go/blob/6ad27161f8d1b9c5e03fb3415977e1d3c3b11323/src/cmd/go/internal/work/exec.go#L3291-L3311.
-        transitive_prebuilt_object_files = await _gather_transitive_prebuilt_object_files(request)
+        transitive_prebuilt_object_files = await gather_transitive_prebuilt_object_files(
+            TransitivePrebuiltObjectFilesRequest(request)
+        )
 
         assert request.cgo_flags is not None
         cgo_compile_result = await cgo_compile_request(
@@ -702,7 +722,10 @@ async def build_go_package(
                 objc_files=request.objc_files,
                 fortran_files=request.fortran_files,
                 is_stdlib=request.is_stdlib,
-                transitive_prebuilt_object_files=transitive_prebuilt_object_files,
+                transitive_prebuilt_object_files=(
+                    transitive_prebuilt_object_files.digest,
+                    transitive_prebuilt_object_files.files,
+                ),
             ),
             **implicitly(),
         )
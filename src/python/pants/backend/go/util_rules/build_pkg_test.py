@@ -25,6 +25,8 @@ from pants.backend.go.util_rules.build_pkg import (
     BuildGoPackageRequest,
     BuiltGoPackage,
     FallibleBuiltGoPackage,
+    TransitivePrebuiltObjectFiles,
+    TransitivePrebuiltObjectFilesRequest,
 )
 from pants.engine.fs import Snapshot
 from pants.engine.rules import QueryRule
@@ -47,6 +49,7 @@ def rule_runner() -> RuleRunner:
             *target_type_rules.rules(),
             QueryRule(BuiltGoPackage, [BuildGoPackageRequest]),
             QueryRule(FallibleBuiltGoPackage, [BuildGoPackageRequest]),
+            QueryRule(TransitivePrebuiltObjectFiles, [TransitivePrebuiltObjectFilesRequest]),
         ],
         target_types=[GoModTarget],
     )
@@ -161,6 +164,47 @@ def test_build_pkg(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_transitive_prebuilt_object_files(rule_runner: RuleRunner) -> None:
+    def pkg(
+        name: str,
+        *deps: BuildGoPackageRequest,
+        prebuilt_object_files: tuple[str, ...] = (),
+    ) -> BuildGoPackageRequest:
+        return BuildGoPackageRequest(
+            import_path=f"example.com/{name}",
+            pkg_name=name,
+            dir_path=name,
+            build_opts=GoBuildOptions(),
+            go_files=("f.go",),
+            digest=rule_runner.make_snapshot(
+                {
+                    f"{name}/f.go": f"package {name}\n",
+                    **{f"{name}/{obj_file}": "" for obj_file in prebuilt_object_files},
+                }
+            ).digest,
+            s_files=(),
+            direct_dependencies=deps,
+            prebuilt_object_files=prebuilt_object_files,
+            minimum_go_version=None,
+        )
+
+    # The object files of transitive dependencies are gathered, not only those of direct ones.
+    transitive = pkg("transitive", prebuilt_object_files=("t.syso",))
+    left = pkg("left", transitive)
+    right = pkg("right", transitive, prebuilt_object_files=("r.syso",))
+    main = pkg("main", left, right)
+
+    result = rule_runner.request(
+        TransitivePrebuiltObjectFiles, [TransitivePrebuiltObjectFilesRequest(main)]
+    )
+    assert result.files == {"transitive/t.syso", "right/r.syso"}
+    assert result.files <= set(rule_runner.request(Snapshot, [result.digest]).files)
+
+    assert not rule_runner.request(
+        TransitivePrebuiltObjectFiles, [TransitivePrebuiltObjectFilesRequest(pkg("other"))]
+    ).files
+
+
 def test_build_invalid_pkg(rule_runner: RuleRunner) -> None:
     invalid_dep = BuildGoPackageRequest(
         import_path="example.com/foo/dep",
@@ -6,10 +6,14 @@ from __future__ import annotations
 import json
 import logging
 import os
+from collections import defaultdict
+from collections.abc import Mapping
 from dataclasses import dataclass
+from typing import Any
 
 from pants.backend.go.go_sources import load_go_binary
 from pants.backend.go.go_sources.load_go_binary import LoadedGoBinaryRequest, setup_go_binary
+from pants.backend.go.subsystems.golang import GolangSubsystem
 from pants.backend.go.target_types import GoPackageSourcesField
 from pants.backend.go.util_rules import pkg_analyzer
 from pants.backend.go.util_rules.build_opts import GoBuildOptions
@@ -33,13 +37,16 @@ from pants.engine.intrinsics import add_prefix, create_digest, execute_process,
 from pants.engine.process import FallibleProcessResult, Process
 from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.target import (
+    AllTargets,
     Dependencies,
     DependenciesRequest,
     HydrateSourcesRequest,
     SourcesField,
     WrappedTargetRequest,
 )
+from pants.util.collections import partition_sequentially
 from pants.util.dirutil import fast_relpath
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
 logger = logging.getLogger(__name__)
@@ -148,6 +155,23 @@ class FallibleFirstPartyPkgAnalysis:
                 stderr=f"Failed to decode JSON document from analysis: {ex}",
             )
 
+        return cls.from_metadata(
+            metadata,
+            dir_path=dir_path,
+            import_path=import_path,
+            minimum_go_version=minimum_go_version,
+        )
+
+    @classmethod
+    def from_metadata(
+        cls,
+        metadata: Mapping[str, Any],
+        *,
+        dir_path: str,
+        import_path: str,
+        minimum_go_version: str,
+    ) -> FallibleFirstPartyPkgAnalysis:
+        """Create the analysis from the JSON document which the analyzer emits for a package."""
         if "Error" in metadata or "InvalidGoFiles" in metadata:
             error = metadata.get("Error", "")
             if error:
@@ -204,6 +228,39 @@ class FirstPartyPkgAnalysisRequest(EngineAwareParameter):
         return self.address.spec
 
 
+@dataclass(frozen=True)
+class FirstPartyPkgAnalysisBatchRequest(EngineAwareParameter):
+    """Analyze several first-party packages in a single process.
+
+    The batches are formed by `FirstPartyPkgAnalysisBatches`, so that each package is always
+    analyzed in the same batch, regardless of which package's analysis was requested first.
+    """
+
+    addresses: tuple[Address, ...]
+    build_opts: GoBuildOptions
+    extra_build_tags: tuple[str, ...] = ()
+
+    def debug_hint(self) -> str:
+        if len(self.addresses) == 1:
+            return self.addresses[0].spec
+        return f"{self.addresses[0].spec} and {len(self.addresses) - 1} other packages"
+
+
+@dataclass(frozen=True)
+class FallibleFirstPartyPkgAnalyses:
+    analyses: FrozenDict[Address, FallibleFirstPartyPkgAnalysis]
+
+
+@dataclass(frozen=True)
+class FirstPartyPkgAnalysisBatches:
+    """The first-party packages of each `go_mod`, partitioned into batches to analyze together."""
+
+    batch_by_address: FrozenDict[Address, tuple[Address, ...]]
+
+    def batch_for(self, address: Address) -> tuple[Address, ...]:
+        return self.batch_by_address.get(address, (address,))
+
+
 @dataclass(frozen=True)
 class FirstPartyPkgDigest:
     """The source files needed to build the package."""
@@ -251,37 +308,95 @@ async def compute_first_party_package_import_path(
     return FirstPartyPkgImportPath(import_path, dir_path_rel_to_gomod)
 
 
+@rule(desc="Partition first-party Go packages for analysis", level=LogLevel.DEBUG)
+async def partition_first_party_packages_for_analysis(
+    all_targets: AllTargets, golang: GolangSubsystem
+) -> FirstPartyPkgAnalysisBatches:
+    pkg_addresses = [tgt.address for tgt in all_targets if tgt.has_field(GoPackageSourcesField)]
+    owning_go_mods = await concurrently(
+        find_owning_go_mod(OwningGoModRequest(address), **implicitly()) for address in pkg_addresses
+    )
+
+    # Packages are only batched with packages of the same `go_mod`, since those are usually
+    # analyzed with the same build options.
+    addresses_by_go_mod: dict[Address, list[Address]] = defaultdict(list)
+    for address, owning_go_mod in zip(pkg_addresses, owning_go_mods):
+        addresses_by_go_mod[owning_go_mod.address].append(address)
+
+    batch_by_address: dict[Address, tuple[Address, ...]] = {}
+    for addresses in addresses_by_go_mod.values():
+        for batch in partition_sequentially(
+            addresses,
+            key=lambda address: address.spec,
+            size_target=golang.first_party_analysis_batch_size,
+            size_max=4 * golang.first_party_analysis_batch_size,
+        ):
+            for address in batch:
+                batch_by_address[address] = tuple(batch)
+    return FirstPartyPkgAnalysisBatches(FrozenDict(batch_by_address))
+
+
+def _decode_analyzer_output(stdout: bytes) -> list[dict[str, Any]]:
+    """Decode the JSON documents which the analyzer emits back to back, one for each package."""
+    decoder = json.JSONDecoder()
+    output = stdout.decode()
+    documents = []
+    index = 0
+    while index < len(output):
+        document, index = decoder.raw_decode(output, index)
+        documents.append(document)
+    return documents
+
+
 @rule
-async def analyze_first_party_package(
-    request: FirstPartyPkgAnalysisRequest,
+async def analyze_first_party_packages(
+    request: FirstPartyPkgAnalysisBatchRequest,
     analyzer: PackageAnalyzerSetup,
-) -> FallibleFirstPartyPkgAnalysis:
-    wrapped_target, import_path_info, owning_go_mod = await concurrently(
+) -> FallibleFirstPartyPkgAnalyses:
+    wrapped_targets = await concurrently(
         resolve_target(
-            WrappedTargetRequest(
-                request.address, description_of_origin="<first party pkg analysis>"
-            ),
+            WrappedTargetRequest(address, description_of_origin="<first party pkg analysis>"),
             **implicitly(),
-        ),
-        compute_first_party_package_import_path(FirstPartyPkgImportPathRequest(request.address)),
-        find_owning_go_mod(OwningGoModRequest(request.address), **implicitly()),
+        )
+        for address in request.addresses
     )
-    go_mod_info = await determine_go_mod_info(GoModInfoRequest(owning_go_mod.address))
-
-    pkg_sources = await hydrate_sources(
-        HydrateSourcesRequest(wrapped_target.target[GoPackageSourcesField]), **implicitly()
+    import_path_infos = await concurrently(
+        compute_first_party_package_import_path(FirstPartyPkgImportPathRequest(address))
+        for address in request.addresses
+    )
+    owning_go_mods = await concurrently(
+        find_owning_go_mod(OwningGoModRequest(address), **implicitly())
+        for address in request.addresses
+    )
+    go_mod_infos = await concurrently(
+        determine_go_mod_info(GoModInfoRequest(owning_go_mod.address))
+        for owning_go_mod in owning_go_mods
+    )
+    all_pkg_sources = await concurrently(
+        hydrate_sources(
+            HydrateSourcesRequest(wrapped_target.target[GoPackageSourcesField]), **implicitly()
+        )
+        for wrapped_target in wrapped_targets
     )
 
     extra_build_tags_env = {}
     if request.extra_build_tags:
         extra_build_tags_env = {"EXTRA_BUILD_TAGS": ",".join(request.extra_build_tags)}
 
-    input_digest = await merge_digests(MergeDigests([pkg_sources.snapshot.digest, analyzer.digest]))
+    input_digest = await merge_digests(
+        MergeDigests(
+            [*(pkg_sources.snapshot.digest for pkg_sources in all_pkg_sources), analyzer.digest]
+        )
+    )
+    if len(request.addresses) == 1:
+        description = f"Determine metadata for {request.addresses[0]}"
+    else:
+        description = f"Determine metadata for {len(request.addresses)} Go packages"
     result = await execute_process(
         Process(
-            (analyzer.path, request.address.spec_path or "."),
+            (analyzer.path, *(address.spec_path or "." for address in request.addresses)),
             input_digest=input_digest,
-            description=f"Determine metadata for {request.address}",
+            description=description,
             level=LogLevel.DEBUG,
             env={
                 "CGO_ENABLED": "1" if request.build_opts.cgo_enabled else "0",
@@ -290,13 +405,64 @@ async def analyze_first_party_package(
         ),
         **implicitly(),
     )
-    return FallibleFirstPartyPkgAnalysis.from_process_result(
-        result,
-        dir_path=request.address.spec_path,
-        import_path=import_path_info.import_path,
-        minimum_go_version=go_mod_info.minimum_go_version or "",
-        description_of_source=f"first-party Go package `{request.address}`",
+
+    all_metadata: list[dict[str, Any]] | None = None
+    error = None
+    if result.exit_code == 0 and len(request.addresses) > 1:
+        try:
+            all_metadata = _decode_analyzer_output(result.stdout)
+        except json.JSONDecodeError as ex:
+            error = f"Failed to decode JSON document from analysis: {ex}"
+        else:
+            if len(all_metadata) != len(request.addresses):
+                error = (
+                    f"Expected the analysis of {len(request.addresses)} packages, but got "
+                    f"{len(all_metadata)}."
+                )
+
+    analyses = {}
+    for i, (address, import_path_info, go_mod_info) in enumerate(
+        zip(request.addresses, import_path_infos, go_mod_infos)
+    ):
+        import_path = import_path_info.import_path
+        minimum_go_version = go_mod_info.minimum_go_version or ""
+        if error:
+            analysis = FallibleFirstPartyPkgAnalysis(
+                analysis=None, import_path=import_path, exit_code=1, stderr=error
+            )
+        elif all_metadata is not None:
+            analysis = FallibleFirstPartyPkgAnalysis.from_metadata(
+                all_metadata[i],
+                dir_path=address.spec_path,
+                import_path=import_path,
+                minimum_go_version=minimum_go_version,
+            )
+        else:
+            # A failed process, or the output for a single package.
+            analysis = FallibleFirstPartyPkgAnalysis.from_process_result(
+                result,
+                dir_path=address.spec_path,
+                import_path=import_path,
+                minimum_go_version=minimum_go_version,
+                description_of_source=f"first-party Go package `{address}`",
+            )
+        analyses[address] = analysis
+    return FallibleFirstPartyPkgAnalyses(FrozenDict(analyses))
+
+
+@rule
+async def analyze_first_party_package(
+    request: FirstPartyPkgAnalysisRequest, golang: GolangSubsystem
+) -> FallibleFirstPartyPkgAnalysis:
+    batch: tuple[Address, ...] = (request.address,)
+    if golang.first_party_analysis_batch_size > 1:
+        batches = await partition_first_party_packages_for_analysis(**implicitly())
+        batch = batches.batch_for(request.address)
+    analyses = await analyze_first_party_packages(
+        FirstPartyPkgAnalysisBatchRequest(batch, request.build_opts, request.extra_build_tags),
+        **implicitly(),
     )
+    return analyses.analyses[request.address]
 
 
 @rule
@@ -22,8 +22,10 @@ from pants.backend.go.util_rules import (
 from pants.backend.go.util_rules.build_opts import GoBuildOptions
 from pants.backend.go.util_rules.embedcfg import EmbedConfig
 from pants.backend.go.util_rules.first_party_pkg import (
+    FallibleFirstPartyPkgAnalyses,
     FallibleFirstPartyPkgAnalysis,
     FallibleFirstPartyPkgDigest,
+    FirstPartyPkgAnalysisBatchRequest,
     FirstPartyPkgAnalysisRequest,
     FirstPartyPkgDigestRequest,
     FirstPartyPkgImportPath,
@@ -49,6 +51,7 @@ def rule_runner() -> RuleRunner:
             *link.rules(),
             *assembly.rules(),
             QueryRule(FallibleFirstPartyPkgAnalysis, [FirstPartyPkgAnalysisRequest]),
+            QueryRule(FallibleFirstPartyPkgAnalyses, [FirstPartyPkgAnalysisBatchRequest]),
             QueryRule(FallibleFirstPartyPkgDigest, [FirstPartyPkgDigestRequest]),
             QueryRule(FirstPartyPkgImportPath, [FirstPartyPkgImportPathRequest]),
         ],
@@ -238,6 +241,53 @@ def test_invalid_package(rule_runner) -> None:
     assert "bad.go:1:1: expected 'package', found invalid\n" in maybe_analysis.stderr
 
 
+def test_batched_package_analysis(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": "go_mod(name='mod')",
+            "go.mod": dedent(
+                """\
+                module go.example.com/foo
+                go 1.17
+                """
+            ),
+            "a/BUILD": "go_package()",
+            "a/a.go": 'package a\nimport "fmt"\n',
+            "b/BUILD": "go_package()",
+            "b/b.go": "invalid!!!",
+            "c/BUILD": "go_package()",
+            "c/c.go": 'package c\nimport "go.example.com/foo/a"\n',
+        }
+    )
+    addresses = (Address("a"), Address("b"), Address("c"))
+    analyses = rule_runner.request(
+        FallibleFirstPartyPkgAnalyses,
+        [FirstPartyPkgAnalysisBatchRequest(addresses, build_opts=GoBuildOptions())],
+    ).analyses
+    assert set(analyses) == set(addresses)
+
+    a = analyses[Address("a")].analysis
+    assert a is not None
+    assert (a.import_path, a.name, a.imports) == ("go.example.com/foo/a", "a", ("fmt",))
+    c = analyses[Address("c")].analysis
+    assert c is not None
+    assert (c.dir_path, c.imports) == ("c", ("go.example.com/foo/a",))
+
+    # An invalid package only fails its own analysis.
+    b = analyses[Address("b")]
+    assert b.analysis is None
+    assert b.exit_code == 1
+    assert b.stderr and "b.go:1:1: expected 'package', found invalid\n" in b.stderr
+
+    # Each package is analyzed the same way whether or not it is batched.
+    rule_runner.set_options(["--golang-first-party-analysis-batch-size=1"], env_inherit={"PATH"})
+    for address in addresses:
+        assert analyses[address] == rule_runner.request(
+            FallibleFirstPartyPkgAnalysis,
+            [FirstPartyPkgAnalysisRequest(address, build_opts=GoBuildOptions())],
+        )
+
+
 @pytest.mark.xfail(reason="cgo is ignored")
 def test_cgo_not_supported(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 
 from pants.backend.javascript import nodejs_project_environment
 from pants.backend.javascript.dependency_inference.rules import rules as dependency_inference_rules
+from pants.backend.javascript.nodejs_project import NodeJSProject
 from pants.backend.javascript.nodejs_project_environment import (
     NodeJsProjectEnvironment,
     NodeJsProjectEnvironmentProcess,
@@ -15,12 +16,14 @@ from pants.backend.javascript.nodejs_project_environment import (
     get_nodejs_environment,
 )
 from pants.backend.javascript.package_json import (
+    FirstPartyNodePackageTargets,
     NodePackageNameField,
     NodePackageVersionField,
     PackageJsonSourceField,
 )
 from pants.backend.javascript.package_manager import PackageManager
 from pants.backend.javascript.subsystems import nodejs
+from pants.backend.javascript.subsystems.nodejs import NodeModulesInstallMode
 from pants.backend.javascript.target_types import JSRuntimeSourceField
 from pants.build_graph.address import Address
 from pants.core.target_types import FileSourceField, ResourceSourceField
@@ -29,13 +32,15 @@ from pants.core.util_rules.source_files import (
     SourceFilesRequest,
     determine_source_files,
 )
+from pants.engine.fs import DigestSubset, PathGlobs
 from pants.engine.internals.graph import transitive_targets
 from pants.engine.internals.native_engine import AddPrefix, Digest, MergeDigests
-from pants.engine.intrinsics import add_prefix, merge_digests
+from pants.engine.intrinsics import add_prefix, digest_subset_to_digest, merge_digests
 from pants.engine.process import fallible_to_exec_result_or_raise
 from pants.engine.rules import Rule, collect_rules, implicitly, rule
 from pants.engine.target import SourcesField, Target, TransitiveTargetsRequest
 from pants.engine.unions import UnionMembership, UnionRule
+from pants.util.dirutil import fast_relpath
 
 
 @dataclass(frozen=True)
@@ -69,6 +74,18 @@ class InstalledNodePackageWithSource(InstalledNodePackage):
     pass
 
 
+@dataclass(frozen=True)
+class InstalledNodeProjectRequest:
+    project: NodeJSProject
+
+
+@dataclass(frozen=True)
+class InstalledNodeProject:
+    """The `node_modules` of all of the workspaces of a project, installed together."""
+
+    digest: Digest
+
+
 async def _get_relevant_source_files(
     sources: Iterable[SourcesField], with_js: bool = False
 ) -> SourceFiles:
@@ -82,6 +99,45 @@ async def _get_relevant_source_files(
     )
 
 
+@rule
+async def install_node_project(
+    req: InstalledNodeProjectRequest, all_first_party: FirstPartyNodePackageTargets
+) -> InstalledNodeProject:
+    project = req.project
+    workspace_dirs = {workspace.root_dir for workspace in project.workspaces}
+    transitive_tgts = await transitive_targets(
+        TransitiveTargetsRequest(
+            tgt.address for tgt in all_first_party if tgt.residence_dir in workspace_dirs
+        ),
+        **implicitly(),
+    )
+    source_files = await _get_relevant_source_files(
+        (tgt[SourcesField] for tgt in transitive_tgts.closure if tgt.has_field(SourcesField)),
+        with_js=False,
+    )
+
+    node_modules_directories = ["node_modules"]
+    node_modules_directories.extend(
+        os.path.join(fast_relpath(workspace_dir, project.root_dir), "node_modules")
+        for workspace_dir in sorted(workspace_dirs)
+        if workspace_dir != project.root_dir
+    )
+    install_result = await fallible_to_exec_result_or_raise(
+        **implicitly(
+            NodeJsProjectEnvironmentProcess(
+                NodeJsProjectEnvironment.from_root(project),
+                project.immutable_install_args,
+                description=f"Installing node_modules for {project.default_resolve_name}.",
+                input_digest=source_files.snapshot.digest,
+                output_directories=tuple(node_modules_directories),
+            )
+        )
+    )
+    return InstalledNodeProject(
+        await add_prefix(AddPrefix(install_result.output_digest, project.root_dir))
+    )
+
+
 @rule
 async def install_node_packages_for_address(
     req: InstalledNodePackageRequest,
@@ -100,6 +156,25 @@ async def install_node_packages_for_address(
     )
     package_digest = source_files.snapshot.digest
 
+    if nodejs.install_mode == NodeModulesInstallMode.project:
+        # The `node_modules` of the package are a subset of those of the project, so they refer
+        # to the same stored trees for all of the packages of the project.
+        installed_project = await install_node_project(
+            InstalledNodeProjectRequest(project_env.project), **implicitly()
+        )
+        node_modules = await digest_subset_to_digest(
+            DigestSubset(
+                installed_project.digest,
+                PathGlobs(
+                    os.path.join(project_env.root_dir, directory, "**")
+                    for directory in project_env.node_modules_directories
+                ),
+            )
+        )
+        return InstalledNodePackage(
+            project_env, digest=await merge_digests(MergeDigests([package_digest, node_modules]))
+        )
+
     install_result = await fallible_to_exec_result_or_raise(
         **implicitly(
             NodeJsProjectEnvironmentProcess(
@@ -88,3 +88,39 @@ def test_install_node_package_with_extra_env_vars(rule_runner: RuleRunner) -> No
 
     assert "GLOBAL_VAR" in actual_env_vars
     assert actual_env_vars["GLOBAL_VAR"] == "global_value"
+
+
+def test_install_node_project(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(["--nodejs-install-mode=project"], env_inherit={"PATH"})
+
+    def package_json(name: str, **extra) -> str:
+        return json.dumps({"name": name, "version": "1.0.0", "private": True, **extra})
+
+    rule_runner.write_files(
+        {
+            "src/js/BUILD": "package_json()",
+            "src/js/package.json": package_json(
+                "root",
+                packageManager="yarn@1.22.22",
+                workspaces=["a", "b"],
+                scripts={"postinstall": "echo installed > node_modules/installed.txt"},
+            ),
+            "src/js/a/BUILD": "package_json()",
+            "src/js/a/package.json": package_json("a"),
+            "src/js/b/BUILD": "package_json()",
+            "src/js/b/package.json": package_json("b"),
+        }
+    )
+
+    def installed_files(address: Address) -> set[str]:
+        installed_package = rule_runner.request(
+            InstalledNodePackage, [InstalledNodePackageRequest(address)]
+        )
+        return {f.path for f in rule_runner.request(DigestContents, [installed_package.digest])}
+
+    a_files = installed_files(Address("src/js/a"))
+    b_files = installed_files(Address("src/js/b"))
+    # Each package gets the `node_modules` of the single install of the project.
+    assert "src/js/node_modules/installed.txt" in a_files & b_files
+    assert "src/js/a/package.json" in a_files
+    assert "src/js/a/package.json" not in b_files
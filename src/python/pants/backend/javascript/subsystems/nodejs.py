@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import enum
 import itertools
 import logging
 import os.path
@@ -53,7 +54,13 @@ from pants.engine.platform import Platform
 from pants.engine.process import Process, fallible_to_exec_result_or_raise
 from pants.engine.rules import Rule, collect_rules, implicitly, rule
 from pants.engine.unions import UnionRule
-from pants.option.option_types import DictOption, ShellStrListOption, StrListOption, StrOption
+from pants.option.option_types import (
+    DictOption,
+    EnumOption,
+    ShellStrListOption,
+    StrListOption,
+    StrOption,
+)
 from pants.option.subsystem import Subsystem
 from pants.util.docutil import bin_name
 from pants.util.frozendict import FrozenDict
@@ -64,6 +71,11 @@ from pants.util.strutil import help_text, softwrap
 _logger = logging.getLogger(__name__)
 
 
+class NodeModulesInstallMode(enum.StrEnum):
+    per_package = enum.auto()
+    project = enum.auto()
+
+
 class NodeJS(Subsystem, TemplatedExternalToolOptionsMixin):
     options_scope = "nodejs"
     help = "The Node.js Javascript runtime (including Corepack)."
@@ -170,6 +182,29 @@ class NodeJS(Subsystem, TemplatedExternalToolOptionsMixin):
         advanced=True,
     )
 
+    install_mode = EnumOption(
+        default=NodeModulesInstallMode.per_package,
+        help=softwrap(
+            """
+            How the `node_modules` of the packages of a project (a set of workspaces which share
+            a lockfile) are installed.
+
+            - `per_package` (default): Run the package manager's install for each package, and
+              capture the `node_modules` of each installation.
+            - `project`: Run the package manager's install once for the whole project, and derive
+              the `node_modules` of each package from it. The installed dependencies are shared
+              by all packages, rather than captured once per package, which reduces install time
+              and the growth of the local store for projects with many workspaces. The project is
+              reinstalled when any of its packages change, and the `extra_env_vars` of its
+              `package_json` targets are not set for the install.
+
+            In both modes, the package manager's download cache (and for `pnpm`, its package
+            store) is kept in a named cache which is shared across installs.
+            """
+        ),
+        advanced=True,
+    )
+
     @property
     def default_package_manager(self) -> str | None:
         if self.package_manager in self.package_managers:
@@ -17,6 +17,7 @@ from pants.engine.target import (
     AlwaysTraverseDeps,
     Dependencies,
     DependenciesRequest,
+    Target,
 )
 from pants.option.option_types import BoolOption, EnumOption
 from pants.util.frozendict import FrozenDict
@@ -40,8 +41,24 @@ class DependentsOutputFormat(Enum):
     json = "json"
 
 
-@rule(desc="Map all targets to their dependents", level=LogLevel.DEBUG)
-async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> AddressToDependents:
+@dataclass(frozen=True)
+class _DirectoryDependentsRequest:
+    """The targets declared in a single directory."""
+
+    targets: tuple[Target, ...]
+
+
+@dataclass(frozen=True)
+class _DirectoryDependents:
+    """The dependents of each address, among the targets declared in a single directory."""
+
+    mapping: FrozenDict[Address, tuple[Address, ...]]
+
+
+@rule(level=LogLevel.DEBUG)
+async def map_directory_to_dependents(
+    request: _DirectoryDependentsRequest,
+) -> _DirectoryDependents:
     dependencies_per_target = await concurrently(
         resolve_dependencies(
             DependenciesRequest(
@@ -49,13 +66,35 @@ async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> Addr
             ),
             **implicitly(),
         )
-        for tgt in all_targets
+        for tgt in request.targets
     )
 
-    address_to_dependents = defaultdict(set)
-    for tgt, dependencies in zip(all_targets, dependencies_per_target):
+    address_to_dependents: defaultdict[Address, dict[Address, None]] = defaultdict(dict)
+    for tgt, dependencies in zip(request.targets, dependencies_per_target):
         for dependency in dependencies:
-            address_to_dependents[dependency].add(tgt.address)
+            address_to_dependents[dependency][tgt.address] = None
+    return _DirectoryDependents(
+        FrozenDict({addr: tuple(dependents) for addr, dependents in address_to_dependents.items()})
+    )
+
+
+@rule(desc="Map all targets to their dependents", level=LogLevel.DEBUG)
+async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> AddressToDependents:
+    # The dependents of the targets in each directory are computed separately, so that when
+    # targets (or their sources) change, only the directories containing them are recomputed,
+    # and the rest are memoized.
+    targets_by_directory: defaultdict[str, list[Target]] = defaultdict(list)
+    for tgt in all_targets:
+        targets_by_directory[tgt.address.spec_path].append(tgt)
+    dependents_per_directory = await concurrently(
+        map_directory_to_dependents(_DirectoryDependentsRequest(tuple(targets)))
+        for _, targets in sorted(targets_by_directory.items())
+    )
+
+    address_to_dependents: defaultdict[Address, list[Address]] = defaultdict(list)
+    for directory_dependents in dependents_per_directory:
+        for addr, dependents in directory_dependents.mapping.items():
+            address_to_dependents[addr].extend(dependents)
     return AddressToDependents(
         FrozenDict(
             {
@@ -88,22 +127,27 @@ class Dependents(DeduplicatedCollection[Address]):
 async def find_dependents(
     request: DependentsRequest, address_to_dependents: AddressToDependents
 ) -> Dependents:
-    check = set(request.addresses)
-    known_dependents: set[Address] = set()
-    while True:
-        dependents = set(known_dependents)
-        for target in check:
-            target_dependents = address_to_dependents.mapping.get(target, FrozenOrderedSet())
-            dependents.update(target_dependents)
-        check = dependents - known_dependents
-        if not check or not request.transitive:
-            result = (
-                dependents | set(request.addresses)
-                if request.include_roots
-                else dependents - set(request.addresses)
-            )
-            return Dependents(result)
-        known_dependents = dependents
+    # A breadth-first search, which only visits the dependents of newly found dependents in each
+    # round.
+    dependents: set[Address] = set()
+    frontier: Iterable[Address] = request.addresses
+    while frontier:
+        new_dependents = []
+        for address in frontier:
+            for dependent in address_to_dependents.mapping.get(address, ()):
+                if dependent not in dependents:
+                    dependents.add(dependent)
+                    new_dependents.append(dependent)
+        if not request.transitive:
+            break
+        frontier = new_dependents
+
+    result = (
+        dependents | set(request.addresses)
+        if request.include_roots
+        else dependents - set(request.addresses)
+    )
+    return Dependents(result)
 
 
 class DependentsSubsystem(LineOriented, GoalSubsystem):
@@ -97,6 +97,31 @@ def test_transitive(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_transitive_after_edit(rule_runner: RuleRunner) -> None:
+    assert_dependents(
+        rule_runner,
+        targets=["base"],
+        transitive=True,
+        expected=["intermediate:intermediate", "leaf:leaf"],
+    )
+    # Only the edited directory's dependents change.
+    rule_runner.write_files(
+        {"leaf/BUILD": "tgt(dependencies=['base'])", "other/BUILD": "tgt(dependencies=['leaf'])"}
+    )
+    assert_dependents(
+        rule_runner,
+        targets=["intermediate"],
+        transitive=True,
+        expected=[],
+    )
+    assert_dependents(
+        rule_runner,
+        targets=["base"],
+        transitive=True,
+        expected=["intermediate:intermediate", "leaf:leaf", "other:other"],
+    )
+
+
 def test_multiple_specified_targets(rule_runner: RuleRunner) -> None:
     # This tests that --output-format=text will deduplicate which dependent belongs to which
     # specified target.
@@ -3,10 +3,12 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 from collections import deque
-from collections.abc import Iterable
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
+from textwrap import indent
 
 from pants.base.specs import Specs
 from pants.base.specs_parser import SpecsParser
@@ -24,7 +26,10 @@ from pants.engine.target import (
     Targets,
     TransitiveTargetsRequest,
 )
-from pants.option.option_types import StrOption
+from pants.option.errors import OptionsError
+from pants.option.option_types import BoolOption, IntOption, StrOption
+from pants.util.frozendict import FrozenDict
+from pants.util.strutil import softwrap
 
 
 class PathsSubsystem(Outputting, GoalSubsystem):
@@ -44,75 +49,177 @@ class PathsSubsystem(Outputting, GoalSubsystem):
         help="The path end address",
     )
 
+    _max_paths = IntOption(
+        default=None,
+        help=softwrap(
+            """
+            The maximum number of paths to list. Paths are listed as they are found, shortest
+            first for each pair of `--from` and `--to` targets, and the search stops once this
+            many have been found.
+            """
+        ),
+    )
+
+    shortest_only = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            Only list the shortest paths between each pair of `--from` and `--to` targets.
+
+            Unlike when listing all paths, the memory used to search for the shortest paths only
+            grows with the size of the dependency graph, rather than with the number of paths.
+            """
+        ),
+    )
+
+    @property
+    def max_paths(self) -> int | None:
+        max_paths = self._max_paths
+        if max_paths is not None and max_paths < 1:
+            raise OptionsError(
+                f"`[{self.options_scope}].max_paths` must be at least 1, but was {max_paths}."
+            )
+        return max_paths
+
 
 class PathsGoal(Goal):
     subsystem_cls = PathsSubsystem
     environment_behavior = Goal.EnvironmentBehavior.LOCAL_ONLY
 
 
+@dataclass(frozen=True)
+class _PathNode:
+    """The last address of a path, with a pointer to the node for the rest of the path.
+
+    Paths which share a prefix share the nodes for it, so that queued paths do not need to be
+    copied.
+    """
+
+    address: Address
+    length: int
+    parent: _PathNode | None
+
+    def to_path(self) -> list[Address]:
+        path = []
+        node: _PathNode | None = self
+        while node is not None:
+            path.append(node.address)
+            node = node.parent
+        path.reverse()
+        return path
+
+
 def find_paths_breadth_first(
-    adjacency_lists: dict[Address, Targets], from_target: Address, to_target: Address
-) -> Iterable[list[Address]]:
+    adjacency_lists: Mapping[Address, Targets],
+    from_target: Address,
+    to_target: Address,
+    *,
+    shortest_only: bool = False,
+) -> Iterator[list[Address]]:
     """Yields the paths between from_target to to_target if they exist.
 
     The paths are returned ordered by length, shortest first. If there are cycles, it checks visited
-    edges to prevent recrossing them.
+    edges to prevent recrossing them. If `shortest_only` is set, only the paths with the shortest
+    length are returned.
+
+    NB: The queue of paths to walk may grow with the number of paths (which may be exponential in
+    the size of the graph, e.g. for a chain of "diamonds"), unless `shortest_only` is set.
     """
 
     if from_target == to_target:
         yield [from_target]
         return
 
+    if shortest_only:
+        yield from _find_shortest_paths(adjacency_lists, from_target, to_target)
+        return
+
     visited_edges = set()
-    to_walk_paths = deque([[from_target]])
+    to_walk_paths = deque([_PathNode(from_target, 1, None)])
 
     while len(to_walk_paths) > 0:
         cur_path = to_walk_paths.popleft()
-        target = cur_path[-1]
+        target = cur_path.address
 
-        if len(cur_path) > 1:
-            prev_target: Address | None = cur_path[-2]
-        else:
-            prev_target = None
+        prev_target = cur_path.parent.address if cur_path.parent else None
         current_edge = (prev_target, target)
 
         if current_edge not in visited_edges:
             for dep in adjacency_lists.get(target, []):
-                dep_path = cur_path + [dep.address]
+                dep_path = _PathNode(dep.address, cur_path.length + 1, cur_path)
                 if dep.address == to_target:
-                    yield dep_path
+                    yield dep_path.to_path()
                 else:
                     to_walk_paths.append(dep_path)
             visited_edges.add(current_edge)
 
 
-@dataclass
-class SpecsPaths:
-    paths: list[list[str]]
+def _find_shortest_paths(
+    adjacency_lists: Mapping[Address, Targets], from_target: Address, to_target: Address
+) -> Iterator[list[Address]]:
+    """Yields all of the shortest paths between from_target and to_target.
 
+    Each address is only queued once, at its distance from from_target, so that the memory used
+    does not grow with the number of paths. The paths are then enumerated depth first, only
+    following the edges which lie on a shortest path, which yields them in the order in which a
+    breadth first search would find them.
+    """
+    distances = {from_target: 0}
+    levels = [[from_target]]
+    while to_target not in distances and levels[-1]:
+        next_level = []
+        for address in levels[-1]:
+            for dep in adjacency_lists.get(address, []):
+                if dep.address not in distances:
+                    distances[dep.address] = len(levels)
+                    next_level.append(dep.address)
+        levels.append(next_level)
+    if to_target not in distances:
+        return
 
-@dataclass
-class SpecsPathsCollection:
-    spec_paths: list[SpecsPaths]
+    def shortest_path_deps(address: Address) -> Iterator[Address]:
+        distance = distances[address] + 1
+        for dep in adjacency_lists.get(address, []):
+            if distances.get(dep.address) == distance and dep.address in on_shortest_path:
+                yield dep.address
+
+    # The addresses from which to_target is reachable along a shortest path, found level by level
+    # backwards from to_target.
+    on_shortest_path = {to_target}
+    for level in reversed(levels[:-1]):
+        on_shortest_path.update(address for address in level if any(shortest_path_deps(address)))
+
+    path = [from_target]
+    to_walk = [shortest_path_deps(from_target)]
+    while to_walk:
+        dep = next(to_walk[-1], None)
+        if dep is None:
+            to_walk.pop()
+            path.pop()
+        elif dep == to_target:
+            yield [*path, dep]
+        else:
+            path.append(dep)
+            to_walk.append(shortest_path_deps(dep))
 
 
 @dataclass(frozen=True)
-class RootDestinationPair:
+class AdjacencyListsRequest:
     root: Target
-    destination: Target
 
 
 @dataclass(frozen=True)
-class RootDestinationsPair:
-    root: Target
-    destinations: Targets
+class AdjacencyLists:
+    """The dependencies of each target in the transitive closure of a root target."""
 
+    mapping: FrozenDict[Address, Targets]
 
-@rule(desc="Get paths between root and destination.")
-async def get_paths_between_root_and_destination(pair: RootDestinationPair) -> SpecsPaths:
+
+@rule(desc="Get dependencies in the transitive closure of root.")
+async def get_adjacency_lists(request: AdjacencyListsRequest) -> AdjacencyLists:
     transitive_targets = await transitive_targets_get(
         TransitiveTargetsRequest(
-            [pair.root.address], should_traverse_deps_predicate=AlwaysTraverseDeps()
+            [request.root.address], should_traverse_deps_predicate=AlwaysTraverseDeps()
         ),
         **implicitly(),
     )
@@ -129,29 +236,9 @@ async def get_paths_between_root_and_destination(pair: RootDestinationPair) -> S
     )
 
     transitive_targets_closure_addresses = (t.address for t in transitive_targets.closure)
-    adjacency_lists = dict(zip(transitive_targets_closure_addresses, adjacent_targets_per_target))
-
-    spec_paths = []
-    for path in find_paths_breadth_first(
-        adjacency_lists, pair.root.address, pair.destination.address
-    ):
-        spec_path = [address.spec for address in path]
-        spec_paths.append(spec_path)
-
-    return SpecsPaths(paths=spec_paths)
-
-
-@rule(desc="Get paths between root and multiple destinations.")
-async def get_paths_between_root_and_destinations(
-    pair: RootDestinationsPair,
-) -> SpecsPathsCollection:
-    spec_paths = await concurrently(
-        get_paths_between_root_and_destination(
-            RootDestinationPair(destination=destination, root=pair.root)
-        )
-        for destination in pair.destinations
+    return AdjacencyLists(
+        FrozenDict(zip(transitive_targets_closure_addresses, adjacent_targets_per_target))
     )
-    return SpecsPathsCollection(spec_paths=list(spec_paths))
 
 
 @goal_rule
@@ -190,20 +277,31 @@ async def paths(console: Console, paths_subsystem: PathsSubsystem) -> PathsGoal:
         ),
     )
 
-    all_spec_paths = []
-    spec_paths = await concurrently(
-        get_paths_between_root_and_destinations(
-            RootDestinationsPair(root=root, destinations=to_tgts)
-        )
-        for root in from_tgts
+    adjacency_lists_per_root = await concurrently(
+        get_adjacency_lists(AdjacencyListsRequest(root)) for root in from_tgts
     )
 
-    for spec_path in spec_paths:
-        for path in (p.paths for p in spec_path.spec_paths):
-            all_spec_paths.extend(path)
+    def find_all_paths() -> Iterator[list[Address]]:
+        for root, adjacency_lists in zip(from_tgts, adjacency_lists_per_root):
+            for destination in to_tgts:
+                yield from find_paths_breadth_first(
+                    adjacency_lists.mapping,
+                    root.address,
+                    destination.address,
+                    shortest_only=paths_subsystem.shortest_only,
+                )
 
+    # Write each path as soon as it is found, rather than collecting all of them first. The output
+    # is identical to `json.dumps(all_paths, indent=2)`.
     with paths_subsystem.output(console) as write_stdout:
-        write_stdout(json.dumps(all_spec_paths, indent=2) + "\n")
+        write_stdout("[")
+        path_count = 0
+        for path in itertools.islice(find_all_paths(), paths_subsystem.max_paths):
+            separator = ",\n" if path_count else "\n"
+            spec_path = [address.spec for address in path]
+            write_stdout(separator + indent(json.dumps(spec_path, indent=2), "  "))
+            path_count += 1
+        write_stdout("\n]\n" if path_count else "]\n")
 
     return PathsGoal(exit_code=0)
 
@@ -87,12 +87,14 @@ def assert_paths(
     path_from: str,
     path_to: str,
     expected: list[list[str]] | None = None,
+    extra_args: list[str] | None = None,
 ) -> None:
     args = []
     if path_from:
         args += [f"--paths-from={path_from}"]
     if path_to:
         args += [f"--paths-to={path_to}"]
+    args += extra_args or []
 
     result = rule_runner.run_goal_rule(PathsGoal, args=[*args])
 
@@ -158,6 +160,65 @@ def test_multiple_paths(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_max_paths(rule_runner: RuleRunner) -> None:
+    result = rule_runner.run_goal_rule(
+        PathsGoal, args=["--paths-from=leaf::", "--paths-to=base::", "--paths-max-paths=3"]
+    )
+    assert len(json.loads(result.stdout)) == 3
+
+
+def test_invalid_max_paths(rule_runner: RuleRunner) -> None:
+    with pytest.raises(ExecutionError, match="max_paths` must be at least 1"):
+        rule_runner.run_goal_rule(
+            PathsGoal, args=["--paths-from=leaf::", "--paths-to=base::", "--paths-max-paths=0"]
+        )
+
+
+def test_shortest_only(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files({"leaf2/BUILD": "tgt(dependencies=['intermediate', 'base'])"})
+    assert_paths(
+        rule_runner,
+        path_from="leaf2:leaf2",
+        path_to="base:base",
+        expected=[
+            ["leaf2:leaf2", "base:base"],
+            ["leaf2:leaf2", "intermediate:intermediate", "base:base"],
+        ],
+    )
+    assert_paths(
+        rule_runner,
+        path_from="leaf2:leaf2",
+        path_to="base:base",
+        expected=[["leaf2:leaf2", "base:base"]],
+        extra_args=["--paths-shortest-only"],
+    )
+
+
+def test_shortest_only_diamonds(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "top/BUILD": "tgt(dependencies=['left', 'right'])",
+            "left/BUILD": "tgt(dependencies=['middle'])",
+            "right/BUILD": "tgt(dependencies=['middle'])",
+            "middle/BUILD": "tgt(dependencies=['left2', 'right2'])",
+            "left2/BUILD": "tgt(dependencies=['bottom'])",
+            "right2/BUILD": "tgt(dependencies=['bottom'])",
+            "bottom/BUILD": "tgt()",
+        }
+    )
+    assert_paths(
+        rule_runner,
+        path_from="top:top",
+        path_to="bottom:bottom",
+        expected=[
+            ["top:top", side, "middle:middle", side2, "bottom:bottom"]
+            for side in ("left:left", "right:right")
+            for side2 in ("left2:left2", "right2:right2")
+        ],
+        extra_args=["--paths-shortest-only"],
+    )
+
+
 def test_paths_from_multiple_to_multiple(rule_runner: RuleRunner) -> None:
     assert_paths(
         rule_runner,
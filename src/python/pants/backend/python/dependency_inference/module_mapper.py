@@ -11,7 +11,7 @@ import os
 from collections import defaultdict
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
-from functools import total_ordering
+from functools import cached_property, total_ordering
 from pathlib import PurePath
 from typing import DefaultDict
 
@@ -79,6 +79,51 @@ def module_from_stripped_path(path: PurePath) -> str:
     return module_name_with_slashes.as_posix().replace("/", ".")
 
 
+# For each module, the providers of every resolve containing that module, as pairs of
+# (position of the resolve in the mapping, providers).
+_AllResolvesIndex = dict[str, tuple[tuple[int, tuple[ModuleProvider, ...]], ...]]
+
+
+def _index_all_resolves(
+    resolves_to_modules_to_providers: Mapping[
+        ResolveName, Mapping[str, tuple[ModuleProvider, ...]]
+    ],
+) -> _AllResolvesIndex:
+    """Merge the per-resolve mappings into a single index keyed by module name.
+
+    This allows looking up a module across all resolves with one dict lookup per module (or
+    ancestor module), rather than with one lookup per resolve.
+    """
+    index: DefaultDict[str, list[tuple[int, tuple[ModuleProvider, ...]]]] = defaultdict(list)
+    for i, modules_to_providers in enumerate(resolves_to_modules_to_providers.values()):
+        for module, providers in modules_to_providers.items():
+            if providers:
+                index[module].append((i, providers))
+    return {module: tuple(entries) for module, entries in index.items()}
+
+
+def _providers_for_all_resolves(
+    index: _AllResolvesIndex, module: str, *, max_ancestry: int | None
+) -> tuple[PossibleModuleProvider, ...]:
+    """Find the providers of the module in every resolve of the index.
+
+    This is equivalent to looking the module up in each resolve separately: each resolve
+    contributes the providers of the closest module (or ancestor module, up to `max_ancestry`
+    levels up) that it contains, and results are ordered by resolve.
+    """
+    found: dict[int, tuple[PossibleModuleProvider, ...]] = {}
+    ancestry = 0
+    while True:
+        for resolve_idx, providers in index.get(module, ()):
+            if resolve_idx not in found:
+                found[resolve_idx] = tuple(PossibleModuleProvider(p, ancestry) for p in providers)
+        if "." not in module or (max_ancestry is not None and ancestry >= max_ancestry):
+            break
+        module = module.rsplit(".", maxsplit=1)[0]
+        ancestry += 1
+    return tuple(itertools.chain.from_iterable(found[i] for i in sorted(found)))
+
+
 @dataclass(frozen=True)
 class AllPythonTargets:
     first_party: tuple[Target, ...]
@@ -197,12 +242,18 @@ class FirstPartyPythonModuleMapping:
         """
         if resolve:
             return self._providers_for_resolve(module, resolve)
-        return tuple(
-            itertools.chain.from_iterable(
-                self._providers_for_resolve(module, resolve)
-                for resolve in list(self.resolves_to_modules_to_providers.keys())
-            )
-        )
+        return _providers_for_all_resolves(self._all_resolves_index, module, max_ancestry=1)
+
+    def providers_for_modules(
+        self, modules: Iterable[str], resolve: str | None
+    ) -> dict[str, tuple[PossibleModuleProvider, ...]]:
+        """Find all providers for each of the modules, with the same semantics as
+        `providers_for_module`."""
+        return {module: self.providers_for_module(module, resolve) for module in modules}
+
+    @cached_property
+    def _all_resolves_index(self) -> _AllResolvesIndex:
+        return _index_all_resolves(self.resolves_to_modules_to_providers)
 
 
 @rule(level=LogLevel.DEBUG)
@@ -314,12 +365,18 @@ class ThirdPartyPythonModuleMapping:
         """
         if resolve:
             return self._providers_for_resolve(module, resolve)
-        return tuple(
-            itertools.chain.from_iterable(
-                self._providers_for_resolve(module, resolve)
-                for resolve in list(self.resolves_to_modules_to_providers.keys())
-            )
-        )
+        return _providers_for_all_resolves(self._all_resolves_index, module, max_ancestry=None)
+
+    def providers_for_modules(
+        self, modules: Iterable[str], resolve: str | None
+    ) -> dict[str, tuple[PossibleModuleProvider, ...]]:
+        """Find all providers for each of the modules, with the same semantics as
+        `providers_for_module`."""
+        return {module: self.providers_for_module(module, resolve) for module in modules}
+
+    @cached_property
+    def _all_resolves_index(self) -> _AllResolvesIndex:
+        return _index_all_resolves(self.resolves_to_modules_to_providers)
 
 
 @functools.cache
@@ -455,17 +512,27 @@ class PythonModuleOwnersRequest:
     locality: str | None = None
 
 
-@rule
-async def map_module_to_address(
-    request: PythonModuleOwnersRequest,
-    first_party_mapping: FirstPartyPythonModuleMapping,
-    third_party_mapping: ThirdPartyPythonModuleMapping,
-) -> PythonModuleOwners:
-    possible_providers: tuple[PossibleModuleProvider, ...] = (
-        *third_party_mapping.providers_for_module(request.module, resolve=request.resolve),
-        *first_party_mapping.providers_for_module(request.module, resolve=request.resolve),
-    )
+@dataclass(frozen=True)
+class PythonModulesOwnersRequest:
+    """A request for the owners of several Python modules at once, e.g. all imports of a file.
 
+    This is equivalent to a `PythonModuleOwnersRequest` per module, but only creates a single
+    engine node for all of the modules.
+    """
+
+    modules: tuple[str, ...]
+    resolve: str | None
+    # See `PythonModuleOwnersRequest.locality`.
+    locality: str | None = None
+
+
+class PythonModulesOwners(FrozenDict[str, PythonModuleOwners]):
+    """The owners of each module of a `PythonModulesOwnersRequest`."""
+
+
+def _owners_from_possible_providers(
+    possible_providers: Iterable[PossibleModuleProvider], locality: str | None
+) -> PythonModuleOwners:
     # We first attempt to disambiguate conflicting providers by taking - for each provider type -
     # the providers of the closest ancestors to the requested modules.
     # E.g., if we have a provider for foo.bar and for foo.bar.baz, prefer the latter.
@@ -485,7 +552,7 @@ async def map_module_to_address(
         if possible_provider.ancestry == val[0]:
             val[1].append(possible_provider.provider)
 
-    if request.locality:
+    if locality:
         # For each provider type, if we have more than one provider left, prefer
         # the one with the closest common ancestor to the requester.
         for val in type_to_closest_providers.values():
@@ -495,9 +562,7 @@ async def map_module_to_address(
             providers_with_closest_common_ancestor: list[ModuleProvider] = []
             closest_common_ancestor_len = 0
             for provider in providers:
-                common_ancestor_len = len(
-                    os.path.commonpath([request.locality, provider.addr.spec_path])
-                )
+                common_ancestor_len = len(os.path.commonpath([locality, provider.addr.spec_path]))
                 if common_ancestor_len > closest_common_ancestor_len:
                     closest_common_ancestor_len = common_ancestor_len
                     providers_with_closest_common_ancestor = []
@@ -517,6 +582,43 @@ async def map_module_to_address(
     return PythonModuleOwners(addresses)
 
 
+@rule
+async def map_module_to_address(
+    request: PythonModuleOwnersRequest,
+    first_party_mapping: FirstPartyPythonModuleMapping,
+    third_party_mapping: ThirdPartyPythonModuleMapping,
+) -> PythonModuleOwners:
+    possible_providers: tuple[PossibleModuleProvider, ...] = (
+        *third_party_mapping.providers_for_module(request.module, resolve=request.resolve),
+        *first_party_mapping.providers_for_module(request.module, resolve=request.resolve),
+    )
+    return _owners_from_possible_providers(possible_providers, request.locality)
+
+
+@rule
+async def map_modules_to_addresses(
+    request: PythonModulesOwnersRequest,
+    first_party_mapping: FirstPartyPythonModuleMapping,
+    third_party_mapping: ThirdPartyPythonModuleMapping,
+) -> PythonModulesOwners:
+    third_party_providers = third_party_mapping.providers_for_modules(
+        request.modules, resolve=request.resolve
+    )
+    first_party_providers = first_party_mapping.providers_for_modules(
+        request.modules, resolve=request.resolve
+    )
+    return PythonModulesOwners(
+        (
+            module,
+            _owners_from_possible_providers(
+                (*third_party_providers[module], *first_party_providers[module]),
+                request.locality,
+            ),
+        )
+        for module in request.modules
+    )
+
+
 def rules():
     return (
         *collect_rules(),
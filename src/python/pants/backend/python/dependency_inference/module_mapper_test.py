@@ -34,6 +34,8 @@ from pants.backend.python.dependency_inference.module_mapper import (
     PossibleModuleProvider,
     PythonModuleOwners,
     PythonModuleOwnersRequest,
+    PythonModulesOwners,
+    PythonModulesOwnersRequest,
     ThirdPartyPythonModuleMapping,
     generate_mappings_from_pattern,
     module_from_stripped_path,
@@ -178,6 +180,11 @@ def test_first_party_modules_mapping() -> None:
     assert_addresses("two_resolves", (root_provider0,), resolve="default")
     assert_addresses("two_resolves", (test_provider0,), resolve="another")
 
+    assert mapping.providers_for_modules(["root.func", "two_resolves"], "another") == {
+        "root.func": (),
+        "two_resolves": (test_provider0,),
+    }
+
 
 def test_third_party_modules_mapping() -> None:
     colors_provider = ModuleProvider(Address("", target_name="ansicolors"), ModuleProviderType.IMPL)
@@ -255,6 +262,12 @@ def test_third_party_modules_mapping() -> None:
     assert_addresses("two_resolves", (colors_provider0,), resolve="default-resolve")
     assert_addresses("two_resolves", (pants_provider0,), resolve="another-resolve")
 
+    assert mapping.providers_for_modules(["colors.red", "two_resolves.foo", "unknown"], None) == {
+        "colors.red": (colors_provider1, colors_stubs_provider1),
+        "two_resolves.foo": (colors_provider1, pants_provider1),
+        "unknown": (),
+    }
+
 
 @pytest.fixture
 def rule_runner() -> RuleRunner:
@@ -269,6 +282,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(FirstPartyPythonModuleMapping, []),
             QueryRule(ThirdPartyPythonModuleMapping, []),
             QueryRule(PythonModuleOwners, [PythonModuleOwnersRequest]),
+            QueryRule(PythonModulesOwners, [PythonModulesOwnersRequest]),
         ],
         target_types=[
             PythonSourceTarget,
@@ -892,6 +906,21 @@ def test_resolving_ambiguity_by_filesystem_proximity(rule_runner: RuleRunner) ->
         Address("root2/aa/bb", relative_file_path="foo.py"),
     ]
 
+    # The batched request applies the same disambiguation to each module.
+    owners_by_module = rule_runner.request(
+        PythonModulesOwners,
+        [PythonModulesOwnersRequest(("aa.bb.foo", "aa.bb.foo.Foo", "unknown"), None, "root1/")],
+    )
+    assert owners_by_module == PythonModulesOwners(
+        {
+            "aa.bb.foo": PythonModuleOwners((Address("root1/aa/bb", relative_file_path="foo.py"),)),
+            "aa.bb.foo.Foo": PythonModuleOwners(
+                (Address("root1/aa/bb", relative_file_path="foo.py"),)
+            ),
+            "unknown": PythonModuleOwners(()),
+        }
+    )
+
 
 def test_map_module_considers_resolves(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
@@ -6,7 +6,6 @@ import logging
 import os
 from collections.abc import Iterable
 from dataclasses import dataclass
-from fnmatch import fnmatchcase
 
 from pants.backend.python.dependency_inference.subsystem import PythonInferSubsystem
 from pants.core.util_rules.source_files import SourceFiles
@@ -88,10 +87,6 @@ class ParserScript:
 _scripts_package = "pants.backend.python.dependency_inference.scripts"
 
 
-def _is_ignored_string_import(module_path: str, ignored_patterns: tuple[str, ...]) -> bool:
-    return any(fnmatchcase(module_path, ignored_pattern) for ignored_pattern in ignored_patterns)
-
-
 async def get_scripts_digest(scripts_package: str, filenames: Iterable[str]) -> Digest:
     scripts = [read_resource(scripts_package, filename) for filename in filenames]
     assert all(script is not None for script in scripts)
@@ -126,6 +121,7 @@ async def parse_python_dependencies(
         NativeDependenciesRequest(stripped_sources.snapshot.digest)
     )
 
+    string_import_ignore_pattern = python_infer_subsystem.string_import_ignore_pattern
     path_to_deps = {}
     for path, native_result in native_results.path_to_deps.items():
         imports = dict(native_result.imports)
@@ -135,8 +131,8 @@ async def parse_python_dependencies(
             for string, line in native_result.string_candidates.items():
                 if (
                     python_infer_subsystem.string_imports
-                    and not _is_ignored_string_import(
-                        string, python_infer_subsystem.string_import_ignore
+                    and not (
+                        string_import_ignore_pattern and string_import_ignore_pattern.match(string)
                     )
                     and string.count(".") >= python_infer_subsystem.string_imports_min_dots
                     and all(part.isidentifier() for part in string.split("."))
@@ -17,8 +17,10 @@ from pants.backend.python.dependency_inference.default_unowned_dependencies impo
 from pants.backend.python.dependency_inference.module_mapper import (
     PythonModuleOwners,
     PythonModuleOwnersRequest,
+    PythonModulesOwnersRequest,
     ResolveName,
     map_module_to_address,
+    map_modules_to_addresses,
     module_from_stripped_path,
 )
 from pants.backend.python.dependency_inference.parse_python_dependencies import (
@@ -222,7 +224,7 @@ def _collect_imports_info(
 
 
 def _remove_ignored_imports(
-    unowned_imports: frozenset[str], ignored_paths: tuple[str, ...]
+    unowned_imports: frozenset[str], ignored_paths: frozenset[str]
 ) -> frozenset[str]:
     """Remove unowned imports given a list of paths to ignore.
 
@@ -238,14 +240,16 @@ def _remove_ignored_imports(
     if not ignored_paths:
         return unowned_imports
 
-    unowned_imports_filtered = set()
-    for unowned_import in unowned_imports:
-        if not any(
-            unowned_import == ignored_path or unowned_import.startswith(f"{ignored_path}.")
-            for ignored_path in ignored_paths
-        ):
-            unowned_imports_filtered.add(unowned_import)
-    return frozenset(unowned_imports_filtered)
+    def is_ignored(unowned_import: str) -> bool:
+        # Look up the import and each of its parent packages, rather than each ignored path.
+        path = unowned_import
+        while path:
+            if path in ignored_paths:
+                return True
+            path = path.rpartition(".")[0]
+        return False
+
+    return frozenset(imp for imp in unowned_imports if not is_ignored(imp))
 
 
 @dataclass(frozen=True)
@@ -429,16 +433,13 @@ async def resolve_parsed_dependencies(
         locality = source_root.path
 
     if parsed_imports:
-        owners_per_import = await concurrently(
-            map_module_to_address(
-                PythonModuleOwnersRequest(imported_module, request.resolve, locality),
-                **implicitly(),
-            )
-            for imported_module in parsed_imports
+        owners_by_import = await map_modules_to_addresses(
+            PythonModulesOwnersRequest(tuple(parsed_imports), request.resolve, locality),
+            **implicitly(),
         )
         resolve_results = _get_imports_info(
             address=request.field_set.address,
-            owners_per_import=owners_per_import,
+            owners_per_import=(owners_by_import[imp] for imp in parsed_imports),
             parsed_imports=parsed_imports,
             explicitly_provided_deps=explicitly_provided_deps,
         )
@@ -483,7 +484,7 @@ async def infer_python_dependencies_via_source(
     )
     import_deps, unowned_imports = _collect_imports_info(resolved_dependencies.resolve_results)
     unowned_imports = _remove_ignored_imports(
-        unowned_imports, python_infer_subsystem.ignored_unowned_imports
+        unowned_imports, python_infer_subsystem.ignored_unowned_imports_set
     )
 
     asset_deps, unowned_assets = _collect_imports_info(resolved_dependencies.assets)
@@ -3,12 +3,15 @@
 
 from __future__ import annotations
 
+import fnmatch
+import re
 from enum import Enum
 
 from pants.core.util_rules.unowned_dependency_behavior import UnownedDependencyUsageOption
 from pants.option.option_types import BoolOption, EnumOption, IntOption, StrListOption
 from pants.option.subsystem import Subsystem
 from pants.util.docutil import bin_name
+from pants.util.memo import memoized_property
 from pants.util.strutil import softwrap
 
 
@@ -82,6 +85,17 @@ class PythonInferSubsystem(Subsystem):
             """
         ),
     )
+
+    @memoized_property
+    def string_import_ignore_pattern(self) -> re.Pattern[str] | None:
+        """The `string_import_ignore` globs, compiled into a single regex (or None if there are
+        none)."""
+        if not self.string_import_ignore:
+            return None
+        return re.compile(
+            "|".join(f"(?:{fnmatch.translate(glob)})" for glob in self.string_import_ignore)
+        )
+
     assets = BoolOption(
         default=False,
         help=softwrap(
@@ -192,6 +206,10 @@ class PythonInferSubsystem(Subsystem):
         ),
     )
 
+    @memoized_property
+    def ignored_unowned_imports_set(self) -> frozenset[str]:
+        return frozenset(self.ignored_unowned_imports)
+
     use_rust_parser = BoolOption(
         default=True,
         help=softwrap(
@@ -62,10 +62,12 @@ from pants.option.option_types import (
     EnumListOption,
     FileOption,
     FloatOption,
+    IntOption,
     StrListOption,
     StrOption,
 )
 from pants.source.source_root import AllSourceRoots
+from pants.util.collections import partition_sequentially
 from pants.util.logging import LogLevel
 from pants.util.strutil import softwrap
 
@@ -215,6 +217,25 @@ class CoverageSubsystem(PythonToolBase):
         ),
     )
 
+    combine_batch_size = IntOption(
+        default=64,
+        advanced=True,
+        help=softwrap(
+            """
+            The target maximum number of coverage data files to combine in each run of
+            `coverage combine`.
+
+            When more data files than this are produced (e.g. by many batches of tests), they are
+            combined in a tree of `coverage combine` runs: this parallelizes combining, and allows
+            the combined data of groups of test batches which were cache hits to be reused from
+            the cache. Groups are created at stable boundaries, so this value is only a "target"
+            size.
+
+            Set to 0 to combine all data files in a single run.
+            """
+        ),
+    )
+
     def output_dir(self, distdir: DistDir) -> PurePath:
         return PurePath(self._output_dir.format(distdir=distdir.relpath))
 
@@ -382,6 +403,41 @@ class MergedCoverageData:
     addresses: tuple[Address, ...]
 
 
+@dataclass(frozen=True)
+class _CoverageDataFile:
+    """A digest containing a single coverage data file, at `{path_prefix}/.coverage`."""
+
+    path_prefix: str
+    digest: Digest
+
+    @property
+    def path(self) -> str:
+        return f"{self.path_prefix}/.coverage"
+
+
+async def _combine_coverage_data_files(
+    data_files: list[_CoverageDataFile], path_prefix: str, coverage_setup: CoverageSetup
+) -> _CoverageDataFile:
+    if len(data_files) == 1:
+        return data_files[0]
+    input_digest = await merge_digests(MergeDigests(data_file.digest for data_file in data_files))
+    result = await fallible_to_exec_result_or_raise(
+        **implicitly(
+            VenvPexProcess(
+                coverage_setup.pex,
+                argv=("combine", *sorted(data_file.path for data_file in data_files)),
+                input_digest=input_digest,
+                output_files=(".coverage",),
+                description=f"Combine {len(data_files)} Pytest coverage reports.",
+                level=LogLevel.DEBUG,
+            )
+        )
+    )
+    return _CoverageDataFile(
+        path_prefix, await add_prefix(AddPrefix(result.output_digest, prefix=path_prefix))
+    )
+
+
 @rule(desc="Merge Pytest coverage data", level=LogLevel.DEBUG)
 async def merge_coverage_data(
     data_collection: PytestCoverageDataCollection,
@@ -391,7 +447,7 @@ async def merge_coverage_data(
     source_roots: AllSourceRoots,
 ) -> MergedCoverageData:
     coverage_digest_gets = []
-    coverage_data_file_paths = []
+    coverage_data_file_prefixes = []
     addresses: list[Address] = []
     for data in data_collection:
         path_prefix = data.addresses[0].path_safe_spec
@@ -400,7 +456,7 @@ async def merge_coverage_data(
 
         # We prefix each .coverage file with its corresponding address to avoid collisions.
         coverage_digest_gets.append(add_prefix(AddPrefix(data.digest, prefix=path_prefix)))
-        coverage_data_file_paths.append(f"{path_prefix}/.coverage")
+        coverage_data_file_prefixes.append(path_prefix)
         addresses.extend(data.addresses)
 
     if coverage.global_report or coverage.filter:
@@ -482,20 +538,59 @@ async def merge_coverage_data(
         coverage_digest_gets.append(
             add_prefix(AddPrefix(digest=result.output_digest, prefix=str(global_coverage_base_dir)))
         )
-        coverage_data_file_paths.append(str(global_coverage_base_dir / ".coverage"))
+        coverage_data_file_prefixes.append(str(global_coverage_base_dir))
     else:
         extra_sources_digest = EMPTY_DIGEST
 
-    input_digest = await merge_digests(MergeDigests(await concurrently(coverage_digest_gets)))
+    coverage_data_files = [
+        _CoverageDataFile(path_prefix, digest)
+        for path_prefix, digest in zip(
+            coverage_data_file_prefixes, await concurrently(coverage_digest_gets)
+        )
+    ]
+
+    # If there are many data files, combine them in a tree of bounded fan-in. Each combine is a
+    # cacheable process, and the groups are chosen stably, so groups of data files which have not
+    # changed since a previous run (e.g. because their tests were cache hits) are cache hits too.
+    batch_size = coverage.combine_batch_size
+    level = 0
+    while batch_size > 0 and len(coverage_data_files) > batch_size:
+        level += 1
+        groups = list(
+            partition_sequentially(
+                coverage_data_files,
+                key=lambda data_file: data_file.path,
+                size_target=batch_size,
+                size_max=2 * batch_size,
+            )
+        )
+        if len(groups) == len(coverage_data_files):
+            break
+        coverage_data_files = list(
+            await concurrently(
+                _combine_coverage_data_files(
+                    group, f"__combined_{level}__/{group[0].path_prefix}", coverage_setup
+                )
+                for group in groups
+            )
+        )
+
+    input_digest = await merge_digests(
+        MergeDigests(data_file.digest for data_file in coverage_data_files)
+    )
     result = await fallible_to_exec_result_or_raise(
         **implicitly(
             VenvPexProcess(
                 coverage_setup.pex,
                 # We tell combine to keep the original input files, to aid debugging in the sandbox.
-                argv=("combine", "--keep", *sorted(coverage_data_file_paths)),
+                argv=(
+                    "combine",
+                    "--keep",
+                    *sorted(data_file.path for data_file in coverage_data_files),
+                ),
                 input_digest=input_digest,
                 output_files=(".coverage",),
-                description=f"Merge {len(coverage_data_file_paths)} Pytest coverage reports.",
+                description=f"Merge {len(coverage_data_files)} Pytest coverage reports.",
                 level=LogLevel.DEBUG,
             )
         )
@@ -221,6 +221,16 @@ def test_coverage_fail_under(batched: bool) -> None:
         result.assert_failure()
 
 
+def test_coverage_combined_in_tree() -> None:
+    # Combining the data files of each test in several rounds should not change the result.
+    with setup_tmpdir(sources(False)) as tmpdir:
+        combine_args = ("--coverage-py-combine-batch-size=2",)
+        result = run_coverage(tmpdir, *combine_args, "--coverage-py-fail-under=89")
+        result.assert_success()
+        result = run_coverage_that_may_fail(tmpdir, *combine_args, "--coverage-py-fail-under=90")
+        result.assert_failure()
+
+
 @pytest.mark.parametrize("batched", (True, False))
 def test_coverage_global(batched: bool) -> None:
     with setup_tmpdir(sources(batched)) as tmpdir:
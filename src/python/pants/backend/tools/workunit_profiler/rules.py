@@ -0,0 +1,247 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+from typing import Any
+
+from pants.engine.internals.scheduler import Workunit
+from pants.engine.rules import collect_rules, rule
+from pants.engine.streaming_workunit_handler import (
+    StreamingWorkunitContext,
+    WorkunitsCallback,
+    WorkunitsCallbackFactory,
+    WorkunitsCallbackFactoryRequest,
+)
+from pants.engine.unions import UnionRule
+from pants.option.option_types import BoolOption, IntOption, StrOption
+from pants.option.subsystem import Subsystem
+from pants.util.dirutil import safe_open
+from pants.util.strutil import softwrap
+
+logger = logging.getLogger(__name__)
+
+# The `source` of a process workunit when its result was read from a cache.
+_CACHE_HIT_SOURCES = frozenset(("HitLocally", "HitRemotely"))
+
+# The maximum number of open workunits to track. Workunits are never completed if their completion
+# is not reported, e.g. if `[GLOBAL].streaming_workunits_overflow_policy` drops it.
+_MAX_OPEN_WORKUNITS = 100_000
+
+
+def _start_micros(workunit: Workunit) -> float:
+    return workunit["start_secs"] * 1_000_000 + workunit["start_nanos"] / 1_000
+
+
+def _end_micros(workunit: Workunit) -> float:
+    return (
+        _start_micros(workunit)
+        + workunit.get("duration_secs", 0) * 1_000_000
+        + workunit.get("duration_nanos", 0) / 1_000
+    )
+
+
+class _Lanes:
+    """Assigns workunits to "lanes" (the threads of the trace), so that the workunits in each lane
+    nest, which is what trace viewers need to render them as a flame graph.
+
+    A workunit is put in the lane of its parent if the parent is the innermost open workunit of
+    that lane, and otherwise in the first empty lane. Only open workunits are tracked, so memory is
+    bounded by the concurrency of the run rather than by its length, and by `bound()` for
+    workunits which are never closed.
+    """
+
+    def __init__(self) -> None:
+        self._stacks: list[list[str]] = []
+        self._lane_by_span_id: dict[str, int] = {}
+
+    def __contains__(self, span_id: str) -> bool:
+        return span_id in self._lane_by_span_id
+
+    def open(self, span_id: str, parent_id: str | None) -> None:
+        if span_id in self:
+            return
+        parent_lane = self._lane_by_span_id.get(parent_id) if parent_id else None
+        if parent_lane is not None and self._stacks[parent_lane][-1] == parent_id:
+            lane = parent_lane
+        else:
+            lane = next((i for i, stack in enumerate(self._stacks) if not stack), None)
+            if lane is None:
+                lane = len(self._stacks)
+                self._stacks.append([])
+        self._stacks[lane].append(span_id)
+        self._lane_by_span_id[span_id] = lane
+
+    def close(self, span_id: str) -> int:
+        lane = self._lane_by_span_id.pop(span_id)
+        self._stacks[lane].remove(span_id)
+        return lane
+
+    def bound(self, max_open: int) -> None:
+        """Close the workunits which were opened first, until at most `max_open` are open."""
+        while len(self._lane_by_span_id) > max_open:
+            self.close(next(iter(self._lane_by_span_id)))
+        while self._stacks and not self._stacks[-1]:
+            self._stacks.pop()
+
+
+class WorkunitProfilerCallback(WorkunitsCallback):
+    """Streams completed workunits into a file in the Chrome trace event format.
+
+    The file is appended to, and closed, on each call, so that no file is left open if the run ends
+    before the final call. The trace event format allows the closing `]` to be missing in that case.
+    """
+
+    def __init__(self, profiler: WorkunitProfiler) -> None:
+        self.profiler = profiler
+        self._lanes = _Lanes()
+        self._filepath: str | None = None
+        self._pending: list[str] = []
+        self._events_written = 0
+        self._events_dropped = 0
+
+    @property
+    def can_finish_async(self) -> bool:
+        return True
+
+    def _event(self, workunit: Workunit, lane: int) -> dict[str, Any]:
+        start = _start_micros(workunit)
+        args: dict[str, Any] = {"level": workunit["level"]}
+        if "description" in workunit:
+            args["description"] = workunit["description"]
+        source = workunit.get("metadata", {}).get("source")
+        if source is not None:
+            args["source"] = source
+            args["cache_hit"] = source in _CACHE_HIT_SOURCES
+        return {
+            "name": workunit["name"],
+            "cat": workunit["level"],
+            "ph": "X",
+            "ts": start,
+            "dur": _end_micros(workunit) - start,
+            "pid": 1,
+            "tid": lane,
+            "args": args,
+        }
+
+    def _write(self, event: dict[str, Any]) -> None:
+        if self._events_written >= self.profiler.max_events:
+            self._events_dropped += 1
+            return
+        self._pending.append((",\n" if self._events_written else "") + json.dumps(event))
+        self._events_written += 1
+
+    def _flush(self, finished: bool) -> None:
+        if self._filepath is None:
+            return
+        with open(self._filepath, "a") as f:
+            f.writelines(self._pending)
+            if finished:
+                f.write("\n]\n")
+        self._pending.clear()
+
+    def __call__(
+        self,
+        *,
+        started_workunits: tuple[Workunit, ...],
+        completed_workunits: tuple[Workunit, ...],
+        finished: bool,
+        context: StreamingWorkunitContext,
+    ) -> None:
+        if self._filepath is None:
+            filepath = f"{self.profiler.logdir}/{context.run_tracker.run_id}.trace.json"
+            with safe_open(filepath, "w") as f:
+                f.write("[\n")
+            self._filepath = filepath
+
+        try:
+            self._handle(started_workunits, completed_workunits)
+        finally:
+            self._flush(finished)
+
+        if finished:
+            if self._events_dropped:
+                logger.warning(
+                    f"Dropped {self._events_dropped} workunits from the profile, because it "
+                    f"reached `[{self.profiler.options_scope}].max_events`."
+                )
+            logger.info(f"Wrote profile to {self._filepath}")
+
+    def _handle(
+        self, started_workunits: tuple[Workunit, ...], completed_workunits: tuple[Workunit, ...]
+    ) -> None:
+        for workunit in sorted(started_workunits, key=_start_micros):
+            self._lanes.open(workunit["span_id"], workunit.get("parent_id"))
+
+        # Workunits which both started and completed since the last call are opened and closed in
+        # the order of their start and end times, so that they nest in their lanes.
+        opened: list[tuple[float, str]] = []
+        completed_by_span_id = {workunit["span_id"]: workunit for workunit in completed_workunits}
+        previously_started = []
+        for workunit in sorted(
+            completed_workunits, key=lambda wu: (_start_micros(wu), -_end_micros(wu))
+        ):
+            if workunit["span_id"] in self._lanes:
+                previously_started.append(workunit)
+                continue
+            while opened and opened[0][0] <= _start_micros(workunit):
+                self._close(completed_by_span_id[heapq.heappop(opened)[1]])
+            self._lanes.open(workunit["span_id"], workunit.get("parent_id"))
+            heapq.heappush(opened, (_end_micros(workunit), workunit["span_id"]))
+        while opened:
+            self._close(completed_by_span_id[heapq.heappop(opened)[1]])
+        for workunit in previously_started:
+            self._close(workunit)
+        self._lanes.bound(_MAX_OPEN_WORKUNITS)
+
+    def _close(self, workunit: Workunit) -> None:
+        self._write(self._event(workunit, self._lanes.close(workunit["span_id"])))
+
+
+class WorkunitProfilerCallbackFactoryRequest:
+    """A unique request type that is installed to trigger construction of our WorkunitsCallback."""
+
+
+class WorkunitProfiler(Subsystem):
+    options_scope = "workunit-profiler"
+    help = softwrap(
+        """
+        Writes a profile of each run, with a span for each rule, process and other workunit.
+
+        The profile is written in the Chrome trace event format, which can be viewed with
+        `chrome://tracing`, https://ui.perfetto.dev or https://www.speedscope.app. Useful to find
+        slow rules, e.g. in plugins.
+        """
+    )
+
+    enabled = BoolOption(default=False, help="Whether to write a profile of each run.")
+    logdir = StrOption(default=".pants.d", help="Where to write the profile to.")
+    max_events = IntOption(
+        default=1_000_000,
+        help=softwrap(
+            """
+            The maximum number of workunits to write to the profile of a run, which bounds the
+            size of the profile of long runs. Workunits which complete after this are dropped.
+            """
+        ),
+        advanced=True,
+    )
+
+
+@rule
+async def construct_callback(
+    _: WorkunitProfilerCallbackFactoryRequest,
+    profiler: WorkunitProfiler,
+) -> WorkunitsCallbackFactory:
+    return WorkunitsCallbackFactory(
+        lambda: WorkunitProfilerCallback(profiler) if profiler.enabled else None
+    )
+
+
+def rules():
+    return [
+        UnionRule(WorkunitsCallbackFactoryRequest, WorkunitProfilerCallbackFactoryRequest),
+        *collect_rules(),
+    ]
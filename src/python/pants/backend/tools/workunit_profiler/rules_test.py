@@ -0,0 +1,146 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from pants.backend.tools.workunit_profiler.rules import (
+    WorkunitProfiler,
+    WorkunitProfilerCallback,
+    _Lanes,
+)
+from pants.engine.streaming_workunit_handler import StreamingWorkunitContext
+from pants.testutil.option_util import create_subsystem
+
+
+def context() -> StreamingWorkunitContext:
+    return cast(
+        StreamingWorkunitContext, SimpleNamespace(run_tracker=SimpleNamespace(run_id="run"))
+    )
+
+
+def workunit(
+    span_id: str, start: int, duration: int | None, parent_id: str | None = None, **extra: Any
+) -> dict[str, Any]:
+    wu: dict[str, Any] = {"name": f"rule_{span_id}", "span_id": span_id, "level": "DEBUG", **extra}
+    wu["start_secs"], wu["start_nanos"] = start, 0
+    if parent_id:
+        wu["parent_id"] = parent_id
+    if duration is not None:
+        wu["duration_secs"], wu["duration_nanos"] = duration, 0
+    return wu
+
+
+def test_profile(tmp_path: Path) -> None:
+    profiler = create_subsystem(
+        WorkunitProfiler, enabled=True, logdir=str(tmp_path), max_events=1_000_000
+    )
+    callback = WorkunitProfilerCallback(profiler)
+
+    # `root` runs for the whole run, and has two concurrent children, one of which is reported as
+    # started before it completes.
+    callback(
+        started_workunits=(workunit("root", 0, None), workunit("a", 1, None, parent_id="root")),
+        completed_workunits=(),
+        finished=False,
+        context=context(),
+    )
+    callback(
+        started_workunits=(),
+        completed_workunits=(
+            workunit("a1", 2, 1, parent_id="a"),
+            workunit("a", 1, 4, parent_id="root"),
+            workunit(
+                "b",
+                2,
+                2,
+                parent_id="root",
+                description="Run a process",
+                metadata={"source": "HitLocally"},
+            ),
+        ),
+        finished=False,
+        context=context(),
+    )
+    callback(
+        started_workunits=(),
+        completed_workunits=(workunit("root", 0, 10),),
+        finished=True,
+        context=context(),
+    )
+
+    events = {
+        event["name"]: event for event in json.loads((tmp_path / "run.trace.json").read_text())
+    }
+    assert set(events) == {"rule_root", "rule_a", "rule_a1", "rule_b"}
+    assert events["rule_root"]["ts"] == 0
+    assert events["rule_root"]["dur"] == 10_000_000
+    # Children nest in the lane of their parent, unless another child is already running there.
+    assert events["rule_root"]["tid"] == events["rule_a"]["tid"] == events["rule_a1"]["tid"]
+    assert events["rule_b"]["tid"] != events["rule_a"]["tid"]
+    assert events["rule_b"]["args"] == {
+        "level": "DEBUG",
+        "description": "Run a process",
+        "source": "HitLocally",
+        "cache_hit": True,
+    }
+
+
+def test_max_events(tmp_path: Path) -> None:
+    profiler = create_subsystem(WorkunitProfiler, enabled=True, logdir=str(tmp_path), max_events=2)
+    callback = WorkunitProfilerCallback(profiler)
+    callback(
+        started_workunits=(),
+        completed_workunits=tuple(workunit(str(i), i, 1) for i in range(5)),
+        finished=True,
+        context=context(),
+    )
+    events = json.loads((tmp_path / "run.trace.json").read_text())
+    assert [event["name"] for event in events] == ["rule_0", "rule_1"]
+
+
+def test_profile_is_flushed_on_each_call(tmp_path: Path) -> None:
+    profiler = create_subsystem(
+        WorkunitProfiler, enabled=True, logdir=str(tmp_path), max_events=1_000_000
+    )
+    callback = WorkunitProfilerCallback(profiler)
+    callback(
+        started_workunits=(),
+        completed_workunits=(workunit("a", 0, 1),),
+        finished=False,
+        context=context(),
+    )
+    # The trace event format allows the closing `]` to be missing if the run ends early.
+    profile = tmp_path / "run.trace.json"
+    assert [event["name"] for event in json.loads(profile.read_text() + "]")] == ["rule_a"]
+
+    # The profile is terminated even if the final call fails.
+    with pytest.raises(KeyError):
+        callback(
+            started_workunits=(),
+            completed_workunits=({"span_id": "b"},),
+            finished=True,
+            context=context(),
+        )
+    assert [event["name"] for event in json.loads(profile.read_text())] == ["rule_a"]
+
+
+def test_lanes_bound() -> None:
+    lanes = _Lanes()
+    lanes.open("root", None)
+    lanes.open("a", "root")
+    lanes.open("b", "root")
+    lanes.bound(2)
+    assert "root" not in lanes
+    assert "a" in lanes
+    assert "b" in lanes
+    assert lanes.close("b") == 1
+    assert lanes.close("a") == 0
+    lanes.bound(0)
+    assert lanes._stacks == []
@@ -302,6 +302,8 @@ class LocalPantsRunner:
                 global_options.pantsd and global_options.streaming_workunits_complete_async
             ),
             max_workunit_verbosity=global_options.streaming_workunits_level,
+            queue_size=global_options.streaming_workunits_queue_size,
+            overflow_policy=global_options.streaming_workunits_overflow_policy,
         )
         try:
             with streaming_reporter:
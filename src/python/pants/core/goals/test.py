@@ -8,6 +8,7 @@ import json
 import logging
 import os
 import shlex
+import tempfile
 from abc import ABC, ABCMeta
 from collections.abc import Coroutine, Iterable, Sequence
 from dataclasses import dataclass, field
@@ -79,9 +80,10 @@ from pants.engine.target import (
     parse_shard_spec,
 )
 from pants.engine.unions import UnionMembership, UnionRule, distinct_union_type_per_subclass, union
+from pants.option.global_options import GlobalOptions
 from pants.option.option_types import BoolOption, EnumOption, IntOption, StrListOption, StrOption
-from pants.util.collections import partition_sequentially
-from pants.util.dirutil import safe_open
+from pants.util.collections import partition_sequentially, partition_sequentially_by_weight
+from pants.util.dirutil import safe_mkdir, safe_open
 from pants.util.docutil import bin_name
 from pants.util.logging import LogLevel
 from pants.util.memo import memoized, memoized_property
@@ -303,6 +305,13 @@ class ShowOutput(Enum):
     NONE = "none"
 
 
+class TestBatchStrategy(Enum):
+    """How to divide compatible tests into batches."""
+
+    COUNT = "count"
+    DURATION = "duration"
+
+
 @dataclass(frozen=True)
 class TestDebugRequest:
     process: InteractiveProcess
@@ -713,6 +722,29 @@ class TestSubsystem(GoalSubsystem):
         ),
     )
 
+    batch_strategy = EnumOption(
+        default=TestBatchStrategy.COUNT,
+        advanced=True,
+        help=softwrap(
+            f"""
+            How to divide compatible tests into batches for batch-enabled test runners.
+
+            With `{TestBatchStrategy.COUNT.value}`, batches contain around `[test].batch_size`
+            files.
+
+            With `{TestBatchStrategy.DURATION.value}`, batches are sized using the recorded runtime
+            of each test file so that their predicted runtimes are roughly equal, i.e.
+            around `[test].batch_size` times the average runtime of a test file. This avoids a few
+            slow tests in a single batch dominating the overall runtime. Test files without a
+            recorded runtime are assumed to take the average time. Batches are still created at
+            stable boundaries, which only move when the runtime of a test file changes
+            significantly, and are still capped at twice `[test].batch_size` files. The runtime
+            of each test file is recorded under `[GLOBAL].pants_workdir`, and the batches which
+            are expected to take the longest are started first.
+            """
+        ),
+    )
+
     show_rerun_command = BoolOption(
         default="CI" in os.environ,
         advanced=True,
@@ -856,11 +888,116 @@ class TestsBatchCompatibilityTagField(StringField, metaclass=ABCMeta):
         """
 
 
+def _test_durations_path(global_options: GlobalOptions) -> str:
+    return os.path.join(global_options.pants_workdir, "test", "durations.json")
+
+
+def _load_test_durations(path: str) -> dict[str, float]:
+    """Load the runtimes in seconds of previously run tests, keyed by address."""
+    try:
+        with open(path) as fp:
+            durations = json.load(fp)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable test durations in {path}: {e}")
+        return {}
+    if not isinstance(durations, dict):
+        return {}
+    # NB: The file may have been edited by hand, so ignore any entries which are not durations.
+    return {
+        key: value
+        for key, value in durations.items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    }
+
+
+# The maximum number of test durations to record. The durations of the tests which were run least
+# recently (e.g. of tests which have since been deleted) are dropped first.
+_MAX_TEST_DURATIONS = 100_000
+
+
+def _save_test_durations(
+    path: str,
+    durations: dict[str, float],
+    results: Iterable[TestResult],
+    *,
+    max_durations: int = _MAX_TEST_DURATIONS,
+) -> None:
+    """Record the runtime of the given results, split evenly between the tests in each batch.
+
+    Durations are kept in the order in which they were last recorded, so that the least recently
+    recorded are dropped once there are more than `max_durations`.
+    """
+    for result in results:
+        if result.result_metadata is None or result.result_metadata.total_elapsed_ms is None:
+            continue
+        duration = result.result_metadata.total_elapsed_ms / 1000 / len(result.addresses)
+        for address in result.addresses:
+            key = str(address)
+            durations.pop(key, None)
+            durations[key] = duration
+    recorded = dict(
+        itertools.islice(durations.items(), max(0, len(durations) - max_durations), None)
+    )
+
+    # Write to a temporary file which replaces the durations, so that concurrent or interrupted
+    # runs cannot leave a partially written file.
+    directory = os.path.dirname(path)
+    safe_mkdir(directory)
+    with tempfile.NamedTemporaryFile("w", dir=directory, delete=False) as fp:
+        json.dump(recorded, fp)
+    os.replace(fp.name, path)
+
+
+def _test_batch_key(element: Any) -> str:
+    return str(element.address) if isinstance(element, FieldSet) else str(element)
+
+
+def _average_test_duration(elements: Iterable[Any], test_durations: dict[str, float]) -> float:
+    """The average recorded duration of the given tests, which is assumed for tests without one."""
+    known_durations = [
+        test_durations[key] for key in map(_test_batch_key, elements) if key in test_durations
+    ]
+    return sum(known_durations) / len(known_durations) if any(known_durations) else 1.0
+
+
+def _expected_test_batch_duration(
+    batch: TestRequest.Batch, test_durations: dict[str, float], default_duration: float
+) -> float:
+    return sum(
+        test_durations.get(_test_batch_key(element), default_duration) for element in batch.elements
+    )
+
+
+def _partition_test_batches(
+    elements: Iterable[Any], test_subsystem: TestSubsystem, test_durations: dict[str, float]
+) -> Iterable[list[Any]]:
+    if test_subsystem.batch_strategy == TestBatchStrategy.COUNT:
+        return partition_sequentially(
+            elements,
+            key=_test_batch_key,
+            size_target=test_subsystem.batch_size,
+            size_max=2 * test_subsystem.batch_size,
+        )
+
+    elements = list(elements)
+    average_duration = _average_test_duration(elements, test_durations)
+    return partition_sequentially_by_weight(
+        elements,
+        key=_test_batch_key,
+        weight=lambda element: test_durations.get(_test_batch_key(element), average_duration),
+        weight_target=test_subsystem.batch_size * average_duration,
+        size_max=2 * test_subsystem.batch_size,
+    )
+
+
 async def _get_test_batches(
     core_request_types: Iterable[type[TestRequest]],
     targets_to_field_sets: TargetRootsToFieldSets,
     local_environment_name: ChosenLocalEnvironmentName,
     test_subsystem: TestSubsystem,
+    test_durations: dict[str, float],
 ) -> list[TestRequest.Batch]:
     def partitions_call(request_type: type[TestRequest]) -> Coroutine[Any, Any, Partitions]:
         partition_type = cast(TestRequest, request_type)
@@ -890,12 +1027,7 @@ async def _get_test_batches(
         )
         for request_type, partitions in zip(core_request_types, all_partitions)
         for partition in partitions
-        for batch in partition_sequentially(
-            partition.elements,
-            key=lambda x: str(x.address) if isinstance(x, FieldSet) else str(x),
-            size_target=test_subsystem.batch_size,
-            size_max=2 * test_subsystem.batch_size,
-        )
+        for batch in _partition_test_batches(partition.elements, test_subsystem, test_durations)
     ]
 
 
@@ -955,6 +1087,7 @@ async def run_tests(
     distdir: DistDir,
     run_id: RunId,
     local_environment_name: ChosenLocalEnvironmentName,
+    global_options: GlobalOptions,
 ) -> Test:
     if test_subsystem.debug_adapter:
         goal_description = f"`{test_subsystem.name} --debug-adapter`"
@@ -978,12 +1111,17 @@ async def run_tests(
         **implicitly(),
     )
 
+    # Test durations are only recorded and used when batching by duration.
+    uses_test_durations = test_subsystem.batch_strategy == TestBatchStrategy.DURATION
+    test_durations_path = _test_durations_path(global_options)
+    test_durations = _load_test_durations(test_durations_path) if uses_test_durations else {}
     request_types = union_membership.get(TestRequest)
     test_batches = await _get_test_batches(
         request_types,
         targets_to_valid_field_sets,
         local_environment_name,
         test_subsystem,
+        test_durations,
     )
 
     environment_names = await concurrently(
@@ -999,6 +1137,20 @@ async def run_tests(
         )
 
     to_test = list(zip(test_batches, environment_names))
+    if uses_test_durations:
+        # Request the batches which are expected to take the longest first, so that they are not
+        # left to run last and extend the overall runtime: processes acquire local execution slots
+        # in roughly the order in which they are requested. As when partitioning, tests without a
+        # recorded duration are assumed to take the average duration.
+        average_duration = _average_test_duration(
+            (element for batch in test_batches for element in batch.elements), test_durations
+        )
+        to_test.sort(
+            key=lambda batch_and_env: _expected_test_batch_duration(
+                batch_and_env[0], test_durations, average_duration
+            ),
+            reverse=True,
+        )
     results = await concurrently(
         run_test_batch(
             **implicitly(
@@ -1011,6 +1163,9 @@ async def run_tests(
         for batch, environment_name in to_test
     )
 
+    if uses_test_durations:
+        _save_test_durations(test_durations_path, test_durations, results)
+
     # Print summary.
     exit_code = 0
     if results:
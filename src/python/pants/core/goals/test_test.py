@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import os
 from abc import abstractmethod
 from collections.abc import Iterable
 from dataclasses import dataclass
@@ -29,14 +30,20 @@ from pants.core.goals.test import (
     RuntimePackageDependenciesField,
     ShowOutput,
     Test,
+    TestBatchStrategy,
     TestDebugRequest,
     TestFieldSet,
     TestRequest,
     TestResult,
     TestSubsystem,
     TestTimeoutField,
+    _average_test_duration,
+    _expected_test_batch_duration,
     _format_test_rerun_command,
     _format_test_summary,
+    _load_test_durations,
+    _partition_test_batches,
+    _save_test_durations,
     build_runtime_package_dependencies,
     run_tests,
 )
@@ -65,6 +72,7 @@ from pants.engine.target import (
     TargetRootsToFieldSetsRequest,
 )
 from pants.engine.unions import UnionMembership, UnionRule
+from pants.option.global_options import GlobalOptions
 from pants.option.option_types import SkipOption
 from pants.option.subsystem import Subsystem
 from pants.testutil.option_util import create_goal_subsystem, create_subsystem
@@ -262,6 +270,7 @@ def run_test_rule(
     valid_targets: bool = True,
     show_rerun_command: bool = False,
     run_id: RunId = RunId(999),
+    batch_strategy: TestBatchStrategy = TestBatchStrategy.COUNT,
 ) -> tuple[int, str]:
     test_subsystem = create_goal_subsystem(
         TestSubsystem,
@@ -276,8 +285,12 @@ def run_test_rule(
         extra_env_vars=[],
         shard="",
         batch_size=1,
+        batch_strategy=batch_strategy,
         show_rerun_command=show_rerun_command,
     )
+    global_options = create_subsystem(
+        GlobalOptions, pants_workdir=os.path.join(rule_runner.build_root, ".pants.d")
+    )
     debug_adapter_subsystem = create_subsystem(
         DebugAdapterSubsystem,
         host="127.0.0.1",
@@ -339,6 +352,7 @@ def run_test_rule(
                 DistDir(relpath=Path("dist")),
                 run_id,
                 ChosenLocalEnvironmentName(EnvironmentName(None)),
+                global_options,
             ],
             mock_calls={
                 "pants.core.goals.test.partition_tests": mock_partitioner,
@@ -591,6 +605,106 @@ def test_report_dir(rule_runner: PythonRuleRunner) -> None:
     assert f"Wrote test reports to {report_dir}" in stderr
 
 
+def test_batch_strategy_duration_records_durations(rule_runner: PythonRuleRunner) -> None:
+    addr1 = Address("", target_name="t1")
+    addr2 = Address("", target_name="t2")
+    durations_path = os.path.join(rule_runner.build_root, ".pants.d", "test", "durations.json")
+
+    exit_code, _ = run_test_rule(
+        rule_runner,
+        request_type=SuccessfulRequest,
+        targets=[make_target(addr1), make_target(addr2)],
+    )
+    assert exit_code == 0
+    assert not os.path.exists(durations_path)
+
+    exit_code, _ = run_test_rule(
+        rule_runner,
+        request_type=SuccessfulRequest,
+        targets=[make_target(addr1), make_target(addr2)],
+        batch_strategy=TestBatchStrategy.DURATION,
+    )
+    assert exit_code == 0
+    assert _load_test_durations(durations_path) == {"//:t1": 0.999, "//:t2": 0.999}
+
+
+def test_batch_strategy_duration_runs_longest_first(
+    rule_runner: PythonRuleRunner, monkeypatch: MonkeyPatch
+) -> None:
+    requested: list[str] = []
+    run_test_batch = mock_test_partition
+
+    def record_test_partition(__implicitly: tuple) -> TestResult:
+        request = next(iter(__implicitly[0]))
+        requested.extend(str(field_set.address) for field_set in request.elements)
+        return run_test_batch(__implicitly)
+
+    monkeypatch.setattr("pants.core.goals.test_test.mock_test_partition", record_test_partition)
+    rule_runner.write_files(
+        {".pants.d/test/durations.json": '{"//:t1": 1.0, "//:t2": 5.0, "//:t3": 4.0}'}
+    )
+    # `t4` has no recorded duration, so it is expected to take the average duration.
+    targets = [make_target(Address("", target_name=name)) for name in ("t1", "t2", "t3", "t4")]
+
+    run_test_rule(rule_runner, request_type=SuccessfulRequest, targets=targets)
+    assert requested == ["//:t1", "//:t2", "//:t3", "//:t4"]
+
+    requested.clear()
+    run_test_rule(
+        rule_runner,
+        request_type=SuccessfulRequest,
+        targets=targets,
+        batch_strategy=TestBatchStrategy.DURATION,
+    )
+    assert requested == ["//:t2", "//:t3", "//:t4", "//:t1"]
+
+
+def test_load_test_durations(tmp_path: Path) -> None:
+    durations_path = tmp_path / "durations.json"
+    assert _load_test_durations(str(durations_path)) == {}
+    durations_path.write_text('{"//:t1": 1.5, "//:t2": 2, "//:t3": "slow", "//:t4": null}')
+    assert _load_test_durations(str(durations_path)) == {"//:t1": 1.5, "//:t2": 2}
+    durations_path.write_text("[1.5]")
+    assert _load_test_durations(str(durations_path)) == {}
+
+
+def test_save_test_durations(tmp_path: Path) -> None:
+    durations_path = str(tmp_path / "test" / "durations.json")
+    _save_test_durations(durations_path, {"//:t1": 1.0, "//:t2": 2.0}, ())
+    assert _load_test_durations(durations_path) == {"//:t1": 1.0, "//:t2": 2.0}
+
+    # The least recently recorded durations are dropped first.
+    durations = _load_test_durations(durations_path)
+    durations["//:t3"] = 3.0
+    _save_test_durations(durations_path, durations, (), max_durations=2)
+    assert _load_test_durations(durations_path) == {"//:t2": 2.0, "//:t3": 3.0}
+    assert os.listdir(tmp_path / "test") == ["durations.json"]
+
+
+def test_expected_test_batch_duration() -> None:
+    durations = {"//:t1": 2.0, "//:t2": 3.0}
+    batch = SuccessfulRequest.Batch("mock", ("//:t1", "//:t2", "//:t3"), None)
+    assert _average_test_duration(batch.elements, durations) == 2.5
+    assert _expected_test_batch_duration(batch, durations, 2.5) == 7.5
+    assert _average_test_duration(batch.elements, {}) == 1.0
+    assert _expected_test_batch_duration(batch, {}, 1.0) == 3.0
+
+
+def test_partition_test_batches_by_duration() -> None:
+    test_subsystem = create_goal_subsystem(
+        TestSubsystem, batch_size=4, batch_strategy=TestBatchStrategy.DURATION
+    )
+    elements = [f"test{i}" for i in range(64)]
+    durations = {element: 1.0 for element in elements}
+    durations["test7"] = 100.0
+
+    batches = list(_partition_test_batches(elements, test_subsystem, durations))
+    assert sorted(element for batch in batches for element in batch) == sorted(elements)
+    assert all(len(batch) <= 8 for batch in batches)
+    # The slow test ends its batch, rather than being followed by other tests.
+    assert any(batch[-1] == "test7" for batch in batches)
+
+
 def test_coverage(rule_runner: PythonRuleRunner) -> None:
     addr1 = Address("", target_name="t1")
     addr2 = Address("", target_name="t2")
@@ -5,15 +5,21 @@ from __future__ import annotations
 
 import ast
 import builtins
+import hashlib
 import itertools
 import logging
+import marshal
 import os.path
 import sys
+import tempfile
+import threading
 import typing
 from collections import defaultdict
 from collections.abc import Coroutine, Sequence
 from dataclasses import dataclass
+from importlib.util import MAGIC_NUMBER
 from pathlib import PurePath
+from types import CodeType
 from typing import Any, cast
 
 import typing_extensions
@@ -68,6 +74,7 @@ from pants.init.bootstrap_scheduler import BootstrapStatus
 from pants.option.global_options import GlobalOptions
 from pants.util.frozendict import FrozenDict
 from pants.util.strutil import softwrap
+from pants.version import VERSION
 
 logger = logging.getLogger(__name__)
 
@@ -140,6 +147,7 @@ async def extract_build_file_options(
 async def evaluate_preludes(
     build_file_options: BuildFileOptions,
     parser: Parser,
+    build_file_analysis_cache: BuildFileAnalysisCache,
 ) -> BuildFilePreludeSymbols:
     prelude_digest_contents = await get_digest_contents(
         **implicitly(
@@ -164,12 +172,13 @@ async def evaluate_preludes(
     for file_content in prelude_digest_contents:
         try:
             file_content_str = file_content.content.decode()
-            content = compile(file_content_str, file_content.path, "exec", dont_inherit=True)
-            exec(content, globals, locals)
+            analysis = build_file_analysis_cache.analyze(file_content)
+            exec(analysis.code, globals, locals)
         except Exception as e:
             raise Exception(f"Error parsing prelude file {file_content.path}: {e}")
         error_on_imports(file_content_str, file_content.path)
-        env_vars.update(BUILDFileEnvVarExtractor.get_env_vars(file_content))
+        analysis.log_warnings()
+        env_vars.update(analysis.env_vars)
     # __builtins__ is a dict, so isn't hashable, and can't be put in a FrozenDict.
     # Fortunately, we don't care about it - preludes should not be able to override builtins, so we just pop it out.
     # TODO: Give a nice error message if a prelude tries to set and expose a non-hashable value.
@@ -262,20 +271,26 @@ async def ensure_address_family(request: OptionalAddressFamily) -> AddressFamily
     return request.ensure()
 
 
+def _parse_build_file_ast(file_content: FileContent) -> ast.Module:
+    try:
+        return ast.parse(file_content.content, file_content.path)
+    except SyntaxError as e:
+        raise BuildFileSyntaxError.from_syntax_error(e).with_traceback(e.__traceback__)
+
+
 class BUILDFileEnvVarExtractor(ast.NodeVisitor):
     def __init__(self, filename: str):
         super().__init__()
         self.env_vars: set[str] = set()
+        self.warnings: list[str] = []
         self.filename = filename
 
     @classmethod
     def get_env_vars(cls, file_content: FileContent) -> Sequence[str]:
         obj = cls(file_content.path)
-        try:
-            obj.visit(ast.parse(file_content.content, file_content.path))
-        except SyntaxError as e:
-            raise BuildFileSyntaxError.from_syntax_error(e).with_traceback(e.__traceback__)
-
+        obj.visit(_parse_build_file_ast(file_content))
+        for warning in obj.warnings:
+            logger.warning(warning)
         return tuple(obj.env_vars)
 
     def visit_Call(self, node: ast.Call):
@@ -297,7 +312,7 @@ class BUILDFileEnvVarExtractor(ast.NodeVisitor):
                 self.env_vars.add(value)  # type: ignore[arg-type]
                 return
             else:
-                logger.warning(
+                self.warnings.append(
                     f"{self.filename}:{arg.lineno}: Only constant string values as variable name to "
                     f"`env()` is currently supported. This `env()` call will always result in "
                     "the default value only."
@@ -307,6 +322,127 @@ class BUILDFileEnvVarExtractor(ast.NodeVisitor):
             self.visit(kwarg)
 
 
+@dataclass(frozen=True)
+class BuildFileAnalysis:
+    """The result of processing a BUILD file which only depends on its path and content.
+
+    This allows a BUILD file to be parsed once for both its compiled code and the names of the
+    environment variables it references via `env()`.
+    """
+
+    code: CodeType
+    env_vars: tuple[str, ...]
+    warnings: tuple[str, ...] = ()
+
+    @classmethod
+    def create(cls, file_content: FileContent) -> BuildFileAnalysis:
+        tree = _parse_build_file_ast(file_content)
+        extractor = BUILDFileEnvVarExtractor(file_content.path)
+        extractor.visit(tree)
+        return cls(
+            code=compile(tree, file_content.path, "exec", dont_inherit=True),
+            env_vars=tuple(sorted(extractor.env_vars)),
+            warnings=tuple(extractor.warnings),
+        )
+
+    def log_warnings(self) -> None:
+        for warning in self.warnings:
+            logger.warning(warning)
+
+
+class BuildFileAnalysisCache:
+    """A persistent cache of `BuildFileAnalysis` results, keyed by BUILD file path and content.
+
+    Entries are `marshal`-serialized files under `directory`, and are additionally keyed by the
+    bytecode magic number of the running interpreter, the Pants version, and `SCHEMA_VERSION`, so
+    that entries created by another version of the analysis are not reused. Once more than
+    `max_entries` entries exist, the least recently used are evicted. If `directory` is None,
+    nothing is persisted.
+    """
+
+    # Bump this when `BuildFileAnalysis` or the analysis done by `BuildFileAnalysis.create` (e.g.
+    # by `BUILDFileEnvVarExtractor`) changes.
+    SCHEMA_VERSION = 1
+
+    def __init__(self, directory: str | None, *, max_entries: int = 100_000) -> None:
+        self._directory = directory
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        # Check for eviction on the first write of each process, and then periodically.
+        self._writes_until_eviction = 0
+
+    def analyze(self, file_content: FileContent) -> BuildFileAnalysis:
+        if self._directory is None:
+            return BuildFileAnalysis.create(file_content)
+
+        hasher = hashlib.sha256(MAGIC_NUMBER)
+        hasher.update(f"{VERSION}\0{self.SCHEMA_VERSION}\0".encode())
+        hasher.update(file_content.path.encode())
+        hasher.update(b"\0")
+        hasher.update(file_content.content)
+        key = hasher.hexdigest()
+        entry_path = os.path.join(self._directory, key[:2], key)
+
+        analysis = self._load(entry_path)
+        if analysis is None:
+            analysis = BuildFileAnalysis.create(file_content)
+            self._store(entry_path, analysis)
+        return analysis
+
+    def _load(self, entry_path: str) -> BuildFileAnalysis | None:
+        try:
+            with open(entry_path, "rb") as f:
+                code, env_vars, warnings = marshal.load(f)
+            # Mark the entry as recently used.
+            os.utime(entry_path)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            logger.debug(f"Ignoring invalid BUILD file analysis cache entry {entry_path}: {e}")
+            return None
+        if not isinstance(code, CodeType):
+            return None
+        return BuildFileAnalysis(code=code, env_vars=env_vars, warnings=warnings)
+
+    def _store(self, entry_path: str, analysis: BuildFileAnalysis) -> None:
+        entry_dir = os.path.dirname(entry_path)
+        try:
+            os.makedirs(entry_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=entry_dir, delete=False) as f:
+                marshal.dump((analysis.code, analysis.env_vars, analysis.warnings), f)
+            os.replace(f.name, entry_path)
+        except OSError as e:
+            logger.debug(f"Failed to write BUILD file analysis cache entry {entry_path}: {e}")
+            return
+
+        with self._lock:
+            self._writes_until_eviction -= 1
+            if self._writes_until_eviction > 0:
+                return
+            self._writes_until_eviction = max(1, self._max_entries // 10)
+        self._evict()
+
+    def _evict(self) -> None:
+        assert self._directory is not None
+        entries: list[tuple[float, str]] = []
+        try:
+            for shard in os.scandir(self._directory):
+                if shard.is_dir():
+                    entries.extend((e.stat().st_mtime, e.path) for e in os.scandir(shard.path))
+        except OSError as e:
+            logger.debug(f"Failed to scan the BUILD file analysis cache {self._directory}: {e}")
+            return
+        if len(entries) <= self._max_entries:
+            return
+        # Evict down to 90% of the limit, so that eviction is not triggered again immediately.
+        entries.sort()
+        for _, path in entries[: len(entries) - (self._max_entries * 9) // 10]:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
 @rule(desc="Search for addresses in BUILD files")
 async def parse_address_family(
     directory: AddressFamilyDir,
@@ -318,6 +454,7 @@ async def parse_address_family(
     union_membership: UnionMembership,
     maybe_build_file_dependency_rules_implementation: MaybeBuildFileDependencyRulesImplementation,
     session_values: SessionValues,
+    build_file_analysis_cache: BuildFileAnalysisCache,
 ) -> OptionalAddressFamily:
     """Given an AddressMapper and a directory, return an AddressFamily.
 
@@ -379,18 +516,22 @@ async def parse_address_family(
         dependents_rules_parser_state = None
         dependencies_rules_parser_state = None
 
+    analyses = [build_file_analysis_cache.analyze(fc) for fc in digest_contents]
+    for analysis in analyses:
+        analysis.log_warnings()
+
     def _extract_env_vars(
-        file_content: FileContent, extra_env: Sequence[str], env: CompleteEnvironmentVars
+        analysis: BuildFileAnalysis, extra_env: Sequence[str], env: CompleteEnvironmentVars
     ) -> Coroutine[Any, Any, EnvironmentVars]:
         """For BUILD file env vars, we only ever consult the local systems env."""
-        env_vars = (*BUILDFileEnvVarExtractor.get_env_vars(file_content), *extra_env)
+        env_vars = (*analysis.env_vars, *extra_env)
         return environment_vars_subset(EnvironmentVarsRequest(env_vars), env)
 
     all_env_vars = await concurrently(
         _extract_env_vars(
-            fc, prelude_symbols.referenced_env_vars, session_values[CompleteEnvironmentVars]
+            analysis, prelude_symbols.referenced_env_vars, session_values[CompleteEnvironmentVars]
         )
-        for fc in digest_contents
+        for analysis in analyses
     )
 
     declared_address_maps = [
@@ -404,8 +545,9 @@ async def parse_address_family(
             defaults_parser_state,
             dependents_rules_parser_state,
             dependencies_rules_parser_state,
+            code=analysis.code,
         )
-        for fc, env_vars in zip(digest_contents, all_env_vars)
+        for fc, analysis, env_vars in zip(digest_contents, analyses, all_env_vars)
     ]
     declared_address_maps.sort(key=lambda x: x.path)
 
@@ -19,6 +19,8 @@ from pants.engine.env_vars import CompleteEnvironmentVars, EnvironmentVars
 from pants.engine.fs import DigestContents, FileContent
 from pants.engine.internals.build_files import (
     AddressFamilyDir,
+    BuildFileAnalysis,
+    BuildFileAnalysisCache,
     BUILDFileEnvVarExtractor,
     BuildFileOptions,
     BuildFileSyntaxError,
@@ -74,6 +76,7 @@ def test_parse_address_family_empty() -> None:
             UnionMembership.empty(),
             MaybeBuildFileDependencyRulesImplementation(None),
             SessionValues({CompleteEnvironmentVars: CompleteEnvironmentVars({})}),
+            BuildFileAnalysisCache(None),
         ],
         mock_calls={
             "pants.engine.intrinsics.get_digest_contents": lambda __implicitly: DigestContents(
@@ -113,6 +116,7 @@ def test_extend_synthetic_target() -> None:
             UnionMembership.empty(),
             MaybeBuildFileDependencyRulesImplementation(None),
             SessionValues({CompleteEnvironmentVars: CompleteEnvironmentVars({})}),
+            BuildFileAnalysisCache(None),
         ],
         mock_calls={
             "pants.engine.intrinsics.get_digest_contents": lambda __implicitly: DigestContents(
@@ -191,6 +195,7 @@ def run_prelude_parsing_rule(prelude_content: str) -> BuildFilePreludeSymbols:
                 object_aliases=BuildFileAliases(),
                 ignore_unrecognized_symbols=False,
             ),
+            BuildFileAnalysisCache(None),
         ],
         mock_calls={
             "pants.engine.intrinsics.get_digest_contents": lambda __implicitly: DigestContents(
@@ -889,6 +894,7 @@ def test_build_files_share_globals() -> None:
                 object_aliases=BuildFileAliases(),
                 ignore_unrecognized_symbols=False,
             ),
+            BuildFileAnalysisCache(None),
         ],
         mock_calls={
             "pants.engine.intrinsics.get_digest_contents": lambda _: DigestContents(
@@ -1181,6 +1187,47 @@ def test_build_file_syntax_error(filename, contents, expect_failure, expected_me
         BUILDFileEnvVarExtractor.get_env_vars(MockFileContent(filename, contents))
 
 
+def test_build_file_analysis_cache(tmp_path, monkeypatch) -> None:
+    cache_dir = tmp_path / "cache"
+    file_content = FileContent("src/BUILD", b"target(name=env('NAME'), tags=[env('TAG')])")
+    expected = BuildFileAnalysis.create(file_content)
+    assert expected.env_vars == ("NAME", "TAG")
+
+    analysis = BuildFileAnalysisCache(str(cache_dir)).analyze(file_content)
+    assert analysis == expected
+    entries = list(cache_dir.glob("*/*"))
+    assert len(entries) == 1
+
+    # A new cache instance (e.g. after a restart) loads the persisted entry rather than parsing.
+    analysis = BuildFileAnalysisCache(str(cache_dir)).analyze(file_content)
+    assert analysis.code.co_filename == "src/BUILD"
+    assert analysis.env_vars == expected.env_vars
+
+    # Corrupt entries are ignored and replaced.
+    entries[0].write_bytes(b"garbage")
+    assert BuildFileAnalysisCache(str(cache_dir)).analyze(file_content) == expected
+    assert BuildFileAnalysisCache(str(cache_dir)).analyze(file_content).env_vars == ("NAME", "TAG")
+
+    # The same content at a different path is a different entry, since the path is compiled into
+    # the code object.
+    BuildFileAnalysisCache(str(cache_dir)).analyze(FileContent("other/BUILD", file_content.content))
+    assert len(list(cache_dir.glob("*/*"))) == 2
+
+    # Entries written by another version of the analysis are not reused.
+    monkeypatch.setattr(
+        BuildFileAnalysisCache, "SCHEMA_VERSION", BuildFileAnalysisCache.SCHEMA_VERSION + 1
+    )
+    BuildFileAnalysisCache(str(cache_dir)).analyze(file_content)
+    assert len(list(cache_dir.glob("*/*"))) == 3
+
+
+def test_build_file_analysis_cache_eviction(tmp_path) -> None:
+    cache = BuildFileAnalysisCache(str(tmp_path), max_entries=10)
+    for i in range(25):
+        cache.analyze(FileContent(f"src/{i}/BUILD", b"target()"))
+    assert len(list(tmp_path.glob("*/*"))) <= 10
+
+
 def test_build_file_duplicate_declared_names() -> None:
     rule_runner = RuleRunner(
         rules=[QueryRule(AddressFamily, [AddressFamilyDir])],
@@ -3,8 +3,9 @@
 
 import itertools
 import os
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from textwrap import dedent
 
@@ -45,6 +46,7 @@ from pants.engine.streaming_workunit_handler import (
 from pants.engine.unions import UnionRule, union
 from pants.goal.run_tracker import RunTracker
 from pants.option.bootstrap_options import DEFAULT_EXECUTION_OPTIONS, DEFAULT_LOCAL_STORE_OPTIONS
+from pants.option.global_options import StreamingWorkunitsOverflowPolicy
 from pants.testutil.option_util import create_options_bootstrapper
 from pants.testutil.rule_runner import QueryRule, RuleRunner, engine_error
 from pants.util.dirutil import safe_mkdtemp
@@ -346,6 +348,70 @@ def test_streaming_workunits_reporting(tmp_path: Path) -> None:
     assert tracker.finished
 
 
+@dataclass
+class BlockedWorkunitTracker(WorkunitTracker):
+    """A WorkunitTracker which does not record anything until it is unblocked."""
+
+    unblocked: threading.Event = field(default_factory=threading.Event)
+
+    def __call__(self, **kwargs) -> None:
+        self.unblocked.wait()
+        super().__call__(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "overflow_policy",
+    [StreamingWorkunitsOverflowPolicy.coalesce, StreamingWorkunitsOverflowPolicy.drop],
+)
+def test_streaming_workunits_slow_callback(
+    tmp_path: Path, overflow_policy: StreamingWorkunitsOverflowPolicy
+) -> None:
+    scheduler = mk_scheduler(
+        tmp_path,
+        [fib, QueryRule(Fib, (int,))],
+        include_trace_on_error=False,
+        max_workunit_verbosity=LogLevel.INFO,
+    )
+    blocked_tracker = BlockedWorkunitTracker()
+    tracker = WorkunitTracker()
+    handler = StreamingWorkunitHandler(
+        scheduler,
+        run_tracker=new_run_tracker(),
+        callbacks=[blocked_tracker, tracker],
+        report_interval_seconds=0.01,
+        max_workunit_verbosity=LogLevel.INFO,
+        specs=Specs.empty(),
+        options_bootstrapper=create_options_bootstrapper([]),
+        allow_async_completion=False,
+        queue_size=1,
+        overflow_policy=overflow_policy,
+    )
+    with handler:
+        scheduler.product_request(Fib, subject=10)
+        # The blocked callback must not prevent the other callback from being called.
+        while handler.callback_stats()[1].calls < 5:
+            time.sleep(0.01)
+        blocked_tracker.unblocked.set()
+
+    blocked_stats, stats = handler.callback_stats()
+    assert tracker.finished
+    assert len(list(itertools.chain.from_iterable(tracker.finished_workunit_chunks))) == 11
+    assert stats.coalesced_batches == 0
+    assert stats.dropped_batches == 0
+
+    assert blocked_tracker.finished
+    assert blocked_stats.calls < stats.calls
+    assert blocked_stats.max_queue_depth <= 2
+    if overflow_policy == StreamingWorkunitsOverflowPolicy.coalesce:
+        assert blocked_stats.coalesced_batches > 0
+        # No workunits are lost by coalescing.
+        assert (
+            len(list(itertools.chain.from_iterable(blocked_tracker.finished_workunit_chunks))) == 11
+        )
+    else:
+        assert blocked_stats.dropped_batches > 0
+
+
 def test_streaming_workunits_parent_id_and_rule_metadata(tmp_path: Path) -> None:
     scheduler, tracker, handler = _fixture_for_rules(
         tmp_path,
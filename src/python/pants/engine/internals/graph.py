@@ -738,53 +738,69 @@ class CycleException(Exception):
         self.path = path
 
 
+def _may_contain_reportable_cycle(dependency_mapping: Mapping[Address, Sequence[Address]]) -> bool:
+    """Whether the dependency graph may contain a cycle which `_detect_cycles` would report.
+
+    File-level dependencies are cycle tolerant, so only cycles consisting entirely of target-level
+    addresses are reported. Every such cycle lies within a strongly connected component of the
+    subgraph of target-level addresses, which can be computed natively in O(V+E).
+    """
+    target_level_mapping = [
+        (address, [dep for dep in deps if not dep.is_file_target])
+        for address, deps in dependency_mapping.items()
+        if not address.is_file_target
+    ]
+    for component in native_engine.strongly_connected_components(target_level_mapping):
+        if len(component) > 1 or component[0] in dependency_mapping.get(component[0], ()):
+            return True
+    return False
+
+
 def _detect_cycles(
-    roots: tuple[Address, ...], dependency_mapping: dict[Address, tuple[Address, ...]]
+    roots: tuple[Address, ...], dependency_mapping: Mapping[Address, Sequence[Address]]
 ) -> None:
-    path_stack: OrderedSet[Address] = OrderedSet()
-    visited: set[Address] = set()
+    if not _may_contain_reportable_cycle(dependency_mapping):
+        return
 
-    def maybe_report_cycle(address: Address) -> None:
-        # NB: File-level dependencies are cycle tolerant.
-        if address.is_file_target or address not in path_stack:
-            return
-
-        # The path of the cycle is shorter than the entire path to the cycle: if the suffix of
-        # the path representing the cycle contains a file dep, it is ignored.
-        in_cycle = False
-        for path_address in path_stack:
-            if in_cycle and path_address.is_file_target:
-                # There is a file address inside the cycle: do not report it.
-                return
-            elif in_cycle:
-                # Not a file address.
+    # An iterative depth-first search, which reports the first cycle it finds in the current path
+    # from a root, unless the cycle contains a file-level address.
+    visited: set[Address] = set()
+    for root in roots:
+        if root in visited:
+            continue
+        visited.add(root)
+        path = [root]
+        # The index of each address in `path`, and the indexes of file-level addresses in `path`.
+        path_indexes = {root: 0}
+        file_indexes = [0] if root.is_file_target else []
+        dependency_iterators = [iter(dependency_mapping[root])]
+        while dependency_iterators:
+            address = next(dependency_iterators[-1], None)
+            if address is None:
+                dependency_iterators.pop()
+                del path_indexes[path.pop()]
+                if file_indexes and file_indexes[-1] == len(path):
+                    file_indexes.pop()
                 continue
-            else:
-                # We're entering the suffix of the path that contains the cycle if we've reached
-                # the address in question.
-                in_cycle = path_address == address
-        # If we did not break out early, it's because there were no file addresses in the cycle.
-        raise CycleException(address, (*path_stack, address))
-
-    def visit(address: Address):
-        if address in visited:
-            maybe_report_cycle(address)
-            return
-        path_stack.add(address)
-        visited.add(address)
-
-        for dep_address in dependency_mapping[address]:
-            visit(dep_address)
 
-        path_stack.remove(address)
+            if address in visited:
+                index = path_indexes.get(address)
+                # NB: File-level dependencies are cycle tolerant: the cycle is only reported if
+                # neither the address nor any address after it in the path is a file address.
+                if (
+                    index is not None
+                    and not address.is_file_target
+                    and not (file_indexes and file_indexes[-1] > index)
+                ):
+                    raise CycleException(address, (*path, address))
+                continue
 
-    for root in roots:
-        visit(root)
-        if path_stack:
-            raise AssertionError(
-                f"The stack of visited nodes should have been empty at the end of recursion, "
-                f"but it still contained: {path_stack}"
-            )
+            visited.add(address)
+            path_indexes[address] = len(path)
+            if address.is_file_target:
+                file_indexes.append(len(path))
+            path.append(address)
+            dependency_iterators.append(iter(dependency_mapping[address]))
 
 
 @dataclass(frozen=True)
@@ -806,6 +822,14 @@ async def transitive_dependency_mapping(request: _DependencyMappingRequest) -> _
 
     Unlike a traditional BFS algorithm, we batch each round of traversals via `concurrently` for
     improved performance / concurrency.
+
+    NB: Each request walks its whole closure, even though the closures of different roots often
+    share most of their targets. Closures are not memoized per address (and assembled from the
+    closures of their dependencies), because dependency cycles are legal, while a cycle between
+    memoized rule calls is an error in the engine. Memoizing them per strongly connected component
+    would not help either, since finding the component of an address requires walking everything
+    reachable from it. The dependencies of each target are memoized though, so walking a closure
+    again does not resolve any dependencies again.
     """
     roots_as_targets = await resolve_unexpanded_targets(Addresses(request.tt_request.roots))
     visited: OrderedSet[Target] = OrderedSet()
@@ -1052,7 +1076,7 @@ async def resolve_coarsened_targets(
 
             # For each member of the component, include the CoarsenedTarget for each of its external
             # dependencies.
-            coarsened_target = CoarsenedTarget(
+            coarsened_target = CoarsenedTarget.create(
                 (addresses_to_targets[a] for a in component),
                 (
                     coarsened_targets[d]
@@ -1120,6 +1144,40 @@ def _log_or_raise_unmatched_owners(
         raise ResolveError(msg)
 
 
+def _index_files_by_ancestor_dir(files: Iterable[str]) -> dict[str, list[str]]:
+    """Index file paths by every directory containing them, including the build root (`""`).
+
+    A target's `sources` may never escape its own directory, so only the files found under a
+    target's `spec_path` need to be matched against its globs. Using this index turns owner
+    matching from O(targets × files) into roughly O(targets × files-under-each-target).
+    """
+    result: DefaultDict[str, list[str]] = defaultdict(list)
+    for file in files:
+        directory = os.path.dirname(file)
+        while True:
+            result[directory].append(file)
+            if not directory:
+                break
+            directory = os.path.dirname(directory)
+    return result
+
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _match_owned_files(sources_field: SourcesField, candidate_files: Sequence[str]) -> set[str]:
+    """Return the subset of `candidate_files` matched by the globs of `sources_field`."""
+    if not candidate_files:
+        return set()
+    filespec = sources_field.filespec
+    includes = filespec["includes"]
+    if not filespec.get("excludes") and not any(_GLOB_CHARS.intersection(g) for g in includes):
+        # Literal paths, such as the single `source` of a file-level generated target, can be
+        # checked by membership without going through the glob matcher.
+        return set(includes).intersection(candidate_files)
+    return set(sources_field.filespec_matcher.matches(list(candidate_files)))
+
+
 @dataclass(frozen=True)
 class TargetSourceBlocks:
     address: Address
@@ -1309,23 +1367,30 @@ async def find_owners(
             candidate_tgts = deleted_candidate_tgts
             sources_set = deleted_files
 
-        build_file_addresses = await concurrently(
-            find_build_file(
-                BuildFileAddressRequest(
-                    tgt.address, description_of_origin="<owners rule - cannot trigger>"
+        # BUILD file addresses are only consulted when BUILD files may themselves claim ownership.
+        build_file_paths: Sequence[str | None]
+        if owners_request.match_if_owning_build_file_included_in_sources:
+            build_file_addresses = await concurrently(
+                find_build_file(
+                    BuildFileAddressRequest(
+                        tgt.address, description_of_origin="<owners rule - cannot trigger>"
+                    )
                 )
+                for tgt in candidate_tgts
             )
-            for tgt in candidate_tgts
-        )
+            build_file_paths = [bfa.rel_path for bfa in build_file_addresses]
+        else:
+            build_file_paths = [None] * len(candidate_tgts)
 
-        for candidate_tgt, bfa in zip(candidate_tgts, build_file_addresses):
-            matching_files = set(
-                candidate_tgt.get(SourcesField).filespec_matcher.matches(list(sources_set))
+        files_by_dir = _index_files_by_ancestor_dir(sources_set)
+        for candidate_tgt, build_file_path in zip(candidate_tgts, build_file_paths):
+            matching_files = _match_owned_files(
+                candidate_tgt.get(SourcesField),
+                files_by_dir.get(candidate_tgt.address.spec_path, ()),
             )
 
             if not matching_files and not (
-                owners_request.match_if_owning_build_file_included_in_sources
-                and bfa.rel_path in sources_set
+                build_file_path is not None and build_file_path in sources_set
             ):
                 continue
 
@@ -28,6 +28,8 @@ from pants.engine.internals.graph import (
     TransitiveExcludesNotSupportedError,
     _DependencyMapping,
     _DependencyMappingRequest,
+    _detect_cycles,
+    _index_files_by_ancestor_dir,
     _TargetParametrizations,
     hydrate_sources,
     warn_deprecated_field_type,
@@ -629,6 +631,26 @@ def test_dep_cycle_indirect(transitive_targets_rule_runner: RuleRunner) -> None:
     )
 
 
+def test_detect_cycles_deep_chain() -> None:
+    # Deeper than the default Python recursion limit.
+    chain = [Address("", target_name=f"t{i}") for i in range(5000)]
+    dependency_mapping = {a: (b,) for a, b in zip(chain, chain[1:])}
+    dependency_mapping[chain[-1]] = ()
+    _detect_cycles((chain[0],), dependency_mapping)
+
+    dependency_mapping[chain[-1]] = (chain[1],)
+    with pytest.raises(CycleException) as e:
+        _detect_cycles((chain[0],), dependency_mapping)
+    assert e.value.subject == chain[1]
+    assert e.value.path == (*chain, chain[1])
+
+    # Cycles through file-level addresses are tolerated.
+    file_address = Address("", target_name="f", relative_file_path="f.txt")
+    dependency_mapping[chain[-1]] = (file_address,)
+    dependency_mapping[file_address] = (chain[1],)
+    _detect_cycles((chain[0],), dependency_mapping)
+
+
 def test_dep_no_cycle_indirect(transitive_targets_rule_runner: RuleRunner) -> None:
     transitive_targets_rule_runner.write_files(
         {
@@ -984,6 +1006,39 @@ def test_owners_build_file(owners_rule_runner: RuleRunner) -> None:
     )
 
 
+def test_owners_nested_directories(owners_rule_runner: RuleRunner) -> None:
+    owners_rule_runner.write_files(
+        {
+            "demo/f.txt": "",
+            "demo/sub/f.txt": "",
+            "demo/BUILD": "target(name='recursive', sources=['**/*.txt'])",
+            "demo/sub/BUILD": "generator(name='generator', sources=['*.txt'])",
+        }
+    )
+    assert_owners(
+        owners_rule_runner,
+        ["demo/f.txt", "demo/sub/f.txt"],
+        expected={
+            Address("demo", target_name="recursive"),
+            Address("demo/sub", target_name="generator", relative_file_path="f.txt"),
+        },
+    )
+    assert_owners(
+        owners_rule_runner,
+        ["demo/f.txt"],
+        expected={Address("demo", target_name="recursive")},
+    )
+
+
+def test_index_files_by_ancestor_dir() -> None:
+    index = _index_files_by_ancestor_dir(["a/b/f.txt", "a/g.txt", "h.txt"])
+    assert index == {
+        "": ["a/b/f.txt", "a/g.txt", "h.txt"],
+        "a": ["a/b/f.txt", "a/g.txt"],
+        "a/b": ["a/b/f.txt"],
+    }
+
+
 # -----------------------------------------------------------------------------------------------
 # Test file-level target generation and parameterization.
 # -----------------------------------------------------------------------------------------------
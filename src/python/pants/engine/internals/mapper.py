@@ -6,6 +6,7 @@ from __future__ import annotations
 import os.path
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
+from types import CodeType
 from typing import TypeVar
 
 from pants.backend.project_info.filter_targets import FilterSubsystem
@@ -59,6 +60,8 @@ class AddressMap:
         defaults: BuildFileDefaultsParserState,
         dependents_rules: BuildFileDependencyRulesParserState | None,
         dependencies_rules: BuildFileDependencyRulesParserState | None,
+        *,
+        code: CodeType | None = None,
     ) -> AddressMap:
         """Parses a source for targets.
 
@@ -75,6 +78,7 @@ class AddressMap:
                 defaults,
                 dependents_rules,
                 dependencies_rules,
+                code=code,
             )
         except Exception as e:
             raise MappingError(f"Failed to parse ./{filepath}:\n{type(e).__name__}: {e}")
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import builtins
 import inspect
 import itertools
 import logging
@@ -12,11 +13,12 @@ import tokenize
 import traceback
 import typing
 from annotationlib import Format, ForwardRef, call_annotate_function
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import InitVar, dataclass, field
 from difflib import get_close_matches
 from io import StringIO
 from pathlib import PurePath
+from types import CodeType
 from typing import Annotated, Any, TypeVar
 
 import typing_extensions
@@ -431,7 +433,14 @@ class Parser:
         defaults: BuildFileDefaultsParserState,
         dependents_rules: BuildFileDependencyRulesParserState | None,
         dependencies_rules: BuildFileDependencyRulesParserState | None,
+        *,
+        code: CodeType | None = None,
     ) -> list[TargetAdaptor]:
+        """Parse the targets of a BUILD file.
+
+        If `code` is given, it must be the result of compiling `build_file_content`, and is used
+        rather than compiling the content again.
+        """
         self._parse_state.reset(
             filepath=filepath,
             is_bootstrap=is_bootstrap,
@@ -446,11 +455,21 @@ class Parser:
             **extra_symbols.symbols,
         }
 
+        if code is None:
+            code = compile(build_file_content, filepath, "exec", dont_inherit=True)
+
         if self.ignore_unrecognized_symbols:
+            # Define placeholders for every name the code may look up but which is not otherwise
+            # defined, so that the BUILD file only needs to be executed once. The retry loop below
+            # remains as a fallback for any names that this does not account for.
             defined_symbols = set()
+            for name in _referenced_names(code):
+                if name not in global_symbols and not hasattr(builtins, name):
+                    global_symbols[name] = _UnrecognizedSymbol(name)
+                    defined_symbols.add(name)
+
             while True:
                 try:
-                    code = compile(build_file_content, filepath, "exec", dont_inherit=True)
                     exec(code, global_symbols)
                 except NameError as e:
                     bad_symbol = _extract_symbol_from_name_error(e)
@@ -477,7 +496,6 @@ class Parser:
             return self._parse_state.parsed_targets()
 
         try:
-            code = compile(build_file_content, filepath, "exec", dont_inherit=True)
             exec(code, global_symbols)
         except NameError as e:
             frame = traceback.extract_tb(e.__traceback__, limit=-1)[0]
@@ -530,6 +548,18 @@ def error_on_imports(build_file_content: str, filepath: str) -> None:
         )
 
 
+def _referenced_names(code: CodeType) -> Iterator[str]:
+    """The names referenced by a code object and by any code objects nested within it.
+
+    These are the names which may be looked up as globals (as well as attribute names, which are
+    harmless to include).
+    """
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield from _referenced_names(const)
+
+
 def _extract_symbol_from_name_error(err: NameError) -> str:
     result = re.match(r"^name '(\w*)'", err.args[0])
     if result is None:
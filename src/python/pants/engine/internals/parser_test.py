@@ -171,6 +171,40 @@ def test_unrecognized_symbol_during_bootstrap_issue_19156(
         TestField(raw_field, Address(""))
 
 
+def test_unrecognized_symbols_during_bootstrap_single_execution(
+    defaults_parser_state: BuildFileDefaultsParserState,
+) -> None:
+    calls = []
+    parser = Parser(
+        build_root="",
+        registered_target_types=RegisteredTargetTypes({"tgt": GenericTarget}),
+        union_membership=UnionMembership.empty(),
+        object_aliases=BuildFileAliases(objects={"record_call": lambda: calls.append(1)}),
+        ignore_unrecognized_symbols=True,
+    )
+    target_adaptors = parser.parse(
+        "dir/BUILD",
+        dedent(
+            """\
+            record_call()
+            def macro():
+                return fake2()
+            tgt(field=fake1(), other=macro())
+            """
+        ),
+        BuildFilePreludeSymbols.create({}, ()),
+        EnvironmentVars({}),
+        False,
+        defaults_parser_state,
+        dependents_rules=None,
+        dependencies_rules=None,
+    )
+
+    assert len(calls) == 1
+    assert len(target_adaptors) == 1
+    assert "field" not in target_adaptors[0].kwargs
+
+
 def test_unknown_target_for_defaults_during_bootstrap_issue_19445(
     defaults_parser_state: BuildFileDefaultsParserState,
 ) -> None:
@@ -9,6 +9,7 @@ from typing import Any, final
 
 from pants.build_graph.address import Address
 from pants.engine.engine_aware import EngineAwareParameter
+from pants.util import interning
 from pants.util.frozendict import FrozenDict
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.vcs.hunk import TextBlock
@@ -102,6 +103,10 @@ class TargetAdaptor:
     ) -> None:
         self.type_alias = type_alias
         self.name = name
+        # The strings in field values are very often repeated between targets (e.g. dependencies,
+        # tags and resolves), and adaptors are kept in memory for as long as their BUILD file is
+        # unchanged, so intern them.
+        kwargs = {k: interning.FIELD_VALUES.intern_values(v) for k, v in kwargs.items()}
         try:
             self.kwargs = FrozenDict.deep_freeze(kwargs)
         except TypeError as e:
@@ -0,0 +1,23 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from pants.engine.internals.target_adaptor import TargetAdaptor
+
+
+def test_target_adaptor_interns_field_values() -> None:
+    # Build equal strings at runtime, so that they are distinct objects.
+    adaptors = [
+        TargetAdaptor(
+            "tgt",
+            "name",
+            "BUILD:1",
+            resolve="".join(["python", "-default"]),
+            tags=["".join(["t", "ag"])],
+        )
+        for _ in range(2)
+    ]
+    assert adaptors[0].kwargs["resolve"] is adaptors[1].kwargs["resolve"]
+    assert adaptors[0].kwargs["tags"] == ("tag",)
+    assert adaptors[0].kwargs["tags"][0] is adaptors[1].kwargs["tags"][0]
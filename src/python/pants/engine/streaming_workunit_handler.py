@@ -5,7 +5,9 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any
@@ -22,6 +24,7 @@ from pants.engine.rules import QueryRule, collect_rules, implicitly, rule
 from pants.engine.target import Targets
 from pants.engine.unions import UnionMembership, union
 from pants.goal.run_tracker import RunTracker
+from pants.option.global_options import StreamingWorkunitsOverflowPolicy
 from pants.option.options_bootstrapper import OptionsBootstrapper
 from pants.util.logging import LogLevel
 from pants.util.strutil import softwrap
@@ -156,6 +159,14 @@ class StreamingWorkunitContext:
 
 
 class WorkunitsCallback(ABC):
+    """Receives the workunits of a run from the `StreamingWorkunitHandler`.
+
+    Each callback is called on its own dedicated thread. Calls to a single callback never overlap,
+    but different callbacks may be called at the same time, and in any order relative to each
+    other. So implementations must be thread-safe with respect to each other: any state shared
+    between callbacks (including module-level state) must be synchronized.
+    """
+
     @abstractmethod
     def __call__(
         self,
@@ -232,7 +243,8 @@ async def construct_workunits_callback_factories(
 
 
 class StreamingWorkunitHandler:
-    """Periodically calls each registered WorkunitsCallback in a dedicated thread.
+    """Periodically polls for workunits, and calls each registered WorkunitsCallback with them in
+    its own dedicated thread.
 
     This class should be used as a context manager.
     """
@@ -247,6 +259,8 @@ class StreamingWorkunitHandler:
         report_interval_seconds: float,
         allow_async_completion: bool,
         max_workunit_verbosity: LogLevel,
+        queue_size: int = 64,
+        overflow_policy: StreamingWorkunitsOverflowPolicy = StreamingWorkunitsOverflowPolicy.block,
     ) -> None:
         scheduler = scheduler.isolated_shallow_clone("streaming_workunit_handler_session")
         self.callbacks = callbacks
@@ -266,11 +280,19 @@ class StreamingWorkunitHandler:
                 #  setting.
                 max_workunit_verbosity=max_workunit_verbosity,
                 allow_async_completion=allow_async_completion,
+                queue_size=queue_size,
+                overflow_policy=overflow_policy,
             )
             if callbacks
             else None
         )
 
+    def callback_stats(self) -> tuple[CallbackStats, ...]:
+        """Statistics about the calls made so far to each callback, in the order of `callbacks`."""
+        if not self.thread_runner:
+            return ()
+        return tuple(worker.stats for worker in self.thread_runner.workers)
+
     def __enter__(self) -> None:
         if not self.thread_runner:
             return
@@ -284,6 +306,113 @@ class StreamingWorkunitHandler:
             self.thread_runner.join()
 
 
+@dataclass
+class CallbackStats:
+    """Statistics about the calls to a WorkunitsCallback, to help find callbacks which fall
+    behind."""
+
+    calls: int = 0
+    coalesced_batches: int = 0
+    dropped_batches: int = 0
+    max_queue_depth: int = 0
+    total_latency_seconds: float = 0.0
+    max_latency_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class _WorkunitsBatch:
+    started_workunits: tuple[Workunit, ...]
+    completed_workunits: tuple[Workunit, ...]
+    finished: bool
+
+    def merge(self, later: _WorkunitsBatch) -> _WorkunitsBatch:
+        return _WorkunitsBatch(
+            started_workunits=(*self.started_workunits, *later.started_workunits),
+            completed_workunits=(*self.completed_workunits, *later.completed_workunits),
+            finished=later.finished,
+        )
+
+
+class _CallbackWorker(threading.Thread):
+    """Calls a single WorkunitsCallback with the batches of workunits which are queued for it."""
+
+    def __init__(
+        self,
+        callback: WorkunitsCallback,
+        context: StreamingWorkunitContext,
+        thread_locals: PyThreadLocals,
+        queue_size: int,
+        overflow_policy: StreamingWorkunitsOverflowPolicy,
+    ) -> None:
+        super().__init__(daemon=True, name=f"workunit-stream-{type(callback).__name__}")
+        self.callback = callback
+        self.context = context
+        self.thread_locals = thread_locals
+        self.queue_size = max(queue_size, 1)
+        self.overflow_policy = overflow_policy
+        self.stats = CallbackStats()
+        self._batches: deque[_WorkunitsBatch] = deque()
+        self._condition = threading.Condition()
+        self._failed = False
+
+    def put(self, batch: _WorkunitsBatch) -> None:
+        with self._condition:
+            if self._failed:
+                return
+            # NB: The final batch is always queued immediately, so that waiting for it to be
+            # queued for this callback never delays the final call to another callback.
+            if len(self._batches) >= self.queue_size and not batch.finished:
+                if self.overflow_policy == StreamingWorkunitsOverflowPolicy.coalesce:
+                    self._batches[-1] = self._batches[-1].merge(batch)
+                    self.stats.coalesced_batches += 1
+                    return
+                if self.overflow_policy == StreamingWorkunitsOverflowPolicy.drop:
+                    self.stats.dropped_batches += 1
+                    return
+                self._condition.wait_for(
+                    lambda: len(self._batches) < self.queue_size or self._failed
+                )
+                if self._failed:
+                    return
+            self._batches.append(batch)
+            self.stats.max_queue_depth = max(self.stats.max_queue_depth, len(self._batches))
+            self._condition.notify_all()
+
+    def _take(self) -> _WorkunitsBatch:
+        with self._condition:
+            self._condition.wait_for(lambda: bool(self._batches))
+            batch = self._batches.popleft()
+            self._condition.notify_all()
+            return batch
+
+    def run(self) -> None:
+        self.thread_locals.set_for_current_thread()
+        try:
+            while True:
+                batch = self._take()
+                start = time.monotonic()
+                self.callback(
+                    started_workunits=batch.started_workunits,
+                    completed_workunits=batch.completed_workunits,
+                    finished=batch.finished,
+                    context=self.context,
+                )
+                latency = time.monotonic() - start
+                self.stats.calls += 1
+                self.stats.total_latency_seconds += latency
+                self.stats.max_latency_seconds = max(self.stats.max_latency_seconds, latency)
+                if batch.finished:
+                    logger.debug(f"Workunits callback {self.callback} completed: {self.stats}")
+                    return
+        except BaseException:
+            # Stop accepting batches, so that polling is never blocked on this callback.
+            with self._condition:
+                self._failed = True
+                self._batches.clear()
+                self._condition.notify_all()
+            raise
+
+
 class _InnerHandler(threading.Thread):
     def __init__(
         self,
@@ -293,56 +422,79 @@ class _InnerHandler(threading.Thread):
         report_interval: float,
         max_workunit_verbosity: LogLevel,
         allow_async_completion: bool,
+        queue_size: int,
+        overflow_policy: StreamingWorkunitsOverflowPolicy,
     ) -> None:
         super().__init__(daemon=True, name="workunit-stream")
         self.scheduler = scheduler
         self.context = context
         self.stop_request = threading.Event()
         self.report_interval = report_interval
-        self.callbacks = callbacks
         self.max_workunit_verbosity = max_workunit_verbosity
-        # TODO: Have a thread per callback so that some callbacks can always finish async even
-        #  if others must be finished synchronously.
-        self.block_until_complete = not allow_async_completion or any(
-            callback.can_finish_async is False for callback in self.callbacks
-        )
         # Get the parent thread's thread locals. Note that this thread has not yet started
         # as we are only in the constructor.
         self.thread_locals = PyThreadLocals.get_for_current_thread()
+        self.workers = tuple(
+            _CallbackWorker(
+                callback,
+                context=context,
+                thread_locals=self.thread_locals,
+                queue_size=queue_size,
+                overflow_policy=overflow_policy,
+            )
+            for callback in callbacks
+        )
+        # Only the callbacks which cannot finish async are waited for at the end of the run.
+        self.blocking_workers = tuple(
+            worker
+            for worker in self.workers
+            if not allow_async_completion or worker.callback.can_finish_async is False
+        )
 
     def poll_workunits(self, *, finished: bool) -> None:
         workunits = self.scheduler.poll_workunits(self.max_workunit_verbosity)
-        for callback in self.callbacks:
-            callback(
-                started_workunits=workunits["started"],
-                completed_workunits=workunits["completed"],
-                finished=finished,
-                context=self.context,
-            )
+        batch = _WorkunitsBatch(
+            started_workunits=workunits["started"],
+            completed_workunits=workunits["completed"],
+            finished=finished,
+        )
+        for worker in self.workers:
+            worker.put(batch)
 
     def run(self) -> None:
         # First, set the thread's thread locals to the parent thread's in order to propagate the
         # console, workunit stores, etc.
         self.thread_locals.set_for_current_thread()
+        for worker in self.workers:
+            worker.start()
         while not self.stop_request.is_set():
             self.poll_workunits(finished=False)
             self.stop_request.wait(timeout=self.report_interval)
         else:
             # Make one final call. Note that this may run after the Pants run has already
-            # completed, depending on whether the thread was joined or not.
+            # completed, depending on whether the threads were joined or not.
             self.poll_workunits(finished=True)
 
+    def join(self, timeout: float | None = None) -> None:
+        """Wait for the final poll, and then for every callback to complete."""
+        super().join(timeout)
+        for worker in self.workers:
+            worker.join(timeout)
+
     def end(self) -> None:
         self.stop_request.set()
-        if self.block_until_complete:
+        if len(self.blocking_workers) < len(self.workers):
             logger.debug(
-                "Async completion is disabled: waiting for workunit callbacks to complete..."
+                "Async completion is enabled: workunit callbacks will complete in the background."
             )
-            super().join()
-        else:
+        if self.blocking_workers:
             logger.debug(
-                "Async completion is enabled: workunit callbacks will complete in the background."
+                f"Async completion is disabled for {len(self.blocking_workers)} workunit "
+                "callbacks: waiting for them to complete..."
             )
+            super().join()
+            for worker in self.blocking_workers:
+                worker.join()
 
 
 def rules():
@@ -11,12 +11,14 @@ import itertools
 import logging
 import os.path
 import textwrap
+import weakref
 import zlib
 from abc import ABC, ABCMeta, abstractmethod
 from collections import deque
 from collections.abc import Callable, Iterable, Iterator, KeysView, Mapping, Sequence
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from operator import attrgetter
 from pathlib import PurePath
 from typing import (
@@ -155,6 +157,33 @@ class FieldDefaults:
 _F = TypeVar("_F", bound=Field)
 
 
+# `Field` instances keyed by their type, the `spec_path` of their address and the identity of their
+# raw value. The raw value is stored alongside each field, both to confirm that the identity matches
+# and to keep it alive.
+SharedFields = dict[tuple[type[Field], str, int], tuple[Any, Field]]
+
+
+def _create_field(
+    field_type: type[Field], raw_value: Any, address: Address, shared_fields: SharedFields | None
+) -> Field:
+    """Create a field, or reuse an identical one from `shared_fields`.
+
+    A `Field` which does not store its `Address` may still use it when computing its value, e.g.
+    `PexExecutableField` resolves its value relative to `address.spec_path`. Other than in error
+    messages, fields only use the `spec_path` of their address, so a field may be shared by all
+    targets in the same directory with the same raw value for it.
+    """
+    if shared_fields is None or issubclass(field_type, AsyncFieldMixin):
+        return field_type(raw_value, address)
+    key = (field_type, address.spec_path, id(raw_value))
+    shared = shared_fields.get(key)
+    if shared is not None and shared[0] is raw_value:
+        return shared[1]
+    field = field_type(raw_value, address)
+    shared_fields[key] = (raw_value, field)
+    return field
+
+
 @dataclass(frozen=True)
 class Target:
     """A Target represents an addressable set of metadata.
@@ -198,6 +227,7 @@ class Target:
         ignore_unrecognized_fields: bool = False,
         description_of_origin: str | None = None,
         origin_sources_blocks: FrozenDict[str, SourceBlocks] = FrozenDict(),
+        shared_fields: SharedFields | None = None,
     ) -> None:
         """Create a target.
 
@@ -217,6 +247,9 @@ class Target:
             intended for when Pants is bootstrapping itself.
         :param description_of_origin: Where this target was declared, such as a path to BUILD file
             and line number.
+        :param shared_fields: Used to share `Field` instances between targets which are created
+            from the same raw values, such as the targets generated by a single target generator.
+            Fields which store their `Address` (i.e. `AsyncFieldMixin`s) are never shared.
         """
         if self.removal_version and not address.is_generated_target:
             if not self.removal_hint:
@@ -251,6 +284,7 @@ class Target:
                     address,
                     union_membership,
                     ignore_unrecognized_fields=ignore_unrecognized_fields,
+                    shared_fields=shared_fields,
                 ),
             )
 
@@ -269,6 +303,7 @@ class Target:
         union_membership: UnionMembership | None,
         *,
         ignore_unrecognized_fields: bool,
+        shared_fields: SharedFields | None = None,
     ) -> FrozenDict[type[Field], Field]:
         all_field_types = self.class_field_types(union_membership)
         field_values = {}
@@ -293,13 +328,13 @@ class Target:
                     f"the target type `{self.alias}`: {sorted(valid_aliases)}.",
                 )
             field_type = aliases_to_field_types[alias]
-            field_values[field_type] = field_type(value, address)
+            field_values[field_type] = _create_field(field_type, value, address, shared_fields)
 
         # For undefined fields, mark the raw value as missing.
         for field_type in all_field_types:
             if field_type in field_values:
                 continue
-            field_values[field_type] = field_type(NO_VALUE, address)
+            field_values[field_type] = _create_field(field_type, NO_VALUE, address, shared_fields)
         return FrozenDict(
             sorted(
                 field_values.items(),
@@ -747,6 +782,27 @@ class CoarsenedTarget(EngineAwareParameter):
         self.dependencies = FrozenOrderedSet(dependencies)
         self._hashcode = hash((self.members, self.dependencies))
 
+    @classmethod
+    def create(
+        cls, members: Iterable[Target], dependencies: Iterable[CoarsenedTarget]
+    ) -> CoarsenedTarget:
+        """Create a CoarsenedTarget, or return a live instance which is equal to it.
+
+        Sharing instances means that the CoarsenedTargets computed for different roots share the
+        CoarsenedTargets of their common dependencies, so comparing those (e.g. when they are used
+        as rule parameters) is an identity check rather than a walk of the DAG below them.
+        """
+        members = FrozenOrderedSet(members)
+        dependencies = FrozenOrderedSet(dependencies)
+        # NB: The instance which is stored holds its dependencies alive, so their ids cannot be
+        # reused while the key is present.
+        key = (members, tuple(id(d) for d in dependencies))
+        coarsened_target = _COARSENED_TARGETS.get(key)
+        if coarsened_target is None:
+            coarsened_target = cls(members, dependencies)
+            _COARSENED_TARGETS[key] = coarsened_target
+        return coarsened_target
+
     def debug_hint(self) -> str:
         return str(self)
 
@@ -819,6 +875,13 @@ class CoarsenedTarget(EngineAwareParameter):
         return f"{self.__class__.__name__}({str(self)})"
 
 
+# Live CoarsenedTarget instances, keyed by their members and the identities of their dependencies.
+# See `CoarsenedTarget.create`.
+_COARSENED_TARGETS: weakref.WeakValueDictionary[
+    tuple[FrozenOrderedSet[Target], tuple[int, ...]], CoarsenedTarget
+] = weakref.WeakValueDictionary()
+
+
 class CoarsenedTargets(Collection[CoarsenedTarget]):
     """The CoarsenedTarget roots of a transitive graph walk for some addresses.
 
@@ -829,15 +892,20 @@ class CoarsenedTargets(Collection[CoarsenedTarget]):
         """Compute a mapping from Address to containing CoarsenedTarget."""
         return {t.address: ct for ct in self for t in ct.members}
 
+    @cached_property
+    def _coarsened_closure(self) -> tuple[CoarsenedTarget, ...]:
+        # NB: Instances are usually memoized by the engine and consumed by multiple rules, so the
+        # walk is computed once per instance.
+        visited: set[CoarsenedTarget] = set()
+        return tuple(ct for root in self for ct in root.coarsened_closure(visited))
+
     def closure(self) -> Iterator[Target]:
         """All Targets reachable from these CoarsenedTarget roots."""
-        visited: set[CoarsenedTarget] = set()
-        return (t for root in self for t in root.closure(visited))
+        return (t for ct in self._coarsened_closure for t in ct.members)
 
     def coarsened_closure(self) -> Iterator[CoarsenedTarget]:
         """All CoarsenedTargets reachable from these CoarsenedTarget roots."""
-        visited: set[CoarsenedTarget] = set()
-        return (ct for root in self for ct in root.coarsened_closure(visited))
+        return iter(self._coarsened_closure)
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, CoarsenedTargets):
@@ -1250,6 +1318,10 @@ def _generate_file_level_targets(
         else FrozenOrderedSet()
     )
 
+    # The generated targets share the template's values for all fields other than their source and
+    # any overridden fields, and so can share a single instance of each such field.
+    shared_fields: SharedFields = {}
+
     def gen_tgt(address: Address, full_fp: str, generated_target_fields: dict[str, Any]) -> Target:
         if add_dependencies_on_all_siblings:
             if union_membership and not generated_target_cls.class_has_field(
@@ -1272,6 +1344,7 @@ def _generate_file_level_targets(
             address,
             union_membership=union_membership,
             residence_dir=os.path.dirname(full_fp),
+            shared_fields=shared_fields,
         )
 
     result = tuple(
@@ -42,6 +42,7 @@ from pants.engine.target import (
     OverridesField,
     ScalarField,
     SequenceField,
+    SharedFields,
     SingleSourceField,
     StringField,
     StringSequenceField,
@@ -529,11 +530,82 @@ def test_coarsened_target_closure() -> None:
     assert_closure([ct1, ct2, ct3], all_targets)
 
 
+def test_coarsened_target_create_shares_instances() -> None:
+    a, b = (FortranTarget({}, Address(name)) for name in string.ascii_lowercase[:2])
+
+    ct_a = CoarsenedTarget.create([a], [])
+    assert CoarsenedTarget.create([a], []) is ct_a
+    assert CoarsenedTarget.create([b], []) is not ct_a
+
+    ct_b = CoarsenedTarget.create([b], [ct_a])
+    assert CoarsenedTarget.create([b], [CoarsenedTarget.create([a], [])]) is ct_b
+    # An equal, but unshared, dependency results in an equal, but unshared, instance.
+    unshared = CoarsenedTarget.create([b], [CoarsenedTarget([a], [])])
+    assert unshared is not ct_b
+    assert unshared == ct_b
+
+
+def test_coarsened_targets_closure_is_repeatable() -> None:
+    a, b, c = (FortranTarget({}, Address(name)) for name in string.ascii_lowercase[:3])
+    ct1 = CoarsenedTarget([a], [])
+    ct2 = CoarsenedTarget([b], [ct1])
+    ct3 = CoarsenedTarget([c], [ct1])
+    cts = CoarsenedTargets([ct2, ct3])
+
+    assert list(cts.coarsened_closure()) == [ct2, ct1, ct3]
+    assert list(cts.coarsened_closure()) == [ct2, ct1, ct3]
+    assert list(cts.closure()) == [b, a, c]
+    assert list(cts.closure()) == [b, a, c]
+
+
 # -----------------------------------------------------------------------------------------------
 # Test file-level target generation
 # -----------------------------------------------------------------------------------------------
 
 
+def test_shared_fields() -> None:
+    class SharedStringField(StringField):
+        alias = "string"
+
+    class SharedStringSequenceField(StringSequenceField):
+        alias = "strings"
+
+    class MockTarget(Target):
+        alias = "tgt"
+        core_fields = (SharedStringField, SharedStringSequenceField, SingleSourceField)
+
+    template: dict[str, Any] = {"strings": ["a", "b"]}
+    shared_fields: SharedFields = {}
+    tgt1, tgt2, tgt3 = (
+        MockTarget(
+            {**template, **fields},
+            Address("dir", target_name="generator", relative_file_path=f"{i}.f"),
+            shared_fields=shared_fields,
+        )
+        for i, fields in enumerate(
+            [{"source": "0.f"}, {"source": "1.f"}, {"source": "2.f", "strings": ["a", "b"]}]
+        )
+    )
+
+    # Fields created from the same raw values are shared.
+    assert tgt1[SharedStringField] is tgt2[SharedStringField] is tgt3[SharedStringField]
+    assert tgt1[SharedStringSequenceField] is tgt2[SharedStringSequenceField]
+    # Equal, but distinct, raw values result in equal fields.
+    assert tgt1[SharedStringSequenceField] is not tgt3[SharedStringSequenceField]
+    assert tgt1[SharedStringSequenceField] == tgt3[SharedStringSequenceField]
+    # Fields may use the `spec_path` of their address, so are not shared across directories.
+    tgt4 = MockTarget(
+        {**template, "source": "3.f"},
+        Address("other_dir", target_name="generator", relative_file_path="3.f"),
+        shared_fields=shared_fields,
+    )
+    assert tgt1[SharedStringSequenceField] is not tgt4[SharedStringSequenceField]
+    assert tgt1[SharedStringSequenceField] == tgt4[SharedStringSequenceField]
+    # Fields which store their address are never shared.
+    assert tgt1[SingleSourceField].address == tgt1.address
+    assert tgt2[SingleSourceField].address == tgt2.address
+
+
 def test_generated_targets_address_validation() -> None:
     """Ensure that all addresses are well-formed."""
 
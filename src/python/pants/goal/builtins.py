@@ -8,6 +8,7 @@ from pants.goal import help
 from pants.goal.builtin_goal import BuiltinGoal
 from pants.goal.completion import CompletionBuiltinGoal
 from pants.goal.explorer import ExplorerBuiltinGoal
+from pants.goal.perf_diff import PerfDiffBuiltinGoal
 
 
 def register_builtin_goals(build_configuration: BuildConfiguration.Builder) -> None:
@@ -24,4 +25,5 @@ def builtin_goals() -> tuple[type[BuiltinGoal], ...]:
         help.ThingHelpAdvancedBuiltinGoal,
         help.UnknownGoalHelpBuiltinGoal,
         help.VersionHelpBuiltinGoal,
+        PerfDiffBuiltinGoal,
     )
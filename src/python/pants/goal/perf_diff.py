@@ -0,0 +1,143 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+
+from pants.base.exiter import PANTS_FAILED_EXIT_CODE, PANTS_SUCCEEDED_EXIT_CODE, ExitCode
+from pants.base.specs import Specs
+from pants.build_graph.build_configuration import BuildConfiguration
+from pants.engine.unions import UnionMembership
+from pants.goal.builtin_goal import BuiltinGoal
+from pants.goal.stats_history import (
+    MetricKind,
+    Regression,
+    RunStats,
+    StatsHistory,
+    find_regressions,
+    select_runs,
+    stats_history_path,
+)
+from pants.init.engine_initializer import GraphSession
+from pants.option.option_types import FloatOption, StrListOption, StrOption
+from pants.option.options import Options
+from pants.util.strutil import softwrap
+
+logger = logging.getLogger(__name__)
+
+
+def _describe_runs(runs: Sequence[RunStats]) -> str:
+    if len(runs) == 1:
+        return f"run {runs[0].run_id} (commit {runs[0].git_commit or 'unknown'})"
+    commits = sorted({run.git_commit or "unknown" for run in runs})
+    return f"{len(runs)} runs (commits {', '.join(commits)})"
+
+
+def _describe_regression(regression: Regression) -> str:
+    if regression.kind == MetricKind.cache_hit_rate:
+        change = f"{regression.change * 100:+.1f} points"
+    else:
+        change = f"{regression.change * 100:+.1f}%"
+    return (
+        f"  {regression.kind.value}\t{regression.name}\t"
+        f"{regression.base:.3f} -> {regression.head:.3f} ({change})"
+    )
+
+
+class PerfDiffBuiltinGoal(BuiltinGoal):
+    name = "perf-diff"
+    help = softwrap(
+        """
+        Compare the stats of recorded Pants runs, and report regressions in the time spent in
+        rules, in cache hit rates and in the percentiles of observation histograms.
+
+        Runs are only recorded when `[stats].record_history` is enabled.
+        """
+    )
+
+    head = StrOption(
+        default="1",
+        help=softwrap(
+            """
+            The runs to check for regressions: either a run id, or a number `N` to use the mean
+            of the latest `N` recorded runs.
+            """
+        ),
+    )
+    base = StrOption(
+        default="5",
+        help=softwrap(
+            """
+            The runs to compare to: either a run id, or a number `N` to use the mean of the `N`
+            recorded runs before the `--head` runs.
+            """
+        ),
+    )
+    run_goals = StrListOption(
+        help=softwrap(
+            """
+            Only compare runs which ran all of these goals. If unspecified, only runs which ran
+            the same goals as the latest recorded run are compared.
+            """
+        ),
+    )
+    threshold = FloatOption(
+        default=0.1,
+        help=softwrap(
+            """
+            Report times and percentiles which grow by more than this fraction, and cache hit
+            rates which drop by more than this fraction.
+            """
+        ),
+    )
+    min_seconds = FloatOption(
+        default=0.5,
+        help="Ignore times which are shorter than this many seconds in both the base and head.",
+    )
+
+    def run(
+        self,
+        *,
+        build_config: BuildConfiguration,
+        graph_session: GraphSession,
+        options: Options,
+        specs: Specs,
+        union_membership: UnionMembership,
+    ) -> ExitCode:
+        history = StatsHistory(stats_history_path(options.for_global_scope().pants_workdir))
+        # Runs of this goal are not interesting to compare.
+        runs = [run for run in history.runs(goals=self.run_goals) if self.name not in run.goals]
+        if not runs:
+            logger.error(
+                f"No runs were recorded in {history.path}. Set `[stats].record_history = true` "
+                "to record runs."
+            )
+            return PANTS_FAILED_EXIT_CODE
+        if not self.run_goals:
+            latest_goals = runs[-1].goals
+            runs = [run for run in runs if run.goals == latest_goals]
+
+        try:
+            head, head_start = select_runs(runs, self.head, end=len(runs))
+            base, _ = select_runs(runs, self.base, end=head_start)
+        except ValueError as e:
+            logger.error(str(e))
+            return PANTS_FAILED_EXIT_CODE
+        if not head or not base:
+            logger.error(f"Not enough runs were recorded in {history.path} to compare.")
+            return PANTS_FAILED_EXIT_CODE
+
+        head = history.with_metrics(head)
+        base = history.with_metrics(base)
+        regressions = find_regressions(
+            base, head, threshold=self.threshold, min_seconds=self.min_seconds
+        )
+        print(f"Comparing {_describe_runs(head)} to {_describe_runs(base)}.")
+        if not regressions:
+            print("No regressions found.")
+        else:
+            print("Regressions (kind, name, base -> head):")
+            print("\n".join(_describe_regression(regression) for regression in regressions))
+        return PANTS_SUCCEEDED_EXIT_CODE
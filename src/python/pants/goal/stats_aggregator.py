@@ -3,20 +3,22 @@
 
 from __future__ import annotations
 
-import base64
 import datetime
 import json
 import logging
-from collections import Counter
+import math
+import random
+import sqlite3
+import time
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import TypedDict
-
-from hdrh.histogram import HdrHistogram
+from typing import Any, NotRequired, TypedDict
 
+from pants.core.util_rules.system_binaries import GitBinaryException
 from pants.engine.internals.scheduler import Workunit
-from pants.engine.rules import collect_rules, rule
+from pants.engine.rules import collect_rules, implicitly, rule
 from pants.engine.streaming_workunit_handler import (
     StreamingWorkunitContext,
     WorkunitsCallback,
@@ -24,15 +26,29 @@ from pants.engine.streaming_workunit_handler import (
     WorkunitsCallbackFactoryRequest,
 )
 from pants.engine.unions import UnionRule
-from pants.option.option_types import BoolOption, EnumOption, StrOption
+from pants.goal.stats_history import (
+    HISTOGRAM_PERCENTILES,
+    MetricKind,
+    RunStats,
+    StatsHistory,
+    cache_hit_rates,
+    decode_histogram,
+    stats_history_path,
+)
+from pants.option.errors import OptionsError
+from pants.option.global_options import GlobalOptions
+from pants.option.option_types import BoolOption, EnumOption, IntOption, StrOption
 from pants.option.subsystem import Subsystem
 from pants.util.collections import deep_getsizeof
 from pants.util.dirutil import safe_open
+from pants.util.interning import all_interners
 from pants.util.strutil import softwrap
+from pants.vcs.git import GitWorktreeRequest, get_git_worktree
 
 logger = logging.getLogger(__name__)
 
-HISTOGRAM_PERCENTILES = [25, 50, 75, 90, 95, 99]
+# The z-score of a 95% confidence interval.
+_Z_95 = 1.96
 
 
 class CounterObject(TypedDict):
@@ -44,6 +60,15 @@ class MemorySummaryObject(TypedDict):
     name: str
     count: int
     bytes: int
+    # Half the width of the 95% confidence interval of `bytes`, if it was estimated by sampling.
+    bytes_error: NotRequired[int]
+
+
+class InterningObject(TypedDict):
+    name: str
+    freed: int
+    lookups: int
+    freed_rate: float
 
 
 class ObservationHistogramObject(TypedDict):
@@ -61,6 +86,7 @@ class StatsObject(TypedDict, total=False):
     command: str
     counters: list[CounterObject]
     memory_summary: list[MemorySummaryObject]
+    interning: list[InterningObject]
     observation_histograms: list[ObservationHistogramObject]
 
 
@@ -101,6 +127,25 @@ class StatsAggregatorSubsystem(Subsystem):
             Keys are the total size in bytes, the count, and the name. Note that the total size
             is for all instances added together, so you can use total_size // count to get the
             average size.
+
+            Also reports how often interning values (e.g. the values of target fields when
+            parsing BUILD files) freed a duplicate string, i.e. the number of strings freed, the
+            number of lookups, and the fraction of lookups which freed a string.
+            """
+        ),
+        advanced=True,
+    )
+    _memory_summary_sample_size = IntOption(
+        default=None,
+        help=softwrap(
+            """
+            If set, estimate the total size of the live items of each type for
+            `--memory-summary` from a random sample of at most this many of them, rather than by
+            measuring all of them.
+
+            Measuring every live item can take a long time in a `pantsd` process which has
+            memoized many of them. Estimated sizes are reported along with half the width of their
+            95% confidence interval.
             """
         ),
         advanced=True,
@@ -114,6 +159,80 @@ class StatsAggregatorSubsystem(Subsystem):
         default=StatsOutputFormat.text,
         help="Output format for reporting stats.",
     )
+    record_history = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            At the end of the Pants run, record its stats in a local database under
+            `[GLOBAL].pants_workdir`, keyed by the run id, the git commit and the goals of the
+            run.
+
+            The recorded stats are the total time spent in each rule (and other workunits), the
+            counter metrics, the cache hit rates and the percentiles of observation histograms.
+            Use the `perf-diff` goal to compare recorded runs.
+            """
+        ),
+        advanced=True,
+    )
+
+    @property
+    def memory_summary_sample_size(self) -> int | None:
+        sample_size = self._memory_summary_sample_size
+        if sample_size is not None and sample_size < 1:
+            raise OptionsError(
+                f"`[{self.options_scope}].memory_summary_sample_size` must be at least 1, but "
+                f"was {sample_size}."
+            )
+        return sample_size
+
+
+@dataclass(frozen=True)
+class _MemorySummaryEntry:
+    size: int
+    count: int
+    name: str
+    # Half the width of the 95% confidence interval of `size`, if it was estimated by sampling.
+    size_error: int | None = None
+
+
+def _memory_summary(
+    context: StreamingWorkunitContext, sample_size: int | None
+) -> list[_MemorySummaryEntry]:
+    ids: set[int] = set()
+    items_by_type: dict[type, list[Any]] = {}
+    items, rust_sizes = context._scheduler.live_items()
+    for item in items:
+        items_by_type.setdefault(type(item), []).append(item)
+
+    # NB: A fixed seed makes the summaries of identical runs comparable.
+    rng = random.Random(0)
+    entries = []
+    for typ, typ_items in items_by_type.items():
+        name = f"{typ.__module__}.{typ.__qualname__}"
+        count = len(typ_items)
+        if sample_size is None or count <= sample_size:
+            size = sum(deep_getsizeof(item, ids) for item in typ_items)
+            entries.append(_MemorySummaryEntry(size, count, name))
+            continue
+
+        sizes = [deep_getsizeof(item, ids) for item in rng.sample(typ_items, sample_size)]
+        mean = sum(sizes) / sample_size
+        variance = sum((size - mean) ** 2 for size in sizes) / max(sample_size - 1, 1)
+        # The standard error of the estimated total, with the finite population correction.
+        standard_error = count * math.sqrt(
+            variance / sample_size * (count - sample_size) / (count - 1)
+        )
+        entries.append(
+            _MemorySummaryEntry(
+                round(mean * count), count, name, size_error=round(_Z_95 * standard_error)
+            )
+        )
+
+    entries.extend(
+        _MemorySummaryEntry(size, count, f"(native) {name}")
+        for name, (count, size) in rust_sizes.items()
+    )
+    return sorted(entries, key=lambda e: (e.size, e.count, e.name))
 
 
 def _log_or_write_to_file_plain(output_file: str | None, lines: list[str]) -> None:
@@ -151,12 +270,20 @@ class StatsAggregatorCallback(WorkunitsCallback):
         memory: bool,
         output_file: str | None,
         format: StatsOutputFormat,
+        memory_sample_size: int | None = None,
+        history: StatsHistory | None = None,
+        git_commit: str | None = None,
     ) -> None:
         super().__init__()
         self.log = log
         self.memory = memory
         self.output_file = output_file
         self.format = format
+        self.memory_sample_size = memory_sample_size
+        self.history = history
+        self.git_commit = git_commit
+        # The total duration of the completed workunits with each name, if recording history.
+        self.workunit_seconds: defaultdict[str, float] = defaultdict(float)
 
     @property
     def can_finish_async(self) -> bool:
@@ -189,27 +316,26 @@ class StatsAggregatorCallback(WorkunitsCallback):
             output_lines.append(f"Counters:\n{counter_lines}")
 
         if self.memory:
-            ids: set[int] = set()
-            count_by_type: Counter[type] = Counter()
-            sizes_by_type: Counter[type] = Counter()
-
-            items, rust_sizes = context._scheduler.live_items()
-            for item in items:
-                count_by_type[type(item)] += 1
-                sizes_by_type[type(item)] += deep_getsizeof(item, ids)
-
-            entries = [
-                (size, count_by_type[typ], f"{typ.__module__}.{typ.__qualname__}")
-                for typ, size in sizes_by_type.items()
-            ]
-            entries.extend(
-                (size, count, f"(native) {name}") for name, (count, size) in rust_sizes.items()
-            )
             memory_lines = "\n".join(
-                f"  {size}\t\t{count}\t\t{name}" for size, count, name in sorted(entries)
+                f"  {e.size}\t\t{e.count}\t\t{e.name}"
+                if e.size_error is None
+                else f"  {e.size} (±{e.size_error})\t\t{e.count}\t\t{e.name}"
+                for e in _memory_summary(context, self.memory_sample_size)
+            )
+            sampling = (
+                f", sampling at most {self.memory_sample_size} items of each type"
+                if self.memory_sample_size is not None
+                else ""
             )
             output_lines.append(
-                f"Memory summary (total size in bytes, count, name):\n{memory_lines}"
+                f"Memory summary (total size in bytes, count, name){sampling}:\n{memory_lines}"
+            )
+            interning_lines = "\n".join(
+                f"  {i.freed}\t\t{i.lookups}\t\t{i.freed_rate:.3f}\t\t{i.name}"
+                for i in all_interners()
+            )
+            output_lines.append(
+                f"Interning (strings freed, lookups, freed rate, name):\n{interning_lines}"
             )
 
         if not self.log:
@@ -224,10 +350,7 @@ class StatsAggregatorCallback(WorkunitsCallback):
 
         output_lines.append("Observation histogram summaries:")
         for name, encoded_histogram in histograms.items():
-            # Note: The Python library for HDR Histogram will only decode compressed histograms
-            # that are further encoded with base64. See
-            # https://github.com/HdrHistogram/HdrHistogram_py/issues/29.
-            histogram = HdrHistogram.decode(base64.b64encode(encoded_histogram))
+            histogram = decode_histogram(encoded_histogram)
             percentile_to_vals = "\n".join(
                 f"  p{percentile}: {value}"
                 for percentile, value in histogram.get_percentile_to_value_dict(
@@ -268,27 +391,26 @@ class StatsAggregatorCallback(WorkunitsCallback):
             ]
 
         if self.memory:
-            ids: set[int] = set()
-            count_by_type: Counter[type] = Counter()
-            sizes_by_type: Counter[type] = Counter()
-
-            items, rust_sizes = context._scheduler.live_items()
-            for item in items:
-                count_by_type[type(item)] += 1
-                sizes_by_type[type(item)] += deep_getsizeof(item, ids)
-
-            entries = [
-                (size, count_by_type[typ], f"{typ.__module__}.{typ.__qualname__}")
-                for typ, size in sizes_by_type.items()
-            ]
-            entries.extend(
-                (size, count, f"(native) {name}") for name, (count, size) in rust_sizes.items()
-            )
-            memory_lines: list[MemorySummaryObject] = [
-                {"bytes": size, "count": count, "name": name}
-                for size, count, name in sorted(entries)
-            ]
+            memory_lines: list[MemorySummaryObject] = []
+            for e in _memory_summary(context, self.memory_sample_size):
+                memory_line: MemorySummaryObject = {
+                    "bytes": e.size,
+                    "count": e.count,
+                    "name": e.name,
+                }
+                if e.size_error is not None:
+                    memory_line["bytes_error"] = e.size_error
+                memory_lines.append(memory_line)
             stats_object["memory_summary"] = memory_lines
+            stats_object["interning"] = [
+                {
+                    "name": interner.name,
+                    "freed": interner.freed,
+                    "lookups": interner.lookups,
+                    "freed_rate": round(interner.freed_rate, 3),
+                }
+                for interner in all_interners()
+            ]
 
         if not self.log:
             _log_or_write_to_file_json(self.output_file, stats_object)
@@ -302,10 +424,7 @@ class StatsAggregatorCallback(WorkunitsCallback):
 
         observation_histograms: list[ObservationHistogramObject] = []
         for name, encoded_histogram in histograms.items():
-            # Note: The Python library for HDR Histogram will only decode compressed histograms
-            # that are further encoded with base64. See
-            # https://github.com/HdrHistogram/HdrHistogram_py/issues/29.
-            histogram = HdrHistogram.decode(base64.b64encode(encoded_histogram))
+            histogram = decode_histogram(encoded_histogram)
             percentile_to_vals = {
                 f"p{percentile}": value
                 for percentile, value in histogram.get_percentile_to_value_dict(
@@ -328,6 +447,43 @@ class StatsAggregatorCallback(WorkunitsCallback):
 
         _log_or_write_to_file_json(self.output_file, stats_object)
 
+    def _record_history(self, history: StatsHistory, context: StreamingWorkunitContext) -> None:
+        run_tracker = context.run_tracker
+        counters = context.get_metrics()
+
+        metrics: dict[tuple[MetricKind, str], float] = {
+            (MetricKind.workunit_seconds, name): seconds
+            for name, seconds in self.workunit_seconds.items()
+        }
+        for timing in run_tracker.get_cumulative_timings():
+            if timing["timing"] is not None:
+                metrics[(MetricKind.run_seconds, timing["label"])] = timing["timing"]
+        for name, count in counters.items():
+            metrics[(MetricKind.counter, name)] = count
+        for cache, hit_rate in cache_hit_rates(counters).items():
+            metrics[(MetricKind.cache_hit_rate, cache)] = hit_rate
+        histograms = context.get_observation_histograms()["histograms"]
+        for name, encoded_histogram in histograms.items():
+            histogram = decode_histogram(encoded_histogram)
+            for percentile, value in histogram.get_percentile_to_value_dict(
+                HISTOGRAM_PERCENTILES
+            ).items():
+                metrics[(MetricKind.histogram_percentile, f"{name}.p{percentile}")] = value
+
+        try:
+            history.record(
+                RunStats(
+                    run_id=run_tracker.run_id,
+                    timestamp=run_tracker.run_information().get("timestamp", time.time()),
+                    git_commit=self.git_commit,
+                    goals=tuple(run_tracker.goals),
+                    metrics=metrics,
+                    histograms=dict(histograms),
+                )
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to record the stats of this run in {history.path}: {e}")
+
     def __call__(
         self,
         *,
@@ -336,9 +492,21 @@ class StatsAggregatorCallback(WorkunitsCallback):
         finished: bool,
         context: StreamingWorkunitContext,
     ) -> None:
+        if self.history:
+            for workunit in completed_workunits:
+                self.workunit_seconds[workunit["name"]] += (
+                    workunit.get("duration_secs", 0) + workunit.get("duration_nanos", 0) / 1e9
+                )
+
         if not finished:
             return
 
+        if self.history:
+            self._record_history(self.history, context)
+
+        if not (self.log or self.memory):
+            return
+
         if StatsOutputFormat.text == self.format:
             self._output_stats_in_plain_text(context)
         elif StatsOutputFormat.jsonlines == self.format:
@@ -350,10 +518,29 @@ class StatsAggregatorCallbackFactoryRequest:
     """A unique request type that is installed to trigger construction of the WorkunitsCallback."""
 
 
+async def _git_commit() -> str | None:
+    maybe_git_worktree = await get_git_worktree(GitWorktreeRequest(), **implicitly())
+    if not maybe_git_worktree.git_worktree:
+        return None
+    try:
+        return maybe_git_worktree.git_worktree.commit_id
+    except GitBinaryException as e:
+        logger.debug(f"Failed to determine the git commit to record stats for: {e}")
+        return None
+
+
 @rule
 async def construct_callback(
-    _: StatsAggregatorCallbackFactoryRequest, subsystem: StatsAggregatorSubsystem
+    _: StatsAggregatorCallbackFactoryRequest,
+    subsystem: StatsAggregatorSubsystem,
+    global_options: GlobalOptions,
 ) -> WorkunitsCallbackFactory:
+    history = None
+    git_commit = None
+    if subsystem.record_history:
+        history = StatsHistory(stats_history_path(global_options.pants_workdir))
+        git_commit = await _git_commit()
+
     return WorkunitsCallbackFactory(
         lambda: (
             StatsAggregatorCallback(
@@ -361,8 +548,11 @@ async def construct_callback(
                 memory=subsystem.memory_summary,
                 output_file=subsystem.output_file,
                 format=subsystem.format,
+                memory_sample_size=subsystem.memory_summary_sample_size,
+                history=history,
+                git_commit=git_commit,
             )
-            if subsystem.log or subsystem.memory_summary
+            if subsystem.log or subsystem.memory_summary or history
             else None
         )
     )
@@ -39,6 +39,26 @@ def test_memory_summary() -> None:
     result.assert_success()
     assert "Memory summary" in result.stderr
     assert "builtins.UnionMembership" in result.stderr
+    assert "Interning (strings freed, lookups, freed rate, name)" in result.stderr
+    assert "target field values" in result.stderr
+
+
+def test_sampled_memory_summary() -> None:
+    result = run_pants(
+        ["--stats-memory-summary", "--stats-memory-summary-sample-size=10", "--version"]
+    )
+    result.assert_success()
+    assert "sampling at most 10 items of each type" in result.stderr
+    assert "builtins.UnionMembership" in result.stderr
+    assert "(±" in result.stderr
+
+
+def test_invalid_memory_summary_sample_size() -> None:
+    result = run_pants(
+        ["--stats-memory-summary", "--stats-memory-summary-sample-size=0", "--version"]
+    )
+    result.assert_failure()
+    assert "`[stats].memory_summary_sample_size` must be at least 1, but was 0." in result.stderr
 
 
 def test_writing_to_output_file_plain_text() -> None:
@@ -105,6 +125,7 @@ def test_writing_to_output_file_json() -> None:
                 "command",
                 "counters",
                 "memory_summary",
+                "interning",
                 "observation_histograms",
             ):
                 assert obj.get(key) is not None
@@ -114,3 +135,6 @@ def test_writing_to_output_file_json() -> None:
 
             for field in ("bytes", "count", "name"):
                 assert obj["memory_summary"][0].get(field) is not None
+
+            for field in ("name", "freed", "lookups", "freed_rate"):
+                assert obj["interning"][0].get(field) is not None
@@ -0,0 +1,289 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import base64
+import os
+import sqlite3
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+
+from hdrh.histogram import HdrHistogram
+
+HISTOGRAM_PERCENTILES = [25, 50, 75, 90, 95, 99]
+
+
+class MetricKind(Enum):
+    """The kinds of metrics which are recorded for each run."""
+
+    # The total duration in seconds of all workunits with a name, e.g. a rule.
+    workunit_seconds = "workunit_seconds"
+    # The total duration in seconds of the run.
+    run_seconds = "run_seconds"
+    # An engine counter.
+    counter = "counter"
+    # The fraction of cache lookups which hit, computed from the engine counters.
+    cache_hit_rate = "cache_hit_rate"
+    # A percentile of an observation histogram, named `<histogram>.p<percentile>`.
+    histogram_percentile = "histogram_percentile"
+
+
+def stats_history_path(pants_workdir: str) -> str:
+    return os.path.join(pants_workdir, "stats", "history.sqlite")
+
+
+def decode_histogram(encoded_histogram: bytes) -> HdrHistogram:
+    # Note: The Python library for HDR Histogram will only decode compressed histograms
+    # that are further encoded with base64. See
+    # https://github.com/HdrHistogram/HdrHistogram_py/issues/29.
+    return HdrHistogram.decode(base64.b64encode(encoded_histogram))
+
+
+def merge_histograms(encoded_histograms: Iterable[bytes]) -> HdrHistogram:
+    """Merge encoded histograms (e.g. of the same observations in several runs) into one.
+
+    Unlike averaging the percentiles of each histogram, the percentiles of the merged histogram are
+    those of all of the observations.
+    """
+    merged: HdrHistogram | None = None
+    for encoded_histogram in encoded_histograms:
+        histogram = decode_histogram(encoded_histogram)
+        if merged is None:
+            merged = histogram
+        else:
+            merged.add(histogram)
+    if merged is None:
+        raise ValueError("At least one histogram is required.")
+    return merged
+
+
+# The counters from which a cache hit rate is computed, by cache.
+_CACHE_COUNTERS = {
+    "local": ("local_cache_requests_cached", "local_cache_requests"),
+    "remote": ("remote_cache_requests_cached", "remote_cache_requests"),
+}
+
+
+def cache_hit_rates(counters: Mapping[str, int]) -> dict[str, float]:
+    """Compute the hit rate of each cache which was used, from the engine counters."""
+    return {
+        cache: counters.get(cached, 0) / counters[requests]
+        for cache, (cached, requests) in _CACHE_COUNTERS.items()
+        if counters.get(requests)
+    }
+
+
+@dataclass(frozen=True)
+class RunStats:
+    """The stats recorded for a single Pants run."""
+
+    run_id: str
+    timestamp: float
+    git_commit: str | None
+    goals: tuple[str, ...]
+    metrics: Mapping[tuple[MetricKind, str], float] = field(default_factory=dict)
+    # The encoded observation histograms of the run, by name.
+    histograms: Mapping[str, bytes] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Regression:
+    kind: MetricKind
+    name: str
+    base: float
+    head: float
+
+    @property
+    def change(self) -> float:
+        """The change relative to the base value, or the absolute change for rates."""
+        if self.kind == MetricKind.cache_hit_rate:
+            return self.head - self.base
+        return (self.head - self.base) / self.base
+
+
+class StatsHistory:
+    """An append-only store of the stats of Pants runs, in a SQLite database.
+
+    Runs are keyed by run id, and record the git commit and the goals of the run, so that runs can
+    be compared with one another (see the `perf-diff` goal).
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # NB: Concurrent Pants runs may record at the same time, so wait for each other's locks.
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                timestamp REAL NOT NULL,
+                git_commit TEXT,
+                goals TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS metrics (
+                run_id TEXT NOT NULL REFERENCES runs(run_id),
+                kind TEXT NOT NULL,
+                name TEXT NOT NULL,
+                value REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS metrics_by_run_id ON metrics (run_id);
+            CREATE TABLE IF NOT EXISTS histograms (
+                run_id TEXT NOT NULL REFERENCES runs(run_id),
+                name TEXT NOT NULL,
+                encoded BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS histograms_by_run_id ON histograms (run_id);
+            """
+        )
+        return connection
+
+    def record(self, run: RunStats) -> None:
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT INTO runs VALUES (?, ?, ?, ?)",
+                    (run.run_id, run.timestamp, run.git_commit, " ".join(run.goals)),
+                )
+                connection.executemany(
+                    "INSERT INTO metrics VALUES (?, ?, ?, ?)",
+                    (
+                        (run.run_id, kind.value, name, value)
+                        for (kind, name), value in run.metrics.items()
+                    ),
+                )
+                connection.executemany(
+                    "INSERT INTO histograms VALUES (?, ?, ?)",
+                    ((run.run_id, name, encoded) for name, encoded in run.histograms.items()),
+                )
+        finally:
+            connection.close()
+
+    def runs(self, *, goals: Iterable[str] = ()) -> list[RunStats]:
+        """The recorded runs which ran (at least) the given goals, oldest first, without their
+        metrics."""
+        required_goals = set(goals)
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                "SELECT run_id, timestamp, git_commit, goals FROM runs ORDER BY timestamp, run_id"
+            ).fetchall()
+        finally:
+            connection.close()
+        runs = (
+            RunStats(
+                run_id=run_id,
+                timestamp=timestamp,
+                git_commit=git_commit,
+                goals=tuple(run_goals.split()),
+            )
+            for run_id, timestamp, git_commit, run_goals in rows
+        )
+        return [run for run in runs if required_goals.issubset(run.goals)]
+
+    def with_metrics(self, runs: Sequence[RunStats]) -> list[RunStats]:
+        """Load the metrics and histograms of the given runs."""
+        metrics: dict[str, dict[tuple[MetricKind, str], float]] = defaultdict(dict)
+        histograms: dict[str, dict[str, bytes]] = defaultdict(dict)
+        connection = self._connect()
+        try:
+            for run in runs:
+                for kind, name, value in connection.execute(
+                    "SELECT kind, name, value FROM metrics WHERE run_id = ?", (run.run_id,)
+                ):
+                    metrics[run.run_id][(MetricKind(kind), name)] = value
+                for name, encoded in connection.execute(
+                    "SELECT name, encoded FROM histograms WHERE run_id = ?", (run.run_id,)
+                ):
+                    histograms[run.run_id][name] = encoded
+        finally:
+            connection.close()
+        return [
+            RunStats(
+                run_id=run.run_id,
+                timestamp=run.timestamp,
+                git_commit=run.git_commit,
+                goals=run.goals,
+                metrics=metrics[run.run_id],
+                histograms=histograms[run.run_id],
+            )
+            for run in runs
+        ]
+
+
+def _mean_metrics(runs: Sequence[RunStats]) -> dict[tuple[MetricKind, str], float]:
+    values: dict[tuple[MetricKind, str], list[float]] = defaultdict(list)
+    for run in runs:
+        for key, value in run.metrics.items():
+            values[key].append(value)
+    means = {key: sum(vs) / len(vs) for key, vs in values.items()}
+
+    # Where the histograms themselves were recorded, compute their percentiles across all runs.
+    histograms: dict[str, list[bytes]] = defaultdict(list)
+    for run in runs:
+        for name, encoded_histogram in run.histograms.items():
+            histograms[name].append(encoded_histogram)
+    for name, encoded_histograms in histograms.items():
+        percentiles = merge_histograms(encoded_histograms).get_percentile_to_value_dict(
+            HISTOGRAM_PERCENTILES
+        )
+        for percentile, value in percentiles.items():
+            means[(MetricKind.histogram_percentile, f"{name}.p{percentile}")] = value
+    return means
+
+
+def find_regressions(
+    base: Sequence[RunStats],
+    head: Sequence[RunStats],
+    *,
+    threshold: float,
+    min_seconds: float,
+) -> list[Regression]:
+    """Compare the mean of each metric of the `head` runs to that of the `base` runs.
+
+    The percentiles of histograms are computed from the merged histograms of the runs, rather than
+    averaged.
+
+    Durations and histogram percentiles regress if they grow by more than `threshold` (relative to
+    the base), and cache hit rates regress if they drop by more than `threshold`. Durations which
+    are below `min_seconds` in both are ignored, as are counters.
+    """
+    base_metrics = _mean_metrics(base)
+    head_metrics = _mean_metrics(head)
+    regressions = []
+    for key in base_metrics.keys() & head_metrics.keys():
+        kind, name = key
+        regression = Regression(kind, name, base_metrics[key], head_metrics[key])
+        if kind == MetricKind.counter:
+            continue
+        if kind in (MetricKind.workunit_seconds, MetricKind.run_seconds) and (
+            max(regression.base, regression.head) < min_seconds
+        ):
+            continue
+        if kind == MetricKind.cache_hit_rate:
+            if regression.change < -threshold:
+                regressions.append(regression)
+        elif regression.base > 0 and regression.change > threshold:
+            regressions.append(regression)
+    return sorted(regressions, key=lambda r: (r.kind.value, -abs(r.change), r.name))
+
+
+def select_runs(runs: Sequence[RunStats], spec: str, *, end: int) -> tuple[list[RunStats], int]:
+    """Select runs from `runs[:end]` (which are oldest first) by a run id or a count.
+
+    A run id selects that run, and a count `N` selects the latest `N` runs. Returns the selected
+    runs and the index of the first of them, so that an earlier window of runs can be selected.
+    """
+    if spec.isdigit():
+        start = max(0, end - int(spec))
+        return list(runs[start:end]), start
+    for index, run in enumerate(runs[:end]):
+        if run.run_id == spec:
+            return [run], index
+    raise ValueError(f"No run with id `{spec}` was recorded before the compared runs.")
@@ -0,0 +1,141 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import base64
+from pathlib import Path
+
+import pytest
+from hdrh.histogram import HdrHistogram
+
+from pants.goal.stats_history import (
+    MetricKind,
+    Regression,
+    RunStats,
+    StatsHistory,
+    cache_hit_rates,
+    find_regressions,
+    merge_histograms,
+    select_runs,
+)
+
+
+def encoded_histogram(*values: int) -> bytes:
+    histogram = HdrHistogram(1, 1_000_000, 2)
+    for value in values:
+        histogram.record_value(value)
+    # NB: Histograms are recorded as the engine encodes them, i.e. without base64.
+    return base64.b64decode(histogram.encode())
+
+
+def run_stats(
+    run_id: str,
+    timestamp: float = 0.0,
+    goals: tuple[str, ...] = ("test",),
+    **metrics: float,
+) -> RunStats:
+    return RunStats(
+        run_id=run_id,
+        timestamp=timestamp,
+        git_commit=f"commit-{run_id}",
+        goals=goals,
+        metrics={(MetricKind[key], "name"): value for key, value in metrics.items()},
+    )
+
+
+def test_record_and_load(tmp_path: Path) -> None:
+    history = StatsHistory(str(tmp_path / "stats" / "history.sqlite"))
+    history.record(run_stats("b", timestamp=2.0, goals=("lint", "test"), counter=3))
+    history.record(
+        RunStats(
+            run_id="a",
+            timestamp=1.0,
+            git_commit=None,
+            goals=("test",),
+            metrics={(MetricKind.workunit_seconds, "name"): 1.5},
+            histograms={"histogram": encoded_histogram(1, 2)},
+        )
+    )
+
+    runs = history.runs()
+    assert [run.run_id for run in runs] == ["a", "b"]
+    assert runs[1].goals == ("lint", "test")
+    assert runs[1].git_commit == "commit-b"
+    assert not runs[1].metrics
+
+    assert [run.run_id for run in history.runs(goals=["lint"])] == ["b"]
+
+    loaded = history.with_metrics(runs)
+    assert loaded[0].metrics == {(MetricKind.workunit_seconds, "name"): 1.5}
+    assert loaded[0].histograms == {"histogram": encoded_histogram(1, 2)}
+    assert loaded[1].metrics == {(MetricKind.counter, "name"): 3}
+    assert not loaded[1].histograms
+
+
+def test_cache_hit_rates() -> None:
+    assert cache_hit_rates(
+        {"local_cache_requests": 4, "local_cache_requests_cached": 3, "remote_cache_requests": 0}
+    ) == {"local": 0.75}
+
+
+def test_find_regressions() -> None:
+    def regressions(base: list[RunStats], head: list[RunStats]) -> list[Regression]:
+        return find_regressions(base, head, threshold=0.1, min_seconds=0.5)
+
+    assert regressions(
+        [run_stats("a", workunit_seconds=1.0), run_stats("b", workunit_seconds=2.0)],
+        [run_stats("c", workunit_seconds=2.0)],
+    ) == [Regression(MetricKind.workunit_seconds, "name", 1.5, 2.0)]
+    assert not regressions(
+        [run_stats("a", workunit_seconds=1.0)], [run_stats("b", workunit_seconds=1.05)]
+    )
+    # Short durations are ignored.
+    assert not regressions(
+        [run_stats("a", workunit_seconds=0.1)], [run_stats("b", workunit_seconds=0.4)]
+    )
+    assert not regressions([run_stats("a", counter=1)], [run_stats("b", counter=100)])
+
+    assert regressions(
+        [run_stats("a", cache_hit_rate=0.9)], [run_stats("b", cache_hit_rate=0.7)]
+    ) == [Regression(MetricKind.cache_hit_rate, "name", 0.9, 0.7)]
+    assert not regressions(
+        [run_stats("a", cache_hit_rate=0.7)], [run_stats("b", cache_hit_rate=0.9)]
+    )
+
+    assert regressions(
+        [run_stats("a", histogram_percentile=10)], [run_stats("b", histogram_percentile=20)]
+    ) == [Regression(MetricKind.histogram_percentile, "name", 10, 20)]
+
+
+def test_merged_histogram_percentiles() -> None:
+    def run(run_id: str, *values: int) -> RunStats:
+        return RunStats(run_id, 0.0, None, ("test",), histograms={"h": encoded_histogram(*values)})
+
+    base = [run("a", *[10] * 200)]
+    # Two slow observations in one run are the p99 of that run, but not of both runs, whereas the
+    # mean of the p99s of the runs would be a regression.
+    head = [run("b", *[10] * 98, 1000, 1000), run("c", *[10] * 100)]
+
+    assert merge_histograms(r.histograms["h"] for r in head).get_value_at_percentile(99) == 10
+    assert not find_regressions(base, head, threshold=0.1, min_seconds=0.5)
+    assert [
+        (r.kind, r.name) for r in find_regressions(base, head[:1], threshold=0.1, min_seconds=0.5)
+    ] == [(MetricKind.histogram_percentile, "h.p99")]
+
+
+def test_select_runs() -> None:
+    runs = [run_stats(run_id) for run_id in "abcde"]
+
+    head, head_start = select_runs(runs, "2", end=len(runs))
+    assert [run.run_id for run in head] == ["d", "e"]
+    base, _ = select_runs(runs, "5", end=head_start)
+    assert [run.run_id for run in base] == ["a", "b", "c"]
+
+    head, head_start = select_runs(runs, "c", end=len(runs))
+    assert [run.run_id for run in head] == ["c"]
+    base, _ = select_runs(runs, "1", end=head_start)
+    assert [run.run_id for run in base] == ["b"]
+
+    with pytest.raises(ValueError, match="`e`"):
+        select_runs(runs, "e", end=head_start)
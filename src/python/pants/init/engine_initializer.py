@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import dataclasses
 import logging
+import os
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
@@ -32,6 +33,7 @@ from pants.engine.internals import (
     specs_rules,
     synthetic_targets,
 )
+from pants.engine.internals.build_files import BuildFileAnalysisCache
 from pants.engine.internals.native_engine import PyExecutor, PySessionCancellationLatch
 from pants.engine.internals.parser import Parser
 from pants.engine.internals.scheduler import Scheduler, SchedulerSession
@@ -273,6 +275,14 @@ class EngineInitializer:
                 ignore_unrecognized_symbols=is_bootstrap,
             )
 
+        build_file_analysis_cache = BuildFileAnalysisCache(
+            os.path.join(local_store_options.store_dir, "build_file_analysis")
+        )
+
+        @rule
+        async def build_file_analysis_cache_singleton() -> BuildFileAnalysisCache:
+            return build_file_analysis_cache
+
         @rule
         async def bootstrap_status() -> BootstrapStatus:
             return BootstrapStatus(is_bootstrap)
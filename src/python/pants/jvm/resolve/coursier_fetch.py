@@ -12,6 +12,7 @@ import os
 from collections import defaultdict
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from functools import cached_property
 from itertools import chain
 from typing import TYPE_CHECKING, Any
 
@@ -29,6 +30,7 @@ from pants.engine.fs import (
     DigestSubset,
     FileContent,
     FileDigest,
+    FileEntry,
     MergeDigests,
     PathGlobs,
     RemovePrefix,
@@ -41,6 +43,7 @@ from pants.engine.intrinsics import (
     digest_subset_to_digest,
     digest_to_snapshot,
     get_digest_contents,
+    get_digest_entries,
     merge_digests,
     path_globs_to_digest,
     remove_prefix,
@@ -62,7 +65,7 @@ from pants.jvm.resolve.common import (
     GatherJvmCoordinatesRequest,
 )
 from pants.jvm.resolve.coordinate import Coordinate, Coordinates
-from pants.jvm.resolve.coursier_setup import Coursier, CoursierFetchProcess
+from pants.jvm.resolve.coursier_setup import Coursier, CoursierFetchProcess, CoursierSubsystem
 from pants.jvm.resolve.jvm_tool import gather_coordinates_for_jvm_lockfile
 from pants.jvm.resolve.key import CoursierResolveKey
 from pants.jvm.resolve.lockfile_metadata import JVMLockfileMetadata, LockfileContext
@@ -74,7 +77,9 @@ from pants.jvm.target_types import (
     JvmResolveField,
 )
 from pants.jvm.util_rules import ExtractFileDigest, digest_to_file_digest
+from pants.util.collections import partition_sequentially
 from pants.util.docutil import bin_name, doc_url
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet, OrderedSet
 from pants.util.strutil import bullet_list, pluralize
@@ -211,6 +216,26 @@ class CoursierResolvedLockfile:
     entries: tuple[CoursierLockfileEntry, ...]
     metadata: JVMLockfileMetadata | None = None
 
+    def __hash__(self) -> int:
+        return self._hash
+
+    @cached_property
+    def _hash(self) -> int:
+        # NB: Lockfiles are used as rule parameters, so their (potentially thousands of) entries
+        # are only hashed once.
+        return hash((self.entries, self.metadata))
+
+    @cached_property
+    def _entries_by_key(self) -> dict[tuple[str, str, str | None], CoursierLockfileEntry]:
+        """The entries by coordinate, without their versions (which are unique in a lockfile)."""
+        return {(i.coord.group, i.coord.artifact, i.coord.classifier): i for i in self.entries}
+
+    def _entry(self, key: CoursierResolveKey, coord: Coordinate) -> CoursierLockfileEntry:
+        entry = self._entries_by_key.get((coord.group, coord.artifact, coord.classifier))
+        if entry is None:
+            raise self._coordinate_not_found(key, coord)
+        return entry
+
     @classmethod
     def _coordinate_not_found(cls, key: CoursierResolveKey, coord: Coordinate) -> CoursierError:
         # TODO: After fixing https://github.com/pantsbuild/pants/issues/13496, coordinate matches
@@ -225,11 +250,8 @@ class CoursierResolvedLockfile:
         self, key: CoursierResolveKey, coord: Coordinate
     ) -> tuple[CoursierLockfileEntry, tuple[CoursierLockfileEntry, ...]]:
         """Return the entry for the given Coordinate, and for its direct dependencies."""
-        entries = {(i.coord.group, i.coord.artifact, i.coord.classifier): i for i in self.entries}
-        entry = entries.get((coord.group, coord.artifact, coord.classifier))
-        if entry is None:
-            raise self._coordinate_not_found(key, coord)
-
+        entries = self._entries_by_key
+        entry = self._entry(key, coord)
         return (
             entry,
             tuple(entries[(i.group, i.artifact, i.classifier)] for i in entry.direct_dependencies),
@@ -238,12 +260,13 @@ class CoursierResolvedLockfile:
     def dependencies(
         self, key: CoursierResolveKey, coord: Coordinate
     ) -> tuple[CoursierLockfileEntry, tuple[CoursierLockfileEntry, ...]]:
-        """Return the entry for the given Coordinate, and for its transitive dependencies."""
-        entries = {(i.coord.group, i.coord.artifact, i.coord.classifier): i for i in self.entries}
-        entry = entries.get((coord.group, coord.artifact, coord.classifier))
-        if entry is None:
-            raise self._coordinate_not_found(key, coord)
+        """Return the entry for the given Coordinate, and for its transitive dependencies.
 
+        The transitive dependencies of each entry were recorded by Coursier when the lockfile was
+        generated, so this is proportional to their number, rather than to the size of the lockfile.
+        """
+        entries = self._entries_by_key
+        entry = self._entry(key, coord)
         return (
             entry,
             tuple(
@@ -548,20 +571,31 @@ class ResolvedClasspathEntries(Collection[ClasspathEntry]):
     """A collection of resolved classpath entries."""
 
 
+async def _artifact_requirement_for_entry(entry: CoursierLockfileEntry) -> ArtifactRequirement:
+    """Prepare any URL- or JAR-specifying entries for use with Coursier."""
+    if entry.pants_address:
+        targets = await resolve_targets(
+            **implicitly(
+                UnparsedAddressInputs(
+                    [entry.pants_address],
+                    owning_address=None,
+                    description_of_origin="<infallible - coursier fetch>",
+                )
+            )
+        )
+        return ArtifactRequirement(entry.coord, jar=targets[0][JvmArtifactJarSourceField])
+    return ArtifactRequirement(entry.coord, url=entry.remote_url)
+
+
 @rule
 async def coursier_fetch_one_coord(
     request: CoursierLockfileEntry,
 ) -> ClasspathEntry:
     """Run `coursier fetch --intransitive` to fetch a single artifact.
 
-    This rule exists to permit efficient subsetting of a "global" classpath
-    in the form of a lockfile.  Callers can determine what subset of dependencies
-    from the lockfile are needed for a given target, then request those
-    lockfile entries individually.
-
-    By fetching only one entry at a time, we maximize our cache efficiency.  If instead
-    we fetched the entire subset that the caller wanted, there would be a different cache
-    key for every possible subset.
+    The entries of a lockfile are fetched in stable batches by `coursier_fetch_batch` (see
+    `[coursier].fetch_batch_size`), which only uses this rule for batches of a single entry. It
+    is also used directly to fetch individual artifacts outside of a lockfile, e.g. nailgun.
 
     This rule also guarantees exact reproducibility.  If all caches have been
     removed, `coursier fetch` will re-download the artifact, and this rule will
@@ -569,22 +603,7 @@ async def coursier_fetch_one_coord(
     was specified in the lockfile (what Coursier originally downloaded).
     """
 
-    # Prepare any URL- or JAR-specifying entries for use with Coursier
-    req: ArtifactRequirement
-    if request.pants_address:
-        targets = await resolve_targets(
-            **implicitly(
-                UnparsedAddressInputs(
-                    [request.pants_address],
-                    owning_address=None,
-                    description_of_origin="<infallible - coursier fetch>",
-                )
-            )
-        )
-        req = ArtifactRequirement(request.coord, jar=targets[0][JvmArtifactJarSourceField])
-    else:
-        req = ArtifactRequirement(request.coord, url=request.remote_url)
-
+    req = await _artifact_requirement_for_entry(request)
     coursier_resolve_info = await prepare_coursier_resolve_info(ArtifactRequirements([req]))
 
     coursier_report_file_name = "coursier_report.json"
@@ -642,9 +661,134 @@ async def coursier_fetch_one_coord(
     return ClasspathEntry(digest=stripped_digest, filenames=(classpath_dest_name,))
 
 
+@dataclass(frozen=True)
+class CoursierFetchBatches:
+    """The entries of a lockfile, stably partitioned into batches which are each fetched by a
+    single Coursier process."""
+
+    batch_by_coord: FrozenDict[Coordinate, tuple[CoursierLockfileEntry, ...]]
+
+    def batch_for(self, entry: CoursierLockfileEntry) -> tuple[CoursierLockfileEntry, ...]:
+        batch = self.batch_by_coord.get(entry.coord)
+        return batch if batch is not None and entry in batch else (entry,)
+
+
+@rule
+async def partition_coursier_lockfile_for_fetch(
+    lockfile: CoursierResolvedLockfile, coursier: CoursierSubsystem
+) -> CoursierFetchBatches:
+    if coursier.fetch_batch_size <= 1:
+        return CoursierFetchBatches(FrozenDict())
+    batch_by_coord = {}
+    for batch in partition_sequentially(
+        lockfile.entries,
+        key=lambda entry: entry.coord.to_coord_str(),
+        size_target=coursier.fetch_batch_size,
+        size_max=4 * coursier.fetch_batch_size,
+    ):
+        for entry in batch:
+            batch_by_coord[entry.coord] = tuple(batch)
+    return CoursierFetchBatches(FrozenDict(batch_by_coord))
+
+
+@dataclass(frozen=True)
+class CoursierFetchBatchRequest:
+    entries: tuple[CoursierLockfileEntry, ...]
+
+
+@rule
+async def coursier_fetch_batch(request: CoursierFetchBatchRequest) -> ResolvedClasspathEntries:
+    """Run `coursier fetch --intransitive` to fetch several artifacts in a single process.
+
+    The fetched artifacts are checked against the digests in their lockfile entries, as in
+    `coursier_fetch_one_coord`, which is used for batches of a single entry.
+    """
+    if len(request.entries) == 1:
+        return ResolvedClasspathEntries([await coursier_fetch_one_coord(request.entries[0])])
+
+    reqs = await concurrently(_artifact_requirement_for_entry(entry) for entry in request.entries)
+    coursier_resolve_info = await prepare_coursier_resolve_info(ArtifactRequirements(reqs))
+
+    coursier_report_file_name = "coursier_report.json"
+    process_result = await fallible_to_exec_result_or_raise(
+        **implicitly(
+            CoursierFetchProcess(
+                args=(
+                    coursier_report_file_name,
+                    "--intransitive",
+                    *coursier_resolve_info.argv,
+                ),
+                input_digest=coursier_resolve_info.digest,
+                output_directories=("classpath",),
+                output_files=(coursier_report_file_name,),
+                description=(
+                    f"Fetching with coursier: {pluralize(len(request.entries), 'artifact')}"
+                ),
+            )
+        )
+    )
+    report_digest = await digest_subset_to_digest(
+        DigestSubset(process_result.output_digest, PathGlobs([coursier_report_file_name]))
+    )
+    report_contents, output_entries = await concurrently(
+        get_digest_contents(report_digest), get_digest_entries(process_result.output_digest)
+    )
+    report = json.loads(report_contents[0].content)
+    report_deps_by_coord = {
+        Coordinate.from_coord_str(dep["coord"]): dep for dep in report["dependencies"]
+    }
+    file_entries = {entry.path: entry for entry in output_entries if isinstance(entry, FileEntry)}
+
+    classpath_file_entries = []
+    for entry in request.entries:
+        dep = report_deps_by_coord.get(entry.coord)
+        if dep is None:
+            raise CoursierError(
+                f'Coursier fetch report has no artifact for coord "{entry.coord.to_coord_str()}".'
+            )
+        classpath_dest_name = classpath_dest_filename(dep["coord"], dep["file"])
+        file_entry = file_entries.get(f"classpath/{classpath_dest_name}")
+        file_digest = file_entry.file_digest if file_entry else None
+        if file_digest != entry.file_digest:
+            raise CoursierError(
+                f"Coursier fetch for '{entry.coord}' succeeded, but fetched artifact {file_digest} "
+                f"did not match the expected artifact: {entry.file_digest}."
+            )
+        assert file_entry is not None
+        classpath_file_entries.append(dataclasses.replace(file_entry, path=classpath_dest_name))
+
+    # The artifacts are already in the store, so each one can be split out by its digest.
+    digests = await concurrently(
+        create_digest(CreateDigest([file_entry])) for file_entry in classpath_file_entries
+    )
+    return ResolvedClasspathEntries(
+        ClasspathEntry(digest=digest, filenames=(file_entry.path,))
+        for digest, file_entry in zip(digests, classpath_file_entries)
+    )
+
+
+async def _fetch_lockfile_entries(
+    lockfile: CoursierResolvedLockfile, entries: Iterable[CoursierLockfileEntry]
+) -> tuple[ClasspathEntry, ...]:
+    """Fetch the given entries of the lockfile, along with the other entries of their batches."""
+    batches = await partition_coursier_lockfile_for_fetch(lockfile, **implicitly())
+    entries = tuple(entries)
+    entry_batches = FrozenOrderedSet(batches.batch_for(entry) for entry in entries)
+    fetched_batches = await concurrently(
+        coursier_fetch_batch(CoursierFetchBatchRequest(batch)) for batch in entry_batches
+    )
+    classpath_entries = {
+        entry: classpath_entry
+        for batch, fetched_batch in zip(entry_batches, fetched_batches)
+        for entry, classpath_entry in zip(batch, fetched_batch)
+    }
+    return tuple(classpath_entries[entry] for entry in entries)
+
+
 @rule(desc="Fetch with coursier")
 async def fetch_with_coursier(request: CoursierFetchRequest) -> FallibleClasspathEntry:
-    # TODO: Loading this per JvmArtifact.
+    # NB: The lockfile (along with its index of entries) is memoized per resolve, so it is only
+    # loaded once for all of the JvmArtifacts of the resolve.
     lockfile = await get_coursier_lockfile_for_resolve(request.resolve)
 
     requirement = ArtifactRequirement.from_jvm_artifact_target(request.component.representative)
@@ -667,9 +811,7 @@ async def fetch_with_coursier(request: CoursierFetchRequest) -> FallibleClasspat
         requirement.coordinate,
     )
 
-    classpath_entries = await concurrently(
-        coursier_fetch_one_coord(entry) for entry in (root_entry, *transitive_entries)
-    )
+    classpath_entries = await _fetch_lockfile_entries(lockfile, (root_entry, *transitive_entries))
     exported_digest = await merge_digests(MergeDigests(cpe.digest for cpe in classpath_entries))
 
     return FallibleClasspathEntry(
@@ -683,9 +825,7 @@ async def fetch_with_coursier(request: CoursierFetchRequest) -> FallibleClasspat
 @rule(level=LogLevel.DEBUG)
 async def coursier_fetch_lockfile(lockfile: CoursierResolvedLockfile) -> ResolvedClasspathEntries:
     """Fetch every artifact in a lockfile."""
-    classpath_entries = await concurrently(
-        coursier_fetch_one_coord(entry) for entry in lockfile.entries
-    )
+    classpath_entries = await _fetch_lockfile_entries(lockfile, lockfile.entries)
     return ResolvedClasspathEntries(classpath_entries)
 
 
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import textwrap
 
 import pytest
@@ -16,7 +17,12 @@ from pants.engine.target import Targets
 from pants.jvm.compile import ClasspathEntry
 from pants.jvm.resolve.common import ArtifactRequirement, ArtifactRequirements
 from pants.jvm.resolve.coordinate import Coordinate, Coordinates
-from pants.jvm.resolve.coursier_fetch import CoursierLockfileEntry, CoursierResolvedLockfile
+from pants.jvm.resolve.coursier_fetch import (
+    CoursierFetchBatchRequest,
+    CoursierLockfileEntry,
+    CoursierResolvedLockfile,
+    ResolvedClasspathEntries,
+)
 from pants.jvm.resolve.coursier_fetch import rules as coursier_fetch_rules
 from pants.jvm.resolve.key import CoursierResolveKey
 from pants.jvm.target_types import (
@@ -47,6 +53,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(Targets, [RawSpecs]),
             QueryRule(CoursierResolvedLockfile, (ArtifactRequirements,)),
             QueryRule(ClasspathEntry, (CoursierLockfileEntry,)),
+            QueryRule(ResolvedClasspathEntries, (CoursierFetchBatchRequest,)),
             QueryRule(FileDigest, (ExtractFileDigest,)),
         ],
         target_types=[JvmArtifactTarget],
@@ -501,6 +508,37 @@ def test_fetch_one_coord_with_classifier(rule_runner: RuleRunner) -> None:
     assert classpath_entry.filenames == ("org.apache.avro_trevni-avro_jar_tests_1.11.0.jar",)
 
 
+@maybe_skip_jdk_test
+def test_fetch_batch(rule_runner: RuleRunner) -> None:
+    junit_coord = Coordinate(group="junit", artifact="junit", version="4.13.2")
+    resolved_lockfile = rule_runner.request(
+        CoursierResolvedLockfile,
+        [ArtifactRequirements.from_coordinates([junit_coord])],
+    )
+    assert len(resolved_lockfile.entries) == 2
+
+    classpath_entries = rule_runner.request(
+        ResolvedClasspathEntries, [CoursierFetchBatchRequest(resolved_lockfile.entries)]
+    )
+    # Each entry of the batch is split out, and is identical to fetching it on its own.
+    assert list(classpath_entries) == [
+        rule_runner.request(ClasspathEntry, [entry]) for entry in resolved_lockfile.entries
+    ]
+
+    bad_entry = dataclasses.replace(
+        resolved_lockfile.entries[0],
+        file_digest=FileDigest(
+            fingerprint="66fdef91e9739348df7a096aa384a5685f4e875584cce89386a7a47251c4d8e9",
+            serialized_bytes_length=1,
+        ),
+    )
+    with pytest.raises(ExecutionError, match="did not match the expected artifact"):
+        rule_runner.request(
+            ResolvedClasspathEntries,
+            [CoursierFetchBatchRequest((bad_entry, resolved_lockfile.entries[1]))],
+        )
+
+
 @maybe_skip_jdk_test
 def test_fetch_one_coord_with_bad_fingerprint(rule_runner: RuleRunner) -> None:
     expected_exception_msg = (
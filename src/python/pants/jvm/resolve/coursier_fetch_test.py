@@ -11,8 +11,14 @@ from pants.backend.java.target_types import JavaSourcesGeneratorTarget
 from pants.backend.java.target_types import rules as target_types_rules
 from pants.core.util_rules import config_files, source_files
 from pants.engine.addresses import Address, Addresses
-from pants.jvm.resolve.coordinate import Coordinate
-from pants.jvm.resolve.coursier_fetch import NoCompatibleResolve
+from pants.engine.fs import EMPTY_DIGEST, FileDigest
+from pants.jvm.resolve.coordinate import Coordinate, Coordinates
+from pants.jvm.resolve.coursier_fetch import (
+    CoursierError,
+    CoursierLockfileEntry,
+    CoursierResolvedLockfile,
+    NoCompatibleResolve,
+)
 from pants.jvm.resolve.coursier_fetch import rules as coursier_fetch_rules
 from pants.jvm.resolve.key import CoursierResolveKey
 from pants.jvm.target_types import DeployJarTarget, JvmArtifactTarget
@@ -124,3 +130,33 @@ def test_no_matching_for_leaf(rule_runner: RuleRunner) -> None:
 )
 def test_from_coord_str(coord_str: str, expected: Coordinate) -> None:
     assert Coordinate.from_coord_str(coord_str) == expected
+
+
+def test_lockfile_dependencies() -> None:
+    def entry(coord: Coordinate, *deps: Coordinate, direct_deps: int = 0) -> CoursierLockfileEntry:
+        return CoursierLockfileEntry(
+            coord=coord,
+            file_name=f"{coord.artifact}.jar",
+            direct_dependencies=Coordinates(deps[:direct_deps]),
+            dependencies=Coordinates(deps),
+            file_digest=FileDigest("0" * 64, 1),
+        )
+
+    a, b, c = (Coordinate("ex", name, "1.0") for name in "abc")
+    pom = Coordinate("ex", "parent", "1.0", classifier="pom")
+    lockfile = CoursierResolvedLockfile(
+        entries=(entry(a, b, c, pom, direct_deps=1), entry(b, c, direct_deps=1), entry(c))
+    )
+    key = CoursierResolveKey("example", "path", EMPTY_DIGEST)
+
+    root, deps = lockfile.dependencies(key, a)
+    assert root.coord == a
+    assert [d.coord for d in deps] == [b, c]
+    # Versions are not compared, since each coordinate appears once in a lockfile.
+    root, deps = lockfile.direct_dependencies(key, Coordinate("ex", "b", "2.0"))
+    assert root.coord == b
+    assert [d.coord for d in deps] == [c]
+
+    with pytest.raises(CoursierError, match="not present in resolve `example`"):
+        lockfile.dependencies(key, Coordinate("ex", "d", "1.0"))
+    assert hash(lockfile) == hash(CoursierResolvedLockfile(entries=lockfile.entries))
@@ -26,7 +26,7 @@ from pants.engine.platform import Platform
 from pants.engine.process import Process
 from pants.engine.rules import collect_rules, concurrently, rule
 from pants.engine.unions import UnionRule
-from pants.option.option_types import StrListOption, StrOption
+from pants.option.option_types import IntOption, StrListOption, StrOption
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.memo import memoized_property
@@ -176,6 +176,26 @@ class CoursierSubsystem(TemplatedExternalTool):
         ),
     )
 
+    fetch_batch_size = IntOption(
+        default=64,
+        advanced=True,
+        help=softwrap(
+            """
+            The target number of lockfile entries to fetch in a single Coursier process.
+
+            Fetching entries in batches avoids starting a JVM for each artifact. The entries of
+            each lockfile are partitioned into batches stably, so that adding or removing an
+            entry only changes the batch that it is in. Set to 1 to fetch each entry in its own
+            process.
+
+            Whole batches are always fetched, even when only some of their entries are needed,
+            e.g. when compiling against a single `jvm_artifact`, which fetches the batches of
+            each of its transitive dependencies. So larger batches may download more artifacts
+            than are needed, although each batch is cached, so it is only fetched once.
+            """
+        ),
+    )
+
     def generate_exe(self, plat: Platform) -> str:
         tool_version = self.known_version(plat)
         url = (tool_version and tool_version.url_override) or self.generate_url(plat)
@@ -56,6 +56,17 @@ class KeepSandboxes(Enum):
     never = "never"
 
 
+class StreamingWorkunitsOverflowPolicy(Enum):
+    """What to do when a streaming workunits callback falls behind.
+
+    See the global option `streaming_workunits_overflow_policy`.
+    """
+
+    block = "block"
+    coalesce = "coalesce"
+    drop = "drop"
+
+
 # N.B. By subclassing BootstrapOptions, we inherit all of those options and are also able to extend
 # it with non-bootstrap options too.
 class GlobalOptions(BootstrapOptions, Subsystem):
@@ -212,6 +223,36 @@ class GlobalOptions(BootstrapOptions, Subsystem):
         advanced=True,
     )
 
+    streaming_workunits_queue_size = IntOption(
+        default=64,
+        help=softwrap(
+            """
+            The maximum number of polled batches of workunits which may be waiting for each
+            streaming workunit event receiver.
+
+            Each receiver is called on its own thread, so that a slow receiver does not delay the
+            others. See `--streaming-workunits-overflow-policy` for what happens when a receiver
+            falls this far behind.
+            """
+        ),
+        advanced=True,
+    )
+    streaming_workunits_overflow_policy = EnumOption(
+        default=StreamingWorkunitsOverflowPolicy.block,
+        help=softwrap(
+            """
+            What to do with a polled batch of workunits when a streaming workunit event receiver
+            already has `--streaming-workunits-queue-size` batches waiting for it.
+
+            `block` waits for the receiver to catch up, which delays polling for all receivers.
+            `coalesce` merges the batch into the last waiting batch, so that the receiver is
+            called fewer times with more workunits. `drop` discards the batch for that receiver.
+            The final batch of a run is never dropped.
+            """
+        ),
+        advanced=True,
+    )
+
     process_cleanup = BoolOption(
         # Should be aligned to `keep_sandboxes`'s `default`
         default=True,
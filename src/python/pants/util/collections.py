@@ -151,3 +151,46 @@ def partition_sequentially(
             yield emit_batch()
     if batch:
         yield emit_batch()
+
+
+def partition_sequentially_by_weight(
+    items: Iterable[_T],
+    *,
+    key: Callable[[_T], str],
+    weight: Callable[[_T], float],
+    weight_target: float,
+    size_max: int | None = None,
+) -> Iterator[list[_T]]:
+    """Stably partitions the given items into batches of around `weight_target` total weight.
+
+    Like `partition_sequentially`, but an item's chance of ending a batch is proportional to its
+    weight, so that heavy items end up in batches with fewer other items. Batches are capped to
+    `2 * weight_target` total weight, and optionally to `size_max` items.
+    """
+
+    # As in `partition_sequentially`, a batch ends at an item whose hash has at least
+    # `log2(weight_target / weight)` zero prefix bits, which happens with probability
+    # `weight / weight_target`. Because the number of zero bits is an integer, the boundaries only
+    # move when an item's weight crosses a power of two, which keeps batches stable in the face
+    # of small fluctuations in weights (e.g. in the runtime of a test).
+    batch: list[_T] = []
+    batch_weight = 0.0
+
+    keyed_items = sorted(((key(item), item) for item in items), key=lambda keyed: keyed[0])
+    for item_key, item in keyed_items:
+        batch.append(item)
+        item_weight = weight(item)
+        batch_weight += item_weight
+        zero_prefix_threshold = (
+            math.log(max(1.0, weight_target / item_weight), 2) if item_weight > 0 else math.inf
+        )
+        if (
+            native_engine.hash_prefix_zero_bits(item_key) >= zero_prefix_threshold
+            or batch_weight >= 2 * weight_target
+            or (size_max and len(batch) >= size_max)
+        ):
+            yield batch
+            batch = []
+            batch_weight = 0.0
+    if batch:
+        yield batch
@@ -13,6 +13,7 @@ from pants.util.collections import (
     ensure_list,
     ensure_str_list,
     partition_sequentially,
+    partition_sequentially_by_weight,
     recursively_update,
 )
 
@@ -107,3 +108,20 @@ def test_partition_sequentially(size_target: int) -> None:
     for to_add in [item for i, item in enumerate(all_items) if i % 2 == 1]:
         updated_partitions = partitioned_buckets([to_add, *base_items])
         assert 1 <= len(base_partitions ^ updated_partitions) <= 4
+
+
+def test_partition_sequentially_by_weight() -> None:
+    items = sorted(f"item{i}" for i in range(0, 1024))
+    heavy = set(items[::64])
+
+    def weight(item: str) -> float:
+        return 100.0 if item in heavy else 1.0
+
+    batches = list(
+        partition_sequentially_by_weight(items, key=str, weight=weight, weight_target=32)
+    )
+    assert [item for batch in batches for item in batch] == items
+    # A heavy item always ends its batch, and batches are capped to twice the target weight.
+    for batch in batches:
+        assert not heavy.intersection(batch[:-1])
+        assert sum(weight(item) for item in batch[:-1]) < 64
@@ -0,0 +1,53 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+
+class StringInterner:
+    """Interns strings using `sys.intern`, and counts how often that frees a duplicate string.
+
+    Unlike an explicit intern table, `sys.intern` does not keep strings alive once they are no
+    longer referenced, so a long-lived process (i.e. pantsd) does not accumulate the strings of
+    values which have since been edited. For the same reason, a lookup of a string object which
+    is itself already interned cannot be told apart from the first lookup of a string, so only
+    lookups which freed a distinct, equal string object are counted.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.lookups = 0
+        self.freed = 0
+
+    def intern(self, value: str) -> str:
+        interned = sys.intern(value)
+        self.lookups += 1
+        if interned is not value:
+            # An equal string was already interned, and `value` can be freed.
+            self.freed += 1
+        return interned
+
+    def intern_values(self, value: Any) -> Any:
+        """Intern a string, or the strings in a list or tuple, leaving other values unchanged."""
+        if type(value) is str:
+            return self.intern(value)
+        if type(value) in (list, tuple) and all(type(v) is str for v in value):
+            return type(value)(self.intern(v) for v in value)
+        return value
+
+    @property
+    def freed_rate(self) -> float:
+        return self.freed / self.lookups if self.lookups else 0.0
+
+
+# Interns the strings in the raw values of target fields when BUILD files are parsed, which are very
+# often repeated between targets (e.g. dependencies, tags, resolves, and interpreter constraints).
+FIELD_VALUES = StringInterner("target field values")
+
+
+def all_interners() -> tuple[StringInterner, ...]:
+    """The interners which are reported on by `[stats].memory_summary`."""
+    return (FIELD_VALUES,)
@@ -0,0 +1,31 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from pants.util.interning import StringInterner, all_interners
+
+
+def test_string_interner() -> None:
+    interner = StringInterner("test")
+    assert interner not in all_interners()
+    assert interner.freed_rate == 0.0
+
+    # Build equal strings at runtime, so that they are distinct objects.
+    first = "".join(["//src/python", ":lib"])
+    second = "".join(["//src/python", ":lib"])
+    assert first is not second
+
+    interned_first = interner.intern(first)
+    interned_second = interner.intern(second)
+    assert interned_first is interned_second
+    assert interner.lookups == 2
+    assert interner.freed >= 1
+
+    values = interner.intern_values(["".join(["a", "b"]), "".join(["a", "b"])])
+    assert isinstance(values, list)
+    assert values[0] is values[1]
+    assert interner.intern_values(("x",)) == ("x",)
+    assert interner.intern_values(None) is None
+    assert interner.intern_values(["x", 1]) == ["x", 1]
+    assert interner.lookups == 5